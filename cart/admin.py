@@ -1,12 +1,87 @@
+from decimal import Decimal
+from typing import cast
+
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.forms.models import BaseInlineFormSet
+from django.http import HttpRequest
+from django.utils.functional import cached_property
+
+from .loaders import prefetch_products
+from .models import Cart, CartQuerySet, Item
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that trusts the planner's row estimate on large tables.
+
+    ``COUNT(*)`` over tens of millions of carts can outlast the request.
+    For an unfiltered queryset on PostgreSQL (``pg_class.reltuples``) or
+    MySQL (``information_schema.tables.table_rows``) the statistics
+    estimate is used once it exceeds :attr:`exact_count_threshold`;
+    filtered querysets, small tables and other backends are counted
+    exactly.
+    """
+
+    exact_count_threshold = 100_000
+
+    @cached_property
+    def count(self) -> int:
+        estimate = self._estimate()
+        if estimate is not None and estimate > self.exact_count_threshold:
+            return estimate
+        return super().count
 
-from .models import Cart, Item
+    def _estimate(self) -> int | None:
+        qs = self.object_list
+        if not isinstance(qs, QuerySet) or qs.query.where or qs.query.distinct:
+            return None
+        connection = connections[qs.db]
+        table = qs.model._meta.db_table
+        if connection.vendor == "postgresql":
+            sql = "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass"
+        elif connection.vendor == "mysql":
+            sql = (
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s"
+            )
+        else:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+        # ``reltuples`` is -1 for a table that was never analyzed.
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+
+class ItemInlineFormSet(BaseInlineFormSet):
+    def get_queryset(self) -> QuerySet[Item]:
+        if not hasattr(self, "_queryset"):
+            # Evaluate once and attach every product with one query per
+            # product model; the forms index into this same result cache.
+            qs = super().get_queryset()
+            prefetch_products(qs)
+            self._queryset = qs
+        return self._queryset
 
 
 class ItemInline(admin.TabularInline):
     model = Item
+    formset = ItemInlineFormSet
     extra = 0
-    readonly_fields = ("content_type", "object_id", "unit_price", "quantity")
+    readonly_fields = ("product", "content_type", "object_id", "unit_price", "quantity")
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Item]:
+        return super().get_queryset(request).select_related("content_type")
+
+    @admin.display(description="Product")
+    def product(self, obj: Item) -> object:
+        # Attached by ItemInlineFormSet; left unset when the product row
+        # (or its model) is gone.
+        return getattr(obj, "_product_cache", "—")
 
     @admin.display(description="Total")
     def total_price(self, obj: Item) -> object:
@@ -15,14 +90,37 @@ class ItemInline(admin.TabularInline):
 
 @admin.register(Cart)
 class CartAdmin(admin.ModelAdmin):
-    list_display = ("id", "creation_date", "checked_out", "item_count")
+    list_display = (
+        "id",
+        "creation_date",
+        "checked_out",
+        "item_count",
+        "unit_count",
+        "subtotal",
+    )
     list_filter = ("checked_out",)
     # ``=id`` is an exact-match lookup — integer PKs don't work with the
     # default ``icontains`` prefix. Lets admins paste a cart id into
     # the changelist search box and land on just that cart.
     search_fields = ("=id",)
     inlines = [ItemInline]
+    # No second, unfiltered ``COUNT(*)`` for the "N total" link.
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
-    @admin.display(description="Items")
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Cart]:
+        # Totals come from ``with_totals()`` annotations, so the page is
+        # one query rather than one aggregate per row.
+        return cast(CartQuerySet, super().get_queryset(request)).with_totals()
+
+    @admin.display(description="Items", ordering="annotated_line_count")
     def item_count(self, obj: Cart) -> int:
-        return obj.items.count()
+        return obj.annotated_line_count  # type: ignore[attr-defined]
+
+    @admin.display(description="Units", ordering="annotated_unit_count")
+    def unit_count(self, obj: Cart) -> int:
+        return obj.annotated_unit_count  # type: ignore[attr-defined]
+
+    @admin.display(description="Subtotal", ordering="annotated_subtotal")
+    def subtotal(self, obj: Cart) -> Decimal:
+        return obj.annotated_subtotal  # type: ignore[attr-defined]
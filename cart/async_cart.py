@@ -0,0 +1,505 @@
+"""Async cart facade for ASGI deployments.
+
+:class:`cart.cart.Cart` is synchronous: under ASGI every ORM call it
+makes needs a ``sync_to_async`` thread hop. :class:`AsyncCart` covers
+the hot storefront paths — add / update / remove, totals, iteration —
+with Django's async ORM (``afirst``, ``acreate``, ``aupdate``,
+``aaggregate``, …) and the async session-adapter methods, so they run
+on the event loop.
+
+Usage:
+    async def add_to_cart(request, product_id):
+        cart = await AsyncCart.load(request)
+        product = await Product.objects.aget(pk=product_id)
+        await cart.aadd(product, product.price)
+        return JsonResponse({"count": await cart.acount()})
+
+Differences from the sync facade:
+
+- Django has no async transactions, so each mutation's line write runs
+  in one ``sync_to_async`` call; with ``CART_DENORMALIZED_TOTALS`` that
+  call is a transaction that also recomputes the totals columns, as in
+  the sync facade. ``aadd`` increments with ``UPDATE … SET quantity =
+  quantity + n`` (like ``CART_UPSERT_ADD``) and checks inventory
+  *before* writing rather than rolling back afterwards.
+- ``atotal``, ``acheckout`` and ``amerge`` run the sync implementation
+  in a worker thread: tax / shipping / inventory plugins are
+  synchronous, and checkout needs ``select_for_update`` inside a
+  transaction.
+- With ``CART_OPTIMISTIC_LOCKING`` each write claims the row version
+  first (raising ``ConcurrentModification`` on conflict); a write that
+  then fails validation still leaves the version bumped.
+- Signals are sent with ``sender=AsyncCart`` via ``Signal.asend`` where
+  available (Django ≥ 5.0).
+- A stateless cart kept by a ``stores_lines`` session adapter (see
+  :class:`cart.session.SignedCookieCartAdapter`) is promoted to a row
+  by :meth:`AsyncCart.load`.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Optional, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, QuerySet, Sum
+from django.dispatch import Signal
+from django.utils import timezone
+
+from . import models
+from .cache import (
+    abump_version,
+    aget_value,
+    aget_version,
+    aset_value,
+    get_cart_cache,
+)
+from .cart import (
+    Cart,
+    CartTotals,
+    ConcurrentModification,
+    InsufficientStock,
+    InvalidQuantity,
+    ItemDoesNotExist,
+    _validate_price,
+    cart_item_added,
+    cart_item_removed,
+    cart_item_updated,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+
+_T = TypeVar("_T")
+
+
+def _content_type_id(model: "type[Model]") -> int:
+    """Return the content-type id of *model*. Call from a worker thread.
+
+    ``get_for_model`` answers from Django's process-wide content-type
+    cache once warm, so this rarely costs a query.
+    """
+    return ContentType.objects.get_for_model(model).id
+
+
+async def _asend(signal: Optional[Signal], sender: type, **kwargs: Any) -> None:
+    if signal is None:
+        return
+    asend = getattr(signal, "asend", None)
+    if asend is not None:
+        await asend(sender=sender, **kwargs)
+    else:
+        await sync_to_async(signal.send)(sender=sender, **kwargs)
+
+
+class AsyncCart:
+    """Async counterpart of :class:`cart.cart.Cart`.
+
+    Build it with :meth:`load` — ``__init__`` cannot await the session
+    and cart-row lookups. It shares the session adapter, the
+    ``CART_*`` settings, the exceptions and the signals of the sync
+    facade, and both can be used on the same cart.
+    """
+
+    def __init__(self, request, session, cart: models.Cart):
+        self._request = request
+        self._session = session
+        self.cart = cart
+        self._cache: dict = {}
+        self._stored_totals_stale = False
+
+    @classmethod
+    async def load(cls, request, lazy: bool | None = None) -> "AsyncCart":
+        """Load (or start) the request's cart.
+
+        :param request: Django request.
+        :param lazy: Defer the cart row until the first mutation; defaults
+            to ``CART_LAZY_CREATE``. See :class:`cart.cart.Cart`.
+        """
+        session = Cart._build_session_adapter(request)
+        if lazy is None:
+            lazy = getattr(settings, "CART_LAZY_CREATE", False)
+        cart_id = await session.aget_or_create_cart_id()
+        cart = None
+        if cart_id:
+            cart = await models.Cart.objects.filter(
+                id=cart_id, checked_out=False
+            ).afirst()
+        if cart is None and session.stores_lines and session.load_lines():
+            # A stateless (cookie) cart: promote it so the async ORM
+            # paths below see its lines.
+            sync_cart = await sync_to_async(Cart)(request)
+            await sync_to_async(sync_cart._ensure_persisted)()
+            cart = sync_cart.cart
+        if cart is None:
+            cart = models.Cart(creation_date=timezone.now())
+            if not lazy:
+                await cart.asave()
+                await session.aset_cart_id(cart.pk)
+        return cls(request, session, cart)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _is_persisted(self) -> bool:
+        return self.cart.pk is not None
+
+    async def _aensure_persisted(self) -> None:
+        if self._is_persisted():
+            return
+        self.cart.creation_date = self.cart.last_activity = timezone.now()
+        await self.cart.asave()
+        await self._session.aset_cart_id(self.cart.pk)
+
+    def _items_qs(self) -> QuerySet[models.Item]:
+        if not self._is_persisted():
+            return models.Item.objects.none()
+        return models.Item.objects.filter(cart=self.cart)
+
+    def _lookup(self, product) -> tuple[int, QuerySet[models.Item]]:
+        """Return *product*'s content-type id and its line as a queryset.
+
+        Call from a worker thread.
+        """
+        content_type_id = _content_type_id(product._meta.model)
+        return content_type_id, models.Item.objects.filter(
+            cart=self.cart, content_type_id=content_type_id, object_id=product.pk
+        )
+
+    async def _awrite(self, write: Callable[[], _T]) -> _T:
+        """Run the line *write* in one worker-thread call and return its result.
+
+        With ``CART_DENORMALIZED_TOTALS`` the write and the recompute of
+        the cart's totals columns share one transaction, as in
+        ``Cart._mutation``, so items and totals never disagree.
+        """
+        if not getattr(settings, "CART_DENORMALIZED_TOTALS", False):
+            return await sync_to_async(write)()
+
+        def write_and_recompute() -> _T:
+            with transaction.atomic():
+                result = write()
+                models.Cart.objects.filter(pk=self.cart.pk).recompute_totals()
+            return result
+
+        result = await sync_to_async(write_and_recompute)()
+        self._stored_totals_stale = True
+        return result
+
+    async def _aclaim(self) -> None:
+        """Async ``Cart._claim_version`` for ``CART_OPTIMISTIC_LOCKING``."""
+        if not getattr(settings, "CART_OPTIMISTIC_LOCKING", False):
+            return
+        expected = self.cart.version
+        claimed = await models.Cart.objects.filter(
+            pk=self.cart.pk, version=expected
+        ).aupdate(version=F("version") + 1)
+        if not claimed:
+            self._cache = {}
+            self._stored_totals_stale = True
+            await self.cart.arefresh_from_db(fields=["version"])
+            raise ConcurrentModification(
+                f"Cart {self.cart.pk} was modified concurrently; retry the operation."
+            )
+        self.cart.version = expected + 1
+
+    async def _amutated(self) -> None:
+        """Async counterpart of ``Cart._mutated``."""
+        self._cache = {}
+        throttle = getattr(settings, "CART_ACTIVITY_THROTTLE", 300)
+        if throttle is not None:
+            now = timezone.now()
+            stale = now - timedelta(seconds=throttle)
+            if self.cart.last_activity <= stale:
+                await models.Cart.objects.filter(
+                    pk=self.cart.pk, last_activity__lte=stale
+                ).aupdate(last_activity=now)
+                self.cart.last_activity = now
+        cache = get_cart_cache()
+        if cache is not None:
+            await abump_version(cache, self.cart.pk)
+
+    def _sync_cart(self) -> Cart:
+        """Build a sync facade over the same cart. Call from a worker thread."""
+        return Cart(self._request, lazy=True)
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    async def aadd(
+        self,
+        product,
+        unit_price: Decimal,
+        quantity: int = 1,
+        validate_price: bool = False,
+        check_inventory: bool = False,
+    ) -> models.Item:
+        """Async :meth:`cart.cart.Cart.add`.
+
+        :raises InvalidQuantity: if *quantity* is less than 1 or the line
+            would exceed CART_MAX_QUANTITY_PER_ITEM.
+        :raises PriceMismatchError: if validate_price=True and price doesn't
+            match product.price.
+        :raises InsufficientStock: if check_inventory=True and product is out
+            of stock.
+        """
+        quantity = int(quantity)
+        if quantity < 1:
+            raise InvalidQuantity("Quantity must be at least 1.")
+        if validate_price:
+            _validate_price(product, unit_price)
+        max_qty = getattr(settings, "CART_MAX_QUANTITY_PER_ITEM", None)
+        if max_qty is not None and quantity > max_qty:
+            raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+
+        await self._aensure_persisted()
+        if check_inventory:
+            from .inventory import get_inventory_checker
+
+            def in_stock() -> bool:
+                _, lookup = self._lookup(product)
+                existing = lookup.values_list("quantity", flat=True).first()
+                return get_inventory_checker().check(
+                    product, (existing or 0) + quantity
+                )
+
+            if not await sync_to_async(in_stock)():
+                raise InsufficientStock(f"Not enough {product} stock available.")
+
+        await self._aclaim()
+
+        def write() -> models.Item:
+            content_type_id, lookup = self._lookup(product)
+            capped = lookup
+            if max_qty is not None:
+                capped = lookup.filter(quantity__lte=max_qty - quantity)
+            changes = {"quantity": F("quantity") + quantity, "unit_price": unit_price}
+            if capped.update(**changes):
+                return lookup.get()
+            if lookup.exists():
+                raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+            try:
+                # A savepoint, so a lost race doesn't break an enclosing
+                # transaction.
+                with transaction.atomic():
+                    return models.Item.objects.create(
+                        cart=self.cart,
+                        content_type_id=content_type_id,
+                        object_id=product.pk,
+                        quantity=quantity,
+                        unit_price=unit_price,
+                    )
+            except IntegrityError:
+                # A concurrent request inserted the line first.
+                if not capped.update(**changes):
+                    raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+                return lookup.get()
+
+        item = await self._awrite(write)
+        await self._amutated()
+        await _asend(cart_item_added, self.__class__, cart=self.cart, item=item)
+        return item
+
+    async def aremove(self, product) -> None:
+        """Async :meth:`cart.cart.Cart.remove`.
+
+        :raises ItemDoesNotExist: if the product is not in the cart.
+        """
+        deleted = 0
+        if self._is_persisted():
+            await self._aclaim()
+            deleted = await self._awrite(lambda: self._lookup(product)[1].delete()[0])
+        if not deleted:
+            raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
+        await self._amutated()
+        await _asend(cart_item_removed, self.__class__, cart=self.cart, product=product)
+
+    async def aupdate(
+        self,
+        product,
+        quantity: int,
+        unit_price: Decimal | None = None,
+        validate_price: bool = False,
+    ) -> models.Item:
+        """Async :meth:`cart.cart.Cart.update`. *quantity* = 0 removes the line.
+
+        :raises ItemDoesNotExist: if the product is not in the cart.
+        :raises InvalidQuantity: if *quantity* is negative or exceeds
+            CART_MAX_QUANTITY_PER_ITEM.
+        :raises PriceMismatchError: if validate_price=True and price doesn't
+            match product.price.
+        """
+        quantity = int(quantity)
+        if quantity < 0:
+            raise InvalidQuantity("Quantity cannot be negative.")
+        if validate_price and unit_price is not None:
+            _validate_price(product, unit_price)
+        max_qty = getattr(settings, "CART_MAX_QUANTITY_PER_ITEM", None)
+        if max_qty is not None and quantity > max_qty:
+            raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+
+        item = None
+        if self._is_persisted():
+            item = await sync_to_async(lambda: self._lookup(product)[1].first())()
+        if item is None:
+            raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
+
+        await self._aclaim()
+        if quantity == 0:
+            await self._awrite(item.delete)
+            await self._amutated()
+            await _asend(
+                cart_item_updated,
+                self.__class__,
+                cart=self.cart,
+                item=item,
+                deleted=True,
+            )
+            return item
+
+        item.quantity = quantity
+        update_fields = ["quantity"]
+        if unit_price is not None:
+            item.unit_price = unit_price
+            update_fields.append("unit_price")
+        await self._awrite(lambda: item.save(update_fields=update_fields))
+        await self._amutated()
+        await _asend(cart_item_updated, self.__class__, cart=self.cart, item=item)
+        return item
+
+    async def amerge(
+        self, other_cart: "AsyncCart | Cart", strategy: str = "add"
+    ) -> None:
+        """Merge *other_cart* into this cart; see :meth:`cart.cart.Cart.merge`.
+
+        Runs the sync, single-transaction merge in a worker thread.
+        """
+
+        def merge() -> models.Cart:
+            target = self._sync_cart()
+            if isinstance(other_cart, AsyncCart):
+                source = other_cart._sync_cart()
+            else:
+                source = other_cart
+            target.merge(source, strategy=strategy)
+            return target.cart
+
+        self.cart = await sync_to_async(merge)()
+        self._cache = {}
+        self._stored_totals_stale = True
+        if isinstance(other_cart, AsyncCart):
+            other_cart._cache = {}
+            other_cart._stored_totals_stale = True
+
+    async def acheckout(self) -> None:
+        """Check the cart out; see :meth:`cart.cart.Cart.checkout`.
+
+        Runs the sync implementation (row locks, discount revalidation,
+        ``cart_checked_out``) in a worker thread.
+        """
+
+        def checkout() -> bool:
+            cart = self._sync_cart()
+            cart.checkout()
+            return cart.cart.checked_out
+
+        self.cart.checked_out = await sync_to_async(checkout)()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def atotals(self) -> CartTotals:
+        """Async :meth:`cart.cart.Cart.totals` — one aggregate, or none."""
+        if "totals" in self._cache:
+            return self._cache["totals"]
+        if not self._is_persisted():
+            totals = CartTotals(count=0, unique_count=0, summary=Decimal("0.00"))
+        elif getattr(settings, "CART_DENORMALIZED_TOTALS", False):
+            if self._stored_totals_stale:
+                await self.cart.arefresh_from_db(
+                    fields=["line_count", "unit_count", "subtotal"]
+                )
+                self._stored_totals_stale = False
+            totals = CartTotals(
+                count=self.cart.unit_count,
+                unique_count=self.cart.line_count,
+                summary=self.cart.subtotal,
+            )
+        else:
+            totals = await self._ashared_totals()
+        self._cache["totals"] = totals
+        return totals
+
+    async def _ashared_totals(self) -> CartTotals:
+        cache = get_cart_cache()
+        version: int | str | None = None
+        if cache is not None:
+            if getattr(settings, "CART_OPTIMISTIC_LOCKING", False):
+                version = f"r{self.cart.version}"
+            else:
+                version = await aget_version(cache, self.cart.pk)
+            cached = await aget_value(cache, self.cart.pk, version, "totals")
+            if cached is not None:
+                return cached
+        result = await self._items_qs().aaggregate(
+            count=Sum("quantity"),
+            unique_count=Count("id"),
+            summary=Sum(F("quantity") * F("unit_price")),
+        )
+        totals = CartTotals(
+            count=result["count"] or 0,
+            unique_count=result["unique_count"] or 0,
+            summary=result["summary"] or Decimal("0.00"),
+        )
+        if cache is not None and version is not None:
+            await aset_value(cache, self.cart.pk, version, "totals", totals)
+        return totals
+
+    async def acount(self) -> int:
+        """Return the total number of *units* across all items."""
+        return (await self.atotals()).count
+
+    async def aunique_count(self) -> int:
+        """Return the number of distinct products in the cart."""
+        return (await self.atotals()).unique_count
+
+    async def asummary(self) -> Decimal:
+        """Return the grand total price for all items."""
+        return (await self.atotals()).summary
+
+    async def ais_empty(self) -> bool:
+        """Return ``True`` if the cart contains no items."""
+        return await self.acount() == 0
+
+    async def atotal(self) -> Decimal:
+        """Return :meth:`cart.cart.Cart.total` (discount, tax, shipping).
+
+        Tax and shipping calculators are synchronous plugins, so this
+        runs in a worker thread.
+        """
+        return await sync_to_async(lambda: self._sync_cart().total())()
+
+    async def __aiter__(self) -> AsyncIterator[models.Item]:
+        """Iterate the cart's items with ``async for``.
+
+        With ``CART_PREFETCH_PRODUCTS`` the items are collected first and
+        their products batch-loaded (see :mod:`cart.loaders`).
+        """
+        items = self._items_qs().select_related("content_type")
+        if not getattr(settings, "CART_PREFETCH_PRODUCTS", False):
+            async for item in items:
+                yield item
+            return
+
+        from .loaders import prefetch_products
+
+        loaded = [item async for item in items]
+        await sync_to_async(prefetch_products)(loaded)
+        for item in loaded:
+            yield item
@@ -0,0 +1,124 @@
+"""Cross-request cache for cart totals.
+
+``Cart._cache`` lives for one facade instance, so every request used to
+recompute ``count()`` and ``summary()`` with an aggregate query even when
+nothing changed. This module stores those values in one of Django's
+configured caches under a key that embeds a per-cart *version*; every
+facade mutation bumps the version, so stale entries are never read
+again and simply age out.
+
+Usage:
+    1. Point the cart at a cache alias:
+       CART_CACHE = "default"   # locmem in tests, Redis / Memcached in prod
+
+    2. Nothing else — ``Cart.totals()`` (and so ``count()`` /
+       ``summary()``) reads through the cache, and ``add`` / ``update``
+       / ``remove`` / ... bump the version.
+
+With ``CART_OPTIMISTIC_LOCKING`` on, the cart row's own ``version``
+column keys the values instead, so reads skip the version lookup.
+
+Writes that bypass the facade (raw ORM updates, the admin) don't bump
+the version; call :func:`bump_version` yourself after such writes.
+"""
+
+import time
+from typing import Any
+
+from django.core.cache import BaseCache
+
+
+def get_cart_cache() -> BaseCache | None:
+    """Return the cache named by ``CART_CACHE``, or ``None`` when unset."""
+    from django.conf import settings
+
+    alias = getattr(settings, "CART_CACHE", None)
+    if not alias:
+        return None
+
+    from django.core.cache import caches
+
+    return caches[alias]
+
+
+def _version_key(cart_id: int) -> str:
+    return f"cart:{cart_id}:version"
+
+
+def _value_key(cart_id: int, version: int | str, name: str) -> str:
+    return f"cart:{cart_id}:v{version}:{name}"
+
+
+def get_version(cache: BaseCache, cart_id: int) -> int:
+    """Return the current version of *cart_id*, initialising it if needed.
+
+    A missing version (first use, or evicted by the backend) is seeded
+    with a nanosecond timestamp rather than ``0`` so an eviction can
+    never resurrect values cached under an earlier version.
+    """
+    key = _version_key(cart_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(cache: BaseCache, cart_id: int) -> None:
+    """Invalidate every value cached for *cart_id*."""
+    key = _version_key(cart_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key missing or evicted — start a fresh, never-seen version.
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def version_etag(cache: BaseCache, cart_id: int) -> str:
+    """Return the ``Cart.etag()`` value derived from the cart's version."""
+    return f"{cart_id}-{get_version(cache, cart_id)}"
+
+
+def get_value(cache: BaseCache, cart_id: int, version: int | str, name: str) -> Any:
+    """Return the cached *name* for this cart version, or ``None`` on a miss."""
+    return cache.get(_value_key(cart_id, version, name))
+
+
+def set_value(
+    cache: BaseCache, cart_id: int, version: int | str, name: str, value: Any
+) -> None:
+    """Store *name* for this cart version with the cache's default timeout."""
+    cache.set(_value_key(cart_id, version, name), value)
+
+
+async def aget_version(cache: BaseCache, cart_id: int) -> int:
+    """Async variant of :func:`get_version`."""
+    key = _version_key(cart_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+async def abump_version(cache: BaseCache, cart_id: int) -> None:
+    """Async variant of :func:`bump_version`."""
+    key = _version_key(cart_id)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aset(key, time.time_ns(), timeout=None)
+
+
+async def aget_value(
+    cache: BaseCache, cart_id: int, version: int | str, name: str
+) -> Any:
+    """Async variant of :func:`get_value`."""
+    return await cache.aget(_value_key(cart_id, version, name))
+
+
+async def aset_value(
+    cache: BaseCache, cart_id: int, version: int | str, name: str, value: Any
+) -> None:
+    """Async variant of :func:`set_value`."""
+    await cache.aset(_value_key(cart_id, version, name), value)
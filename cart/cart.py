@@ -1,19 +1,35 @@
+import functools
+import hashlib
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import timedelta
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, TypeVar
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models import F, QuerySet, Sum
+from django.db.models import Count, F, Prefetch, Q, QuerySet, Sum
 from django.dispatch import Signal
 from django.utils import timezone
 
 from . import models
+from .cache import (
+    bump_version,
+    get_cart_cache,
+    get_value,
+    get_version,
+    set_value,
+    version_etag,
+)
 
 if TYPE_CHECKING:
     from .shipping import ShippingOption
 
+T = TypeVar("T")
+
 # ``cart.signals`` is imported defensively: the module is optional (a
-# downstream can remove it) and these five Signal handles are typed as
+# downstream can remove it) and these seven Signal handles are typed as
 # ``Optional[Signal]`` so the ``is not None`` guards at each emit site
 # read cleanly under mypy.
 cart_item_added: Optional[Signal]
@@ -21,6 +37,8 @@ cart_item_removed: Optional[Signal]
 cart_item_updated: Optional[Signal]
 cart_checked_out: Optional[Signal]
 cart_cleared: Optional[Signal]
+cart_items_removed: Optional[Signal]
+cart_items_updated: Optional[Signal]
 
 try:
     from .signals import cart_checked_out as _cart_checked_out
@@ -28,20 +46,32 @@ try:
     from .signals import cart_item_added as _cart_item_added
     from .signals import cart_item_removed as _cart_item_removed
     from .signals import cart_item_updated as _cart_item_updated
+    from .signals import cart_items_removed as _cart_items_removed
+    from .signals import cart_items_updated as _cart_items_updated
 
     cart_item_added = _cart_item_added
     cart_item_removed = _cart_item_removed
     cart_item_updated = _cart_item_updated
     cart_checked_out = _cart_checked_out
     cart_cleared = _cart_cleared
+    cart_items_removed = _cart_items_removed
+    cart_items_updated = _cart_items_updated
 except ImportError:
     cart_item_added = None
     cart_item_removed = None
     cart_item_updated = None
     cart_checked_out = None
     cart_cleared = None
+    cart_items_removed = None
+    cart_items_updated = None
 
 CART_ID = "CART-ID"
+# Cookie holding the signed lines of a cart without a row; see
+# :class:`cart.session.SignedCookieCartAdapter`.
+CART_DATA = "CART-DATA"
+# Lines looked up by key in one query; larger batches read the whole cart
+# (and keep the bound-parameter count well under backend limits).
+_LINE_LOOKUP_BATCH = 500
 
 
 class CartException(Exception):
@@ -76,6 +106,37 @@ class MinimumOrderNotMet(CartException):
     """Raised when cart doesn't meet minimum order amount."""
 
 
+class ConcurrentModification(CartException):
+    """Raised when another writer changed the cart since this facade read it.
+
+    Only raised with ``CART_OPTIMISTIC_LOCKING`` on. Nothing was written;
+    the facade has reloaded the cart's version, so the operation can be
+    retried — see :func:`retry_on_conflict`.
+    """
+
+
+@dataclass(frozen=True)
+class CartTotals:
+    """Line aggregates returned by :meth:`Cart.totals`."""
+
+    count: int
+    unique_count: int
+    summary: Decimal
+
+
+def _validate_price(product, unit_price: Decimal) -> None:
+    """Raise :class:`PriceMismatchError` if *unit_price* != ``product.price``.
+
+    Products without a ``price`` attribute (or with ``price=None``) are
+    not validated.
+    """
+    actual_price = getattr(product, "price", None)
+    if actual_price is not None and unit_price != actual_price:
+        raise PriceMismatchError(
+            f"Price mismatch: expected {actual_price}, got {unit_price}."
+        )
+
+
 def _parse_serializable_key(key: str, item_data: dict) -> tuple[int, int]:
     """Resolve a ``cart_serializable`` payload entry to ``(content_type_id, object_id)``.
 
@@ -121,6 +182,52 @@ def _parse_serializable_key(key: str, item_data: dict) -> tuple[int, int]:
     return int(content_type_id_raw), object_id
 
 
+def retry_on_conflict(
+    func: Callable[..., T] | None = None, *, attempts: int = 3
+) -> Callable[..., T]:
+    """Re-run *func* when it raises :class:`ConcurrentModification`.
+
+    Use it as a decorator — bare or with arguments — or wrap a callable
+    in place::
+
+        @retry_on_conflict
+        def add_to_cart(request, product_id): ...
+
+        @retry_on_conflict(attempts=5)
+        def update_cart(request): ...
+
+        retry_on_conflict(cart.add)(product, price)
+
+    A conflict leaves the facade reloaded with the winner's version, so
+    retrying the same call re-applies it on top of the other write.
+    Inside an outer transaction on a ``REPEATABLE READ`` backend (MySQL's
+    default) the reload cannot see the newer version; retry outside it.
+
+    :param func: The callable to protect.
+    :param attempts: Total number of calls before the last
+        :class:`ConcurrentModification` propagates (must be ≥ 1).
+    :raises ValueError: if *attempts* is less than 1.
+    """
+    if attempts < 1:
+        raise ValueError("attempts must be at least 1.")
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> T:
+            for _ in range(attempts - 1):
+                try:
+                    return fn(*args, **kwargs)
+                except ConcurrentModification:
+                    continue
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    if func is None:
+        return decorator  # type: ignore[return-value]
+    return decorator(func)
+
+
 class Cart:
     """
     Session-backed shopping cart.
@@ -134,18 +241,81 @@ class Cart:
         cart.add(product, unit_price=Decimal("9.99"), quantity=2)
         cart.remove(product)
         total = cart.summary()
+
+    By default a visitor without a ``CART-ID`` gets a fresh
+    :class:`cart.models.Cart` row on construction. Pass ``lazy=True``
+    (or set ``CART_LAZY_CREATE = True``) to start with an unsaved,
+    empty in-memory row instead: read methods answer without touching
+    the DB, and the row plus the session id are written only on the
+    first mutation (:meth:`add`, :meth:`add_bulk`,
+    :meth:`apply_discount`, :meth:`bind_to_user`,
+    :meth:`from_serializable`, :meth:`merge`). Read-only traffic —
+    crawlers, first-time visitors rendering a cart badge — then never
+    creates an empty row.
+
+    Pass ``snapshot=True`` (or set ``CART_SNAPSHOT_LOAD = True``) to
+    load the cart row with its discount and all of its items (with
+    content types) up front — two queries in total. :meth:`count`,
+    :meth:`unique_count`, :meth:`summary`, :meth:`discount_amount`,
+    ``len()``, ``in`` and iteration are then served from that
+    in-memory snapshot until the next mutation drops it.
+
+    With a session adapter that stores lines (``stores_lines``, e.g.
+    :class:`cart.session.SignedCookieCartAdapter`) a visitor without a
+    ``CART-ID`` gets a *stateless* cart: the lines and discount code
+    are read from the adapter into unsaved :class:`cart.models.Item`
+    objects, reads are served from them, and :meth:`add`,
+    :meth:`update`, :meth:`remove`, :meth:`update_many`,
+    :meth:`remove_many`, :meth:`clear`, :meth:`apply_discount` and
+    :meth:`remove_discount` write them back to the adapter instead of
+    the database. Everything else that needs a row —
+    :meth:`checkout`, :meth:`bind_to_user`, :meth:`add_bulk`,
+    :meth:`merge` into this cart, :meth:`from_serializable`, or lines
+    outgrowing the adapter — first promotes the cart to a row.
     """
 
-    def __init__(self, request):
+    def __init__(self, request, lazy: bool | None = None, snapshot: bool | None = None):
         self._session = self._build_session_adapter(request)
+        if lazy is None:
+            lazy = getattr(settings, "CART_LAZY_CREATE", False)
+        if snapshot is None:
+            snapshot = getattr(settings, "CART_SNAPSHOT_LOAD", False)
+        self._snapshot: list[models.Item] | None = None
+        self._lines: dict[tuple[int, int], models.Item] | None = None
+        self._line_memo: dict[tuple[int, int], models.Item | None] = {}
+        self._lines_probed = False
         cart_id = self._session.get_or_create_cart_id()
         cart = None
+        self._stateless = False
         if cart_id:
-            cart = models.Cart.objects.filter(id=cart_id, checked_out=False).first()
-        if cart is None:
-            cart = self._new()
+            qs = models.Cart.objects.filter(id=cart_id, checked_out=False)
+            if snapshot:
+                qs = qs.select_related("discount").prefetch_related(
+                    Prefetch(
+                        "items",
+                        queryset=models.Item.objects.select_related("content_type"),
+                    )
+                )
+            cart = qs.first()
+        if cart is None and self._session.stores_lines:
+            cart = models.Cart(creation_date=timezone.now())
+            self._stateless = True
+            self._snapshot = self._load_stored_lines(cart)
+        elif cart is None:
+            if lazy:
+                cart = models.Cart(creation_date=timezone.now())
+            else:
+                cart = self._new()
+            if snapshot:
+                self._snapshot = []
+        elif snapshot:
+            self._snapshot = list(cart.items.all())
+            # Drop Django's prefetch cache so ``self.cart.items`` goes back
+            # to live queries once a mutation discards the snapshot.
+            getattr(cart, "_prefetched_objects_cache", {}).pop("items", None)
         self.cart = cart
         self._cache: dict = {}
+        self._stored_totals_stale = False
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -222,31 +392,558 @@ class Cart:
         self._session.set_cart_id(cart.id)
         return cart
 
+    def _is_persisted(self) -> bool:
+        """Return ``True`` once the backing :class:`cart.models.Cart` row exists."""
+        return self.cart.pk is not None
+
+    def _ensure_persisted(self) -> None:
+        """Write the deferred cart row and session id of a lazy cart.
+
+        No-op on a cart that already has a row. ``creation_date`` is
+        reset to "now" so the row records when the visitor first
+        mutated the cart, not when the facade was built.
+        """
+        if self._is_persisted():
+            return
+        self.cart.creation_date = self.cart.last_activity = timezone.now()
+        self.cart.save()
+        self._session.set_cart_id(self.cart.id)
+        if self._stateless:
+            self._promote_stored_lines()
+
+    def _load_stored_lines(self, cart: models.Cart) -> list[models.Item]:
+        """Build the unsaved items (and discount) of a stateless cart.
+
+        Content types come from Django's content-type cache, so only an
+        applied discount code costs a query.
+        """
+        payload = self._session.load_lines() or {}
+        code = payload.get("d")
+        if code:
+            cart.discount = models.Discount.objects.filter(code=code).first()
+        return [
+            models.Item(
+                cart=cart,
+                content_type=ContentType.objects.get_for_id(content_type_id),
+                object_id=object_id,
+                quantity=quantity,
+                unit_price=Decimal(unit_price),
+            )
+            for content_type_id, object_id, quantity, unit_price in payload.get("l", [])
+        ]
+
+    def _store_lines(self) -> None:
+        """Write a stateless cart back to the session adapter.
+
+        A cart the adapter cannot hold any more (``save_lines`` returns
+        ``False``) is promoted to a row instead.
+        """
+        lines = self._snapshot or []
+        if not lines and self.cart.discount is None:
+            self._session.clear_lines()
+            return
+        payload: dict = {
+            "l": [
+                [i.content_type_id, i.object_id, i.quantity, str(i.unit_price)]
+                for i in lines
+            ]
+        }
+        if self.cart.discount is not None:
+            payload["d"] = self.cart.discount.code
+        if not self._session.save_lines(payload):
+            self._ensure_persisted()
+
+    def _promote_stored_lines(self) -> None:
+        """Insert a stateless cart's lines for its newly saved row.
+
+        Called by :meth:`_ensure_persisted`; the adapter's copy is
+        dropped and the facade behaves like any row-backed cart from
+        here on.
+        """
+        items = self._snapshot or []
+        self._stateless = False
+        self._snapshot = None
+        self._forget_lines()
+        self._session.clear_lines()
+        if not items:
+            return
+        for item in items:
+            item.cart = self.cart
+        with self._mutation():
+            models.Item.objects.bulk_create(items)
+        if all(item.pk is not None for item in items):
+            self._lines = {(i.content_type_id, i.object_id): i for i in items}
+        self._mutated()
+
+    def _drop_stored_lines(self, items: Iterable[models.Item]) -> None:
+        """Remove *items* from a stateless cart's in-memory lines."""
+        dropped = {id(item) for item in items}
+        self._snapshot = [i for i in self._snapshot or [] if id(i) not in dropped]
+
+    def _save_line(self, item: models.Item, fields: list[str]) -> bool:
+        """Save *fields* of *item*, or store a stateless cart's lines.
+
+        Returns ``False`` when the row is gone — deleted by another
+        facade since this one looked it up.
+        """
+        if self._stateless:
+            self._store_lines()
+            return True
+        return bool(
+            models.Item.objects.filter(pk=item.pk).update(
+                **{name: getattr(item, name) for name in fields}
+            )
+        )
+
+    def _delete_line(self, item: models.Item) -> bool:
+        """Delete *item*, or drop it from a stateless cart's lines.
+
+        Returns ``False`` when the row was already gone.
+        """
+        if self._stateless:
+            self._drop_stored_lines([item])
+            self._store_lines()
+            return True
+        return models.Item.objects.filter(pk=item.pk).delete()[0] > 0
+
+    def _items_qs(self) -> QuerySet[models.Item]:
+        """Return the cart's items, or an empty queryset for an unsaved cart.
+
+        ``Item.objects.none()`` answers ``aggregate`` / ``count`` /
+        ``exists`` / iteration without issuing SQL, so read paths on a
+        lazy cart stay query-free.
+        """
+        if not self._is_persisted():
+            return models.Item.objects.none()
+        return self.cart.items.all()
+
+    @staticmethod
+    def _product_key(product) -> tuple[int, int]:
+        """Return the ``(content_type_id, object_id)`` identity of *product*.
+
+        ``ContentType.objects.get_for_model`` is served from Django's
+        process-wide content-type cache after the first lookup per model.
+        """
+        content_type = ContentType.objects.get_for_model(product._meta.model)
+        return content_type.id, product.pk
+
+    def _line_index(self) -> dict[tuple[int, int], models.Item]:
+        """Return every item of the cart keyed by ``(content_type_id, object_id)``.
+
+        Built from the snapshot when one is loaded, otherwise with a
+        single ``SELECT`` of all the cart's items, and then kept in sync
+        by every mutation. Only the snapshot, :meth:`_probe_lines` and
+        the whole-cart paths (:meth:`merge`'s source, very large batches)
+        build it. Writes and single lookups on a large cart go through
+        :meth:`_get_item`, which never reads more than the one line.
+        """
+        if self._lines is None:
+            if self._snapshot is not None:
+                items: Iterable[models.Item] = self._snapshot
+            else:
+                items = self._items_qs().select_related("content_type")
+            self._lines = {(i.content_type_id, i.object_id): i for i in items}
+            self._line_memo = {}
+        return self._lines
+
+    def _lines_for(
+        self, keys: Iterable[tuple[int, int]]
+    ) -> dict[tuple[int, int], models.Item]:
+        """Return the cart's items for *keys*, skipping keys not in the cart.
+
+        Answered from :meth:`_line_index` when it is already loaded (or a
+        snapshot makes it free). Otherwise each key is looked up once
+        per facade and remembered — found or not — in ``_line_memo``;
+        the keys not seen before are fetched with one ``SELECT``, so a
+        ``product in cart`` check or an ``add`` on a 20k-line cart reads
+        one row, not the whole cart. Writes made behind the facade's back
+        (another ``Cart`` instance, raw ORM updates) are not seen until a
+        new facade is built.
+        """
+        keys = list(keys)
+        if self._lines is None and self._snapshot is None:
+            missing = list(dict.fromkeys(k for k in keys if k not in self._line_memo))
+            if len(missing) > _LINE_LOOKUP_BATCH:
+                # Too many keys for one IN list; read the whole cart once.
+                self._line_index()
+            elif missing:
+                wanted: dict[int, list[int]] = {}
+                for content_type_id, object_id in missing:
+                    wanted.setdefault(content_type_id, []).append(object_id)
+                condition = Q()
+                for content_type_id, object_ids in wanted.items():
+                    condition |= Q(
+                        content_type_id=content_type_id, object_id__in=object_ids
+                    )
+                found = {
+                    (i.content_type_id, i.object_id): i
+                    for i in self._items_qs()
+                    .filter(condition)
+                    .select_related("content_type")
+                }
+                for key in missing:
+                    self._line_memo[key] = found.get(key)
+        if self._lines is not None or self._snapshot is not None:
+            index = self._line_index()
+            return {key: index[key] for key in keys if key in index}
+        return {key: item for key in keys if (item := self._line_memo[key]) is not None}
+
+    def _remember_line(self, key: tuple[int, int], item: models.Item) -> None:
+        """Record that *item* is now the cart's line for *key*."""
+        if self._lines is not None:
+            self._lines[key] = item
+        else:
+            self._line_memo[key] = item
+
+    def _forget_line(self, key: tuple[int, int]) -> None:
+        """Record that the cart no longer has a line for *key*."""
+        if self._lines is not None:
+            self._lines.pop(key, None)
+        else:
+            self._line_memo[key] = None
+
+    def _forget_lines(self) -> None:
+        """Drop every line lookup; the next one reads the database again."""
+        self._lines = None
+        self._line_memo = {}
+        self._lines_probed = False
+
+    def _probe_lines(self) -> None:
+        """Load the whole line index if the cart is small enough.
+
+        One ``SELECT … LIMIT`` of at most ``_LINE_LOOKUP_BATCH + 1``
+        lines: a cart that fits becomes a complete index, so any number
+        of ``product in cart`` checks cost that single query. A larger
+        cart only remembers the rows read, and later checks fall back to
+        per-key lookups. Runs once per facade.
+        """
+        self._lines_probed = True
+        items = list(
+            self._items_qs()
+            .select_related("content_type")
+            .order_by("pk")[: _LINE_LOOKUP_BATCH + 1]
+        )
+        if len(items) <= _LINE_LOOKUP_BATCH:
+            self._lines = {(i.content_type_id, i.object_id): i for i in items}
+            self._line_memo = {}
+            return
+        for item in items:
+            self._line_memo.setdefault((item.content_type_id, item.object_id), item)
+
     def _get_item(self, product) -> models.Item | None:
-        # ``product=`` is rewritten to ``content_type + object_id`` by
-        # ``ItemManager._inject_content_type``. django-stubs doesn't
-        # follow that translation, so the kwarg looks unresolved here.
-        return models.Item.objects.filter(
-            cart=self.cart, product=product  # type: ignore[misc]
-        ).first()
+        if not self._is_persisted() and not self._stateless:
+            return None
+        key = self._product_key(product)
+        return self._lines_for([key]).get(key)
+
+    def _reread_line(self, key: tuple[int, int]) -> models.Item | None:
+        """Read the line for *key* afresh, locking it where supported.
+
+        Write paths use this instead of a remembered line, which another
+        facade may have added, changed or deleted since. Must run inside
+        a transaction; the result replaces what the facade remembered.
+        """
+        item = (
+            self._items_qs()
+            .select_for_update()
+            .filter(content_type_id=key[0], object_id=key[1])
+            # Item's default ordering joins cart_cart, which FOR UPDATE
+            # would lock as well.
+            .order_by("pk")
+            .first()
+        )
+        if item is None:
+            self._forget_line(key)
+            return None
+        # Served from Django's content-type cache; joining it in would
+        # also lock the content-type row.
+        item.content_type = ContentType.objects.get_for_id(key[0])
+        self._remember_line(key, item)
+        return item
+
+    @contextmanager
+    def _atomic(self) -> Iterator[None]:
+        """``transaction.atomic()`` that also forgets in-memory lines on error.
+
+        A rolled-back block may leave created, deleted or re-quantified
+        ``Item`` objects in the line lookups, the snapshot and the cached
+        totals; dropping them makes the next read reload the committed
+        state.
+        """
+        try:
+            with transaction.atomic():
+                yield
+        except BaseException:
+            self._forget_lines()
+            self._invalidate_cache()
+            raise
+
+    @contextmanager
+    def _mutation(self, atomic: bool = True) -> Iterator[None]:
+        """Wrap a facade write; keeps the denormalized totals in step.
+
+        With ``CART_DENORMALIZED_TOTALS`` on, the block always runs in
+        :meth:`_atomic` and :meth:`_sync_totals` rewrites the cart's
+        totals columns before it commits, so items and totals never
+        disagree. With ``CART_OPTIMISTIC_LOCKING`` on, the block also
+        runs in :meth:`_atomic` and starts with :meth:`_claim_version`.
+        Otherwise ``atomic=False`` lets single-statement writes skip the
+        transaction. A stateless cart's writes never reach the database,
+        so for it the block runs unwrapped.
+        """
+        if self._stateless:
+            yield
+            return
+        denormalized = getattr(settings, "CART_DENORMALIZED_TOTALS", False)
+        optimistic = self._optimistic()
+        with self._atomic() if atomic or denormalized or optimistic else nullcontext():
+            if optimistic:
+                self._claim_version()
+            try:
+                yield
+                if denormalized:
+                    self._sync_totals()
+            except BaseException:
+                if optimistic:
+                    # The claim is rolled back with the rest of the block.
+                    self.cart.version -= 1
+                raise
+
+    def _optimistic(self) -> bool:
+        """Return ``True`` when writes must claim the row version first."""
+        return (
+            getattr(settings, "CART_OPTIMISTIC_LOCKING", False) and self._is_persisted()
+        )
+
+    def _claim_version(self, **changes) -> None:
+        """Compare-and-swap the cart row's ``version`` (plus any *changes*).
+
+        One ``UPDATE … SET version = version + 1 WHERE pk = … AND
+        version = <read version>``. No row matching means another writer
+        bumped the version since this facade read it: the facade reloads
+        and :class:`ConcurrentModification` is raised.
+        """
+        expected = self.cart.version
+        claimed = models.Cart.objects.filter(pk=self.cart.pk, version=expected).update(
+            version=F("version") + 1, **changes
+        )
+        if not claimed:
+            self._reload_after_conflict()
+            raise ConcurrentModification(
+                f"Cart {self.cart.pk} was modified concurrently; retry the operation."
+            )
+        self.cart.version = expected + 1
+
+    def _reload_after_conflict(self) -> None:
+        """Re-read the row state a losing writer needs to retry."""
+        self._forget_lines()
+        self._invalidate_cache()
+        self._stored_totals_stale = True
+        try:
+            self.cart.refresh_from_db(
+                fields=["version", "checked_out", "discount", "user"]
+            )
+        except models.Cart.DoesNotExist:
+            pass
+
+    def _save_cart(self, fields: list[str]) -> None:
+        """Save *fields* of the cart row, claiming the version when enabled."""
+        if self._optimistic():
+            self._claim_version(**{name: getattr(self.cart, name) for name in fields})
+        else:
+            self.cart.save(update_fields=fields)
+
+    def _sync_totals(self) -> None:
+        """Recompute ``line_count`` / ``unit_count`` / ``subtotal`` in one UPDATE.
+
+        The in-memory row is marked stale rather than re-read; the next
+        :meth:`totals` call refreshes it with a primary-key lookup.
+        """
+        models.Cart.objects.filter(pk=self.cart.pk).recompute_totals()
+        self._stored_totals_stale = True
+
+    def _stored_totals(self) -> CartTotals:
+        """Return the denormalized totals of the cart row."""
+        if self._stored_totals_stale:
+            self.cart.refresh_from_db(fields=["line_count", "unit_count", "subtotal"])
+            self._stored_totals_stale = False
+        return CartTotals(
+            count=self.cart.unit_count,
+            unique_count=self.cart.line_count,
+            summary=self.cart.subtotal,
+        )
 
     def _invalidate_cache(self) -> None:
-        """Invalidate the summary and count cache."""
+        """Invalidate the summary and count cache and drop any snapshot.
+
+        A stateless cart keeps its lines: they are the cart, not a copy.
+        """
         self._cache = {}
+        if not self._stateless:
+            self._snapshot = None
+
+    def _mutated(self) -> None:
+        """Forget cached reads after a facade mutation.
+
+        Besides the per-instance cache this bumps the cart's version in
+        the cross-request ``CART_CACHE`` (see :mod:`cart.cache`). Inside
+        an outer transaction the version is bumped again on commit, so a
+        concurrent request that cached the pre-commit totals under the
+        new version cannot keep serving them. It also records the
+        activity (see :meth:`_touch`).
+        """
+        self._invalidate_cache()
+        self._touch()
+        cache = get_cart_cache()
+        if cache is None or not self._is_persisted():
+            return
+        cart_id = self.cart.pk
+        bump_version(cache, cart_id)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: bump_version(cache, cart_id))
+
+    def _touch(self) -> None:
+        """Bump ``last_activity``, at most once per ``CART_ACTIVITY_THROTTLE``.
+
+        The throttle (seconds, default 300; ``None`` disables tracking) is
+        checked against the in-memory row first, so mutating a recently
+        active cart costs no query.
+        """
+        throttle = getattr(settings, "CART_ACTIVITY_THROTTLE", 300)
+        if throttle is None or not self._is_persisted():
+            return
+        now = timezone.now()
+        stale = now - timedelta(seconds=throttle)
+        if self.cart.last_activity > stale:
+            return
+        models.Cart.objects.filter(pk=self.cart.pk, last_activity__lte=stale).update(
+            last_activity=now
+        )
+        self.cart.last_activity = now
+
+    def _shared(self, name: str, compute):
+        """Return *name* from the cross-request cache, computing it on a miss.
+
+        Falls straight through to *compute* when ``CART_CACHE`` is unset
+        or the cart has no row yet. The cart's version is fetched once
+        per facade and kept in :attr:`_cache` until the next mutation;
+        with ``CART_OPTIMISTIC_LOCKING`` the row's ``version`` is used
+        instead, so no version lookup is needed.
+        """
+        cache = get_cart_cache()
+        if cache is None or not self._is_persisted():
+            return compute()
+        if "version" not in self._cache:
+            if getattr(settings, "CART_OPTIMISTIC_LOCKING", False):
+                # The row version already changes on every write.
+                self._cache["version"] = f"r{self.cart.version}"
+            else:
+                self._cache["version"] = get_version(cache, self.cart.pk)
+        version = self._cache["version"]
+        value = get_value(cache, self.cart.pk, version, name)
+        if value is None:
+            value = compute()
+            set_value(cache, self.cart.pk, version, name, value)
+        return value
 
     # ------------------------------------------------------------------
     # Iteration / dunder helpers
     # ------------------------------------------------------------------
 
     def __iter__(self):
-        return iter(self.cart.items.select_related("content_type").all())
+        if getattr(settings, "CART_PREFETCH_PRODUCTS", False):
+            return iter(self.items_with_products())
+        if self._snapshot is not None:
+            return iter(self._snapshot)
+        return iter(self._items_qs().select_related("content_type"))
 
     def __len__(self):
         return self.count()
 
     def __contains__(self, product):
+        if (
+            self._lines is None
+            and self._snapshot is None
+            and not self._lines_probed
+            and self._is_persisted()
+        ):
+            self._probe_lines()
         return self._get_item(product) is not None
 
+    def items_page(
+        self, after: int | None = None, limit: int = 50, with_products: bool = True
+    ) -> list[models.Item]:
+        """
+        Return up to *limit* items with a primary key greater than *after*.
+
+        Keyset pagination on ``Item.pk``: each page is one indexed
+        ``WHERE id > after ORDER BY id LIMIT n`` query, however deep the
+        page, plus one product query per product model when
+        *with_products* is set (see :meth:`items_with_products`). Pass
+        the last item's ``pk`` as *after* to fetch the next page; a page
+        shorter than *limit* is the last one.
+
+        :param after: Primary key of the last item already seen, or
+            ``None`` for the first page.
+        :param limit: Maximum number of items to return.
+        :param with_products: Prefetch ``item.product`` for the page.
+
+        Example::
+
+            page = cart.items_page(after=request.GET.get("after"), limit=50)
+            next_after = page[-1].pk if len(page) == 50 else None
+        """
+        if limit < 1:
+            raise ValueError("limit must be a positive integer.")
+        if self._stateless:
+            # Stored lines have no primary key to page on; they are few
+            # and come back in insertion order.
+            items = list(self._snapshot or [])[:limit] if after is None else []
+        elif self._snapshot is not None:
+            items = sorted(
+                (i for i in self._snapshot if after is None or i.pk > int(after)),
+                key=lambda i: i.pk,
+            )[:limit]
+        else:
+            qs = self._items_qs().select_related("content_type").order_by("pk")
+            if after is not None:
+                qs = qs.filter(pk__gt=after)
+            items = list(qs[:limit])
+        if with_products:
+            from .loaders import prefetch_products
+
+            prefetch_products(items)
+        return items
+
+    def iter_items(
+        self, chunk_size: int = 500, with_products: bool = True
+    ) -> Iterator[models.Item]:
+        """
+        Yield every item, fetching *chunk_size* lines per query.
+
+        Built on :meth:`items_page`, so only one chunk (and its products)
+        is held in memory at a time — use it instead of ``for item in
+        cart`` / :meth:`items_with_products` for carts with thousands of
+        lines. Items come in primary-key order. Lines added or removed
+        while iterating may or may not be seen.
+
+        :param chunk_size: Lines fetched per query.
+        :param with_products: Prefetch ``item.product`` chunk by chunk.
+        """
+        if self._stateless:
+            lines = max(len(self._snapshot or []), 1)
+            yield from self.items_page(limit=lines, with_products=with_products)
+            return
+        after = None
+        while True:
+            page = self.items_page(
+                after=after, limit=chunk_size, with_products=with_products
+            )
+            yield from page
+            if len(page) < chunk_size:
+                return
+            after = page[-1].pk
+
     def items_with_products(self) -> list[models.Item]:
         """Return the cart's items with their ``.product`` attribute prefetched.
 
@@ -257,39 +954,30 @@ class Cart:
 
         This method batches the product lookups: one ``SELECT`` on
         ``Item`` (with ``select_related('content_type')``) plus one
-        ``in_bulk`` per distinct content type. A 100-item cart split
-        across 3 product models drops from ~100 queries to 4. Items
-        whose underlying product row was deleted are left un-prefetched
-        so the existing ``.product`` ``DoesNotExist`` semantic is
-        preserved on that first access.
+        ``in_bulk`` per distinct content type, each shaped by the
+        model's ``CART_PRODUCT_LOADERS`` spec (see :mod:`cart.loaders`).
+        A 100-item cart split across 3 product models drops from ~100
+        queries to 4. Items whose underlying product row was deleted are
+        left un-prefetched so the existing ``.product`` ``DoesNotExist``
+        semantic is preserved on that first access.
 
         Use this method when you iterate the cart and read the concrete
         product — templates rendering a line-item table are the common
         case. Plain iteration is fine when you only read ``.quantity``,
-        ``.unit_price``, or ``.total_price``.
+        ``.unit_price``, or ``.total_price``; with
+        ``CART_PREFETCH_PRODUCTS = True`` it delegates here.
 
         Returns:
             A list of :class:`cart.models.Item` with ``.product``
             pre-cached on each item (where the row still exists).
         """
-        from collections import defaultdict
-
-        items = list(self.cart.items.select_related("content_type").all())
-        items_by_ct: dict = defaultdict(list)
-        for item in items:
-            items_by_ct[item.content_type].append(item)
-
-        for content_type, grouped in items_by_ct.items():
-            ids = [i.object_id for i in grouped]
-            products_by_id = content_type.model_class().objects.in_bulk(ids)
-            for item in grouped:
-                product = products_by_id.get(item.object_id)
-                if product is not None:
-                    item._product_cache = product
-                # else: leave _product_cache unset — Item.product will
-                # hit the DB on first access and raise DoesNotExist,
-                # matching the plain-iteration contract.
+        from .loaders import prefetch_products
 
+        if self._snapshot is not None:
+            items = list(self._snapshot)
+        else:
+            items = list(self._items_qs().select_related("content_type"))
+        prefetch_products(items)
         return items
 
     # ------------------------------------------------------------------
@@ -310,6 +998,11 @@ class Cart:
         If the product is already present its quantity is incremented and the
         unit price is updated to *unit_price*.
 
+        With ``CART_UPSERT_ADD = True`` the write is a single
+        ``INSERT … ON CONFLICT DO UPDATE SET quantity = quantity + n``
+        (an ``F()`` increment on backends without conflict support), so
+        concurrent adds of the same product never lose an increment.
+
         :param product: Any Django model instance.
         :param unit_price: Price per unit as a :class:`~decimal.Decimal`.
         :param quantity: Number of units to add (must be ≥ 1).
@@ -324,26 +1017,57 @@ class Cart:
             raise InvalidQuantity("Quantity must be at least 1.")
 
         if validate_price:
-            actual_price = getattr(product, "price", None)
-            if actual_price is not None and unit_price != actual_price:
-                raise PriceMismatchError(
-                    f"Price mismatch: expected {actual_price}, got {unit_price}."
-                )
+            _validate_price(product, unit_price)
 
         max_qty = getattr(settings, "CART_MAX_QUANTITY_PER_ITEM", None)
         if max_qty is not None and int(quantity) > max_qty:
             raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
 
-        with transaction.atomic():
+        if self._stateless:
+            item = self._stored_add(
+                product, unit_price, int(quantity), max_qty, check_inventory
+            )
+        elif getattr(settings, "CART_UPSERT_ADD", False):
+            self._ensure_persisted()
+            item = self._upsert_add(
+                product, unit_price, int(quantity), max_qty, check_inventory
+            )
+        else:
+            self._ensure_persisted()
+            item = self._select_then_add(
+                product, unit_price, int(quantity), max_qty, check_inventory
+            )
+
+        self._mutated()
+        if cart_item_added is not None:
+            cart_item_added.send(sender=self.__class__, cart=self.cart, item=item)
+        return item
+
+    def _select_then_add(
+        self,
+        product,
+        unit_price: Decimal,
+        quantity: int,
+        max_qty: int | None,
+        check_inventory: bool,
+    ) -> models.Item:
+        """Default :meth:`add` path: look the line up, then update or insert.
+
+        The line is always re-read (and locked) rather than taken from
+        the facade's remembered lines, so an add never builds on a
+        quantity — or a missing row — another request has since changed.
+        """
+        key = self._product_key(product)
+        with self._mutation():
             existing_qty = 0
-            item = self._get_item(product)
+            item = self._reread_line(key)
             if item:
                 existing_qty = item.quantity
-                item.unit_price = unit_price
-                item.quantity += int(quantity)
-                if max_qty is not None and item.quantity > max_qty:
+                if max_qty is not None and existing_qty + quantity > max_qty:
                     raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
-                item.save(update_fields=["unit_price", "quantity"])
+                item.unit_price = unit_price
+                item.quantity += quantity
+                self._save_line(item, ["unit_price", "quantity"])
             else:
                 # ``product=`` is rewritten by ItemManager._inject_content_type —
                 # django-stubs can't follow the translation.
@@ -351,22 +1075,95 @@ class Cart:
                     cart=self.cart,
                     product=product,  # type: ignore[misc]
                     unit_price=unit_price,
-                    quantity=int(quantity),
+                    quantity=quantity,
                 )
+                self._remember_line(key, item)
 
             if check_inventory:
                 from .inventory import get_inventory_checker
 
                 checker = get_inventory_checker()
-                total_qty = existing_qty + int(quantity)
+                total_qty = existing_qty + quantity
                 if not checker.check(product, total_qty):
                     if item.pk:
                         item.delete()
                     raise InsufficientStock(f"Not enough {product} stock available.")
 
-        self._invalidate_cache()
-        if cart_item_added is not None:
-            cart_item_added.send(sender=self.__class__, cart=self.cart, item=item)
+            return item
+
+    def _upsert_add(
+        self,
+        product,
+        unit_price: Decimal,
+        quantity: int,
+        max_qty: int | None,
+        check_inventory: bool,
+    ) -> models.Item:
+        """``CART_UPSERT_ADD`` path for :meth:`add`.
+
+        One ``INSERT … ON CONFLICT DO UPDATE`` (see
+        :meth:`cart.models.ItemManager.increment_or_create`) replaces the
+        ``SELECT`` + ``UPDATE``/``INSERT`` pair, so a double-clicked
+        "add" can't lose an increment. Only an inventory check needs a
+        surrounding transaction — to roll the write back on failure.
+        """
+        content_type_id, object_id = self._product_key(product)
+        with self._mutation(atomic=check_inventory):
+            item = models.Item.objects.increment_or_create(
+                cart=self.cart,
+                content_type_id=content_type_id,
+                object_id=object_id,
+                quantity=quantity,
+                unit_price=unit_price,
+                max_quantity=max_qty,
+            )
+            if item is None:
+                raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+            if check_inventory:
+                from .inventory import get_inventory_checker
+
+                checker = get_inventory_checker()
+                if not checker.check(product, item.quantity):
+                    raise InsufficientStock(f"Not enough {product} stock available.")
+
+        self._remember_line((content_type_id, object_id), item)
+        return item
+
+    def _stored_add(
+        self,
+        product,
+        unit_price: Decimal,
+        quantity: int,
+        max_qty: int | None,
+        check_inventory: bool,
+    ) -> models.Item:
+        """Stateless :meth:`add` path: change the in-memory line, then store.
+
+        There is no transaction to roll back, so the quantity cap and the
+        inventory are checked before the line is touched.
+        """
+        key = self._product_key(product)
+        item = self._get_item(product)
+        total_qty = quantity + (item.quantity if item is not None else 0)
+        if max_qty is not None and total_qty > max_qty:
+            raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+        if check_inventory:
+            from .inventory import get_inventory_checker
+
+            if not get_inventory_checker().check(product, total_qty):
+                raise InsufficientStock(f"Not enough {product} stock available.")
+
+        if item is None:
+            item = models.Item(
+                cart=self.cart,
+                content_type=ContentType.objects.get_for_id(key[0]),
+                object_id=key[1],
+            )
+            self._snapshot = [*(self._snapshot or []), item]
+            self._remember_line(key, item)
+        item.unit_price = unit_price
+        item.quantity = total_qty
+        self._store_lines()
         return item
 
     def remove(self, product) -> None:
@@ -375,11 +1172,24 @@ class Cart:
 
         :raises ItemDoesNotExist: if the product is not in the cart.
         """
-        item = self._get_item(product)
-        if item is None:
-            raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
-        item.delete()
-        self._invalidate_cache()
+        key = self._product_key(product)
+        with self._mutation(atomic=False):
+            if self._stateless:
+                item = self._get_item(product)
+                if item is None:
+                    raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
+                self._delete_line(item)
+            elif (
+                not self._items_qs()
+                .filter(content_type_id=key[0], object_id=key[1])
+                .delete()[0]
+            ):
+                # Keyed on the product, not a remembered row: another
+                # facade may have removed or re-added the line since.
+                self._forget_line(key)
+                raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
+        self._forget_line(key)
+        self._mutated()
         if cart_item_removed is not None:
             cart_item_removed.send(
                 sender=self.__class__, cart=self.cart, product=product
@@ -409,69 +1219,233 @@ class Cart:
             raise InvalidQuantity("Quantity cannot be negative.")
 
         if validate_price and unit_price is not None:
-            actual_price = getattr(product, "price", None)
-            if actual_price is not None and unit_price != actual_price:
-                raise PriceMismatchError(
-                    f"Price mismatch: expected {actual_price}, got {unit_price}."
-                )
+            _validate_price(product, unit_price)
 
         max_qty = getattr(settings, "CART_MAX_QUANTITY_PER_ITEM", None)
         if max_qty is not None and int(quantity) > max_qty:
             raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
 
-        with transaction.atomic():
+        key = self._product_key(product)
+        changes: dict = {"quantity": int(quantity)}
+        if unit_price is not None:
+            changes["unit_price"] = unit_price
+
+        with self._mutation():
             item = self._get_item(product)
+            if item is None and not self._stateless:
+                # A remembered miss may be stale: check before refusing.
+                item = self._reread_line(key)
             if item is None:
                 raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
 
             if int(quantity) == 0:
-                item.delete()
-                self._invalidate_cache()
+                if not self._delete_line(item):
+                    # Deleted (and perhaps re-added) by another facade.
+                    item = self._reread_line(key)
+                    if item is None or not self._delete_line(item):
+                        raise ItemDoesNotExist(
+                            f"Product {product!r} is not in this cart."
+                        )
+                self._forget_line(key)
+                self._mutated()
                 if cart_item_updated is not None:
                     cart_item_updated.send(
                         sender=self.__class__, cart=self.cart, item=item, deleted=True
                     )
                 return item
 
-            item.quantity = int(quantity)
-            update_fields = ["quantity"]
-            if unit_price is not None:
-                item.unit_price = unit_price
-                update_fields.append("unit_price")
-            item.save(update_fields=update_fields)
-        self._invalidate_cache()
+            for name, value in changes.items():
+                setattr(item, name, value)
+            if not self._save_line(item, list(changes)):
+                # The remembered row was deleted (and perhaps re-added)
+                # by another facade since it was looked up.
+                item = self._reread_line(key)
+                if item is None:
+                    raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
+                for name, value in changes.items():
+                    setattr(item, name, value)
+                self._save_line(item, list(changes))
+        self._mutated()
         if cart_item_updated is not None:
             cart_item_updated.send(sender=self.__class__, cart=self.cart, item=item)
         return item
 
+    def remove_many(self, products) -> None:
+        """
+        Remove several products from the cart with a single ``DELETE``.
+
+        Every product is checked against the line index first; nothing
+        is deleted unless all of them are in the cart. Sends one
+        ``cart_items_removed`` signal for the whole batch.
+
+        :param products: Iterable of Django model instances.
+        :raises ItemDoesNotExist: if any product is not in the cart.
+        """
+        products = list(products)
+        if not products:
+            return
+        keys = [self._product_key(product) for product in products]
+        index = self._lines_for(keys)
+        for product, key in zip(products, keys):
+            if key not in index:
+                raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
+
+        if self._stateless:
+            self._drop_stored_lines(index[key] for key in keys)
+            self._store_lines()
+        else:
+            with self._mutation(atomic=False):
+                models.Item.objects.filter(
+                    cart=self.cart, pk__in=[index[key].pk for key in keys]
+                ).delete()
+        for key in keys:
+            self._forget_line(key)
+        self._mutated()
+        if cart_items_removed is not None:
+            cart_items_removed.send(
+                sender=self.__class__, cart=self.cart, products=products
+            )
+
+    def update_many(self, quantities: dict) -> list[models.Item]:
+        """
+        Set the quantity of several products at once.
+
+        Validation matches :meth:`update` and runs for the whole batch
+        before anything is written. Lines set to 0 are removed with one
+        ``DELETE``; the rest are written with one ``UPDATE … SET quantity
+        = CASE … WHEN … END``. Sends one ``cart_items_updated`` signal
+        with the updated items and the deleted ones.
+
+        :param quantities: Mapping of product instance to new quantity
+            (0 = remove the line).
+        :returns: The updated (not deleted) :class:`~cart.models.Item`
+            instances, in input order.
+        :raises ItemDoesNotExist: if any product is not in the cart.
+        :raises InvalidQuantity: if any quantity is negative or exceeds
+            CART_MAX_QUANTITY_PER_ITEM.
+
+        Example::
+
+            cart.update_many({product1: 3, product2: 0})
+        """
+        if not quantities:
+            return []
+        max_qty = getattr(settings, "CART_MAX_QUANTITY_PER_ITEM", None)
+        rows = []
+        for product, quantity in quantities.items():
+            quantity = int(quantity)
+            if quantity < 0:
+                raise InvalidQuantity("Quantity cannot be negative.")
+            if max_qty is not None and quantity > max_qty:
+                raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+            rows.append((product, self._product_key(product), quantity))
+
+        index = self._lines_for(key for _product, key, _quantity in rows)
+        to_update: list[models.Item] = []
+        to_delete: dict[tuple[int, int], models.Item] = {}
+        new_quantities: list[int] = []
+        for product, key, quantity in rows:
+            item = index.get(key)
+            if item is None:
+                raise ItemDoesNotExist(f"Product {product!r} is not in this cart.")
+            if quantity == 0:
+                to_delete[key] = item
+            else:
+                to_update.append(item)
+                new_quantities.append(quantity)
+
+        if self._stateless:
+            for item, quantity in zip(to_update, new_quantities):
+                item.quantity = quantity
+            self._drop_stored_lines(to_delete.values())
+            self._store_lines()
+        else:
+            with self._mutation():
+                if to_delete:
+                    models.Item.objects.filter(
+                        cart=self.cart,
+                        pk__in=[item.pk for item in to_delete.values()],
+                    ).delete()
+                if to_update:
+                    for item, quantity in zip(to_update, new_quantities):
+                        item.quantity = quantity
+                    models.Item.objects.bulk_update(to_update, ["quantity"])
+
+        for key in to_delete:
+            self._forget_line(key)
+        self._mutated()
+        if cart_items_updated is not None:
+            cart_items_updated.send(
+                sender=self.__class__,
+                cart=self.cart,
+                items=to_update,
+                deleted=list(to_delete.values()),
+            )
+        return to_update
+
+    def totals(self) -> CartTotals:
+        """Return the unit count, line count and subtotal in one query.
+
+        A single ``SUM(quantity)`` / ``COUNT(id)`` /
+        ``SUM(quantity * unit_price)`` aggregate fills all three, so
+        :meth:`count`, :meth:`unique_count`, :meth:`summary`,
+        :meth:`is_empty`, :meth:`can_checkout` and :meth:`checkout` share
+        one round trip per facade (none with a snapshot or a warm
+        ``CART_CACHE``). With ``CART_DENORMALIZED_TOTALS`` the values come
+        from the cart row's own columns instead.
+        """
+        if "totals" in self._cache:
+            return self._cache["totals"]
+        if self._snapshot is not None:
+            totals = CartTotals(
+                count=sum(item.quantity for item in self._snapshot),
+                unique_count=len(self._snapshot),
+                summary=sum(
+                    (item.total_price for item in self._snapshot), Decimal("0.00")
+                ),
+            )
+        elif getattr(settings, "CART_DENORMALIZED_TOTALS", False):
+            totals = self._stored_totals()
+        else:
+            totals = self._shared("totals", self._aggregate_totals)
+        self._cache["totals"] = totals
+        return totals
+
+    def _aggregate_totals(self) -> CartTotals:
+        result = self._items_qs().aggregate(
+            count=Sum("quantity"),
+            unique_count=Count("id"),
+            summary=Sum(F("quantity") * F("unit_price")),
+        )
+        return CartTotals(
+            count=result["count"] or 0,
+            unique_count=result["unique_count"] or 0,
+            summary=result["summary"] or Decimal("0.00"),
+        )
+
     def count(self) -> int:
         """Return the total number of *units* across all items."""
-        if "count" in self._cache:
-            return self._cache["count"]
-        result = self.cart.items.aggregate(total=Sum("quantity"))["total"]
-        count = result or 0
-        self._cache["count"] = count
-        return count
+        return self.totals().count
 
     def unique_count(self) -> int:
         """Return the number of distinct products in the cart."""
-        return self.cart.items.count()
+        return self.totals().unique_count
 
     def summary(self) -> Decimal:
         """Return the grand total price for all items."""
-        if "summary" in self._cache:
-            return self._cache["summary"]
-        result = self.cart.items.aggregate(total=Sum(F("quantity") * F("unit_price")))[
-            "total"
-        ]
-        summary = result or Decimal("0.00")
-        self._cache["summary"] = summary
-        return summary
+        return self.totals().summary
 
     def clear(self) -> None:
         """Remove all items from the cart (but keep the cart record)."""
-        self.cart.items.all().delete()
-        self._invalidate_cache()
+        if self._is_persisted():
+            with self._mutation(atomic=False):
+                self.cart.items.all().delete()
+        elif self._stateless:
+            self._snapshot = []
+            self._store_lines()
+        self._lines = {}
+        self._line_memo = {}
+        self._mutated()
         if cart_cleared is not None:
             cart_cleared.send(sender=self.__class__, cart=self.cart)
 
@@ -505,11 +1479,16 @@ class Cart:
         ``self.cart.checked_out`` handles the common case where the
         same facade is called twice.
 
+        With ``CART_OPTIMISTIC_LOCKING`` on, no row locks are taken; see
+        :meth:`_checkout_optimistic`.
+
         :raises CartException: if the cart is empty.
         :raises MinimumOrderNotMet: if the cart total is below
             ``settings.CART_MIN_ORDER_AMOUNT``.
         :raises InvalidDiscountError: if an applied discount fails
             revalidation at checkout time.
+        :raises ConcurrentModification: with ``CART_OPTIMISTIC_LOCKING``,
+            if the cart changed after this facade read it.
         """
         if self.cart.checked_out:
             return
@@ -524,32 +1503,127 @@ class Cart:
                 f"order amount of {min_amount}."
             )
 
-        with transaction.atomic():
-            locked_cart = models.Cart.objects.select_for_update().get(pk=self.cart.pk)
-            if locked_cart.checked_out:
-                self.cart.checked_out = True
+        # A stateless cart is promoted to a row first.
+        self._ensure_persisted()
+        if self._optimistic():
+            if not self._checkout_optimistic():
                 return
-
-            if locked_cart.discount_id is not None:
-                locked_discount = models.Discount.objects.select_for_update().get(
-                    pk=locked_cart.discount_id
+        else:
+            with transaction.atomic():
+                locked_cart = models.Cart.objects.select_for_update().get(
+                    pk=self.cart.pk
                 )
-                is_valid, message = locked_discount.is_valid_for_cart(self)
-                if not is_valid:
-                    raise InvalidDiscountError(message)
-                locked_discount.increment_usage()
+                if locked_cart.checked_out:
+                    self.cart.checked_out = True
+                    return
 
-            locked_cart.checked_out = True
-            locked_cart.save(update_fields=["checked_out"])
-            self.cart.checked_out = True
+                if locked_cart.discount_id is not None:
+                    locked_discount = models.Discount.objects.select_for_update().get(
+                        pk=locked_cart.discount_id
+                    )
+                    is_valid, message = locked_discount.is_valid_for_cart(self)
+                    if not is_valid:
+                        raise InvalidDiscountError(message)
+                    locked_discount.increment_usage()
+
+                locked_cart.checked_out = True
+                locked_cart.save(update_fields=["checked_out"])
+                self.cart.checked_out = True
 
+        # Bump the cache version so ``etag()`` changes for the next request.
+        self._mutated()
         if cart_checked_out is not None:
             cart_checked_out.send(sender=self.__class__, cart=self.cart)
 
+    def _checkout_optimistic(self) -> bool:
+        """Lock-free :meth:`checkout` for ``CART_OPTIMISTIC_LOCKING``.
+
+        The cart is claimed and flagged in one compare-and-swap
+        ``UPDATE … WHERE version = <read version> AND checked_out =
+        false``, so the checks :meth:`checkout` ran against this facade's
+        view of the cart still hold when it commits. The discount cap is
+        enforced by :meth:`cart.models.Discount.claim_usage`'s
+        conditional ``UPDATE`` instead of a ``SELECT … FOR UPDATE``.
+
+        :returns: ``False`` if another facade already checked the cart out.
+        :raises ConcurrentModification: if the cart changed since it was read.
+        :raises InvalidDiscountError: if the applied discount is no longer
+            valid or has no uses left.
+        """
+        with transaction.atomic():
+            claimed = models.Cart.objects.filter(
+                pk=self.cart.pk, version=self.cart.version, checked_out=False
+            ).update(checked_out=True, version=F("version") + 1)
+            if not claimed:
+                self._reload_after_conflict()
+                if self.cart.checked_out:
+                    return False
+                raise ConcurrentModification(
+                    f"Cart {self.cart.pk} was modified concurrently; "
+                    "retry the operation."
+                )
+
+            if self.cart.discount_id is not None:
+                discount = models.Discount.objects.get(pk=self.cart.discount_id)
+                is_valid, message = discount.is_valid_for_cart(self)
+                if not is_valid:
+                    raise InvalidDiscountError(message)
+                if not discount.claim_usage():
+                    raise InvalidDiscountError(
+                        "This discount has reached its maximum number of uses."
+                    )
+
+        self.cart.version += 1
+        self.cart.checked_out = True
+        return True
+
     def is_empty(self) -> bool:
         """Return ``True`` if the cart contains no items."""
         return self.count() == 0
 
+    def etag(self) -> str:
+        """
+        Return a fingerprint of the cart's content.
+
+        Stable while the lines (``content_type_id``, ``object_id``,
+        ``quantity``, ``unit_price``) and the applied discount stay the
+        same, so it can back HTTP ``ETag`` / ``If-None-Match`` handling
+        (see :func:`cart.decorators.cart_condition`).
+
+        With ``CART_CACHE`` configured this is the cart's cache version —
+        no query at all. With ``CART_OPTIMISTIC_LOCKING`` it is the row's
+        ``version``, also without a query. Otherwise it is a hash over
+        the lines, read with one narrow ``values_list`` query (or from
+        the snapshot). A cart without a row returns ``"empty"`` unless it
+        is a stateless cart with lines, which is hashed like the rest.
+        """
+        if self._is_persisted():
+            cache = get_cart_cache()
+            if cache is not None:
+                return version_etag(cache, self.cart.pk)
+            if getattr(settings, "CART_OPTIMISTIC_LOCKING", False):
+                return f"{self.cart.pk}-r{self.cart.version}"
+        elif not self._snapshot and self.cart.discount is None:
+            return "empty"
+        if self._snapshot is not None:
+            lines = sorted(
+                (i.content_type_id, i.object_id, i.quantity, i.unit_price)
+                for i in self._snapshot
+            )
+        else:
+            lines = list(
+                self._items_qs()
+                .order_by("content_type_id", "object_id")
+                .values_list("content_type_id", "object_id", "quantity", "unit_price")
+            )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.cart.pk}|{self.cart.discount_id}".encode())
+        for content_type_id, object_id, quantity, unit_price in lines:
+            digest.update(
+                f"|{content_type_id}:{object_id}:{quantity}:{unit_price}".encode()
+            )
+        return digest.hexdigest()
+
     def cart_serializable(self) -> dict:
         """
         Return a JSON-serialisable dict representation of the cart.
@@ -581,20 +1655,39 @@ class Cart:
         intentionally *not* serialised: re-bind on login via
         :meth:`bind_to_user` rather than trusting restore-side data.
         """
-        payload: dict = {
-            f"{item.content_type_id}:{item.object_id}": {
-                "content_type_id": item.content_type_id,
-                "object_id": item.object_id,
-                "quantity": item.quantity,
-                "unit_price": str(item.unit_price),
-                "total_price": str(item.total_price),
-            }
-            for item in self.cart.items.all()
-        }
+        items = self._snapshot if self._snapshot is not None else self._items_qs()
+        payload: dict = dict(self._serializable_entry(item) for item in items)
         if self.cart.discount is not None:
             payload["__discount__"] = {"code": self.cart.discount.code}
         return payload
 
+    def iter_serializable(self, chunk_size: int = 500) -> Iterator[tuple[str, dict]]:
+        """
+        Yield :meth:`cart_serializable` as ``(key, value)`` pairs, in chunks.
+
+        Walks the lines with :meth:`iter_items` (no product loads) so
+        memory stays bounded for carts with tens of thousands of lines —
+        feed the pairs to a streaming JSON encoder or write them out as
+        they come. ``dict(cart.iter_serializable())`` equals
+        ``cart.cart_serializable()``; ``__discount__`` comes last.
+
+        :param chunk_size: Lines fetched per query.
+        """
+        for item in self.iter_items(chunk_size=chunk_size, with_products=False):
+            yield self._serializable_entry(item)
+        if self.cart.discount is not None:
+            yield "__discount__", {"code": self.cart.discount.code}
+
+    @staticmethod
+    def _serializable_entry(item: models.Item) -> tuple[str, dict]:
+        return f"{item.content_type_id}:{item.object_id}", {
+            "content_type_id": item.content_type_id,
+            "object_id": item.object_id,
+            "quantity": item.quantity,
+            "unit_price": str(item.unit_price),
+            "total_price": str(item.total_price),
+        }
+
     @classmethod
     def from_serializable(cls, request, data: dict) -> "Cart":
         """
@@ -605,6 +1698,11 @@ class Cart:
         from another (P1-D fix, v3.0.13). Existing items are updated
         in place; missing items are created from the payload.
 
+        Every key is parsed before anything is written. Existing lines
+        are then fetched with one query and the payload is applied with
+        one ``bulk_create`` and one ``bulk_update``, regardless of how
+        many entries it carries.
+
         Keys may be either the new ``"<content_type_id>:<object_id>"``
         composite format or the legacy plain ``str(object_id)`` form.
         In the legacy case, ``content_type_id`` must be supplied in the
@@ -624,26 +1722,28 @@ class Cart:
             # ...later, possibly from a different request...
             restored = Cart.from_serializable(new_request, serialised)
         """
-        cart = cls(request)
-        with transaction.atomic():
-            for key, item_data in data.items():
-                if key.startswith("__") and key.endswith("__"):
-                    continue  # reserved cart-level metadata, handled below
-                content_type_id, object_id = _parse_serializable_key(key, item_data)
+        entries: dict[tuple[int, int], dict] = {}
+        for key, item_data in data.items():
+            if key.startswith("__") and key.endswith("__"):
+                continue  # reserved cart-level metadata, handled below
+            entries[_parse_serializable_key(key, item_data)] = item_data
 
-                item = models.Item.objects.filter(
-                    cart=cart.cart,
-                    content_type_id=content_type_id,
-                    object_id=object_id,
-                ).first()
+        cart = cls(request)
+        cart._ensure_persisted()
+        with cart._mutation():
+            index = cart._lines_for(entries)
+            to_create: dict[tuple[int, int], models.Item] = {}
+            to_update: list[models.Item] = []
+            for (content_type_id, object_id), item_data in entries.items():
+                item = index.get((content_type_id, object_id))
                 if item is not None:
                     item.quantity = item_data.get("quantity", item.quantity)
                     if "unit_price" in item_data:
                         item.unit_price = Decimal(item_data["unit_price"])
-                    item.save()
+                    to_update.append(item)
                     continue
 
-                models.Item.objects.create(
+                to_create[(content_type_id, object_id)] = models.Item(
                     cart=cart.cart,
                     content_type_id=content_type_id,
                     object_id=object_id,
@@ -651,6 +1751,11 @@ class Cart:
                     unit_price=Decimal(item_data.get("unit_price", "0.00")),
                 )
 
+            if to_create:
+                models.Item.objects.bulk_create(to_create.values())
+            if to_update:
+                models.Item.objects.bulk_update(to_update, ["quantity", "unit_price"])
+
             discount_data = data.get("__discount__")
             if discount_data:
                 code = discount_data.get("code")
@@ -664,13 +1769,25 @@ class Cart:
                         cart.cart.discount = discount
                         cart.cart.save(update_fields=["discount"])
 
-        cart._invalidate_cache()
+        if any(item.pk is None for item in to_create.values()):
+            cart._forget_lines()
+        else:
+            for key, item in to_create.items():
+                cart._remember_line(key, item)
+        cart._mutated()
         return cart
 
     def merge(self, other_cart: "Cart", strategy: str = "add") -> None:
         """
         Merge another cart into this one.
 
+        Works on ``(content_type_id, object_id)`` identities only — product
+        rows are never loaded. The source cart's lines are read once and
+        this cart's matching lines with one more query (either is served
+        from memory when already loaded), the strategy is resolved in
+        memory, and the result is written with one bulk insert, one bulk
+        update and one delete of the source cart's lines.
+
         :param other_cart: The cart to merge from.
         :param strategy: Merge strategy - 'add', 'replace', or 'keep_higher'.
         :raises ValueError: if strategy is invalid or cart is merged with itself.
@@ -684,16 +1801,21 @@ class Cart:
                 "Must be 'add', 'replace', or 'keep_higher'."
             )
 
-        if other_cart.is_empty():
+        source = other_cart._line_index()
+        if not source:
             return
 
         max_qty = getattr(settings, "CART_MAX_QUANTITY_PER_ITEM", None)
 
-        with transaction.atomic():
-            for other_item in other_cart.cart.items.all():
-                existing_item = self._get_item(other_item.product)
+        self._ensure_persisted()
+        with self._mutation():
+            target = self._lines_for(source)
+            to_create: dict[tuple[int, int], models.Item] = {}
+            to_update: list[models.Item] = []
+            for key, other_item in source.items():
+                existing_item = target.get(key)
 
-                if existing_item:
+                if existing_item is not None:
                     if strategy == "add":
                         new_quantity = existing_item.quantity + other_item.quantity
                     elif strategy == "replace":
@@ -706,24 +1828,33 @@ class Cart:
 
                     existing_item.quantity = new_quantity
                     existing_item.unit_price = other_item.unit_price
-                    existing_item.save(update_fields=["quantity", "unit_price"])
+                    to_update.append(existing_item)
                 else:
                     new_quantity = other_item.quantity
                     if max_qty is not None and new_quantity > max_qty:
                         new_quantity = max_qty
 
-                    # ``product=`` goes through ItemManager._inject_content_type —
-                    # django-stubs can't follow the kwarg translation.
-                    models.Item.objects.create(
+                    to_create[key] = models.Item(
                         cart=self.cart,
-                        product=other_item.product,  # type: ignore[misc]
+                        content_type_id=key[0],
+                        object_id=key[1],
                         unit_price=other_item.unit_price,
                         quantity=new_quantity,
                     )
 
+            if to_create:
+                models.Item.objects.bulk_create(to_create.values())
+            if to_update:
+                models.Item.objects.bulk_update(to_update, ["quantity", "unit_price"])
+
             other_cart.clear()
 
-        self._invalidate_cache()
+        if any(item.pk is None for item in to_create.values()):
+            self._forget_lines()
+        else:
+            for key, item in to_create.items():
+                self._remember_line(key, item)
+        self._mutated()
 
     def bind_to_user(self, user) -> None:
         """
@@ -731,8 +1862,9 @@ class Cart:
 
         :param user: Django User model instance.
         """
+        self._ensure_persisted()
         self.cart.user = user
-        self.cart.save(update_fields=["user"])
+        self._save_cart(["user"])
 
     @classmethod
     def get_user_carts(cls, user) -> QuerySet[models.Cart]:
@@ -765,13 +1897,29 @@ class Cart:
         """
         return models.Cart.objects.filter(user=user, checked_out=False)
 
-    def add_bulk(self, items: list[dict]) -> list[models.Item]:
+    def add_bulk(
+        self, items: list[dict], check_inventory: bool = False
+    ) -> list[models.Item]:
         """
         Add multiple items efficiently.
 
+        Each entry *sets* the line's quantity and unit price (an existing
+        line is overwritten, not incremented). The whole batch is
+        validated before anything is written, then applied set-wise: one
+        ``SELECT`` of the batch's existing lines (skipped when they are
+        already known), one ``bulk_create`` and one ``bulk_update`` —
+        independent of the batch size. Content types are resolved once
+        per product model. If the same product appears more than once,
+        the last entry wins.
+
         :param items: List of dicts with 'product', 'unit_price', 'quantity' keys.
-        :returns: List of created/updated Item instances.
+        :param check_inventory: If True, validate the whole batch with a
+            single :meth:`~cart.inventory.InventoryChecker.check_many` call
+            before writing.
+        :returns: List of created/updated Item instances, in input order.
         :raises InvalidQuantity: if any item exceeds CART_MAX_QUANTITY_PER_ITEM.
+        :raises InsufficientStock: if check_inventory=True and any product
+            is out of stock.
 
         Example::
 
@@ -784,37 +1932,74 @@ class Cart:
             return []
 
         max_qty = getattr(settings, "CART_MAX_QUANTITY_PER_ITEM", None)
-        result = []
-
-        with transaction.atomic():
-            for item_data in items:
-                product = item_data["product"]
-                unit_price = item_data["unit_price"]
-                quantity = int(item_data["quantity"])
-
-                if quantity < 1:
-                    raise InvalidQuantity("Quantity must be at least 1.")
-
-                if max_qty is not None and quantity > max_qty:
-                    raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
-
-                item = self._get_item(product)
-                if item:
-                    item.unit_price = unit_price
-                    item.quantity = quantity
-                    item.save(update_fields=["unit_price", "quantity"])
-                else:
-                    # ``product=`` goes through ItemManager._inject_content_type —
-                    # django-stubs can't follow the kwarg translation.
-                    item = models.Item.objects.create(
+        content_types: dict = {}
+        rows = []
+
+        for item_data in items:
+            product = item_data["product"]
+            quantity = int(item_data["quantity"])
+
+            if quantity < 1:
+                raise InvalidQuantity("Quantity must be at least 1.")
+
+            if max_qty is not None and quantity > max_qty:
+                raise InvalidQuantity(f"Quantity cannot exceed {max_qty}.")
+
+            model = product._meta.model
+            if model not in content_types:
+                content_types[model] = ContentType.objects.get_for_model(model)
+            key = (content_types[model].id, product.pk)
+            rows.append((key, product, item_data["unit_price"], quantity))
+
+        if check_inventory:
+            from .inventory import get_inventory_checker
+
+            checker = get_inventory_checker()
+            unavailable = checker.check_many([(row[1], row[3]) for row in rows])
+            if unavailable:
+                raise InsufficientStock(f"Not enough {unavailable[0]} stock available.")
+
+        self._ensure_persisted()
+        with self._mutation():
+            index = self._lines_for(row[0] for row in rows)
+            to_create: dict[tuple[int, int], models.Item] = {}
+            to_update: dict[tuple[int, int], models.Item] = {}
+            for key, _product, unit_price, quantity in rows:
+                item = index.get(key) or to_create.get(key)
+                if item is None:
+                    item = models.Item(
                         cart=self.cart,
-                        product=product,  # type: ignore[misc]
+                        content_type_id=key[0],
+                        object_id=key[1],
                         unit_price=unit_price,
                         quantity=quantity,
                     )
-                result.append(item)
+                    to_create[key] = item
+                else:
+                    item.unit_price = unit_price
+                    item.quantity = quantity
+                    if item.pk is not None:
+                        to_update[key] = item
+
+            if to_create:
+                models.Item.objects.bulk_create(to_create.values())
+            if to_update:
+                models.Item.objects.bulk_update(
+                    to_update.values(), ["unit_price", "quantity"]
+                )
 
-        self._invalidate_cache()
+            if any(item.pk is None for item in to_create.values()):
+                # Backend can't return primary keys from a bulk insert
+                # (MySQL / MariaDB); reload so callers get saved rows.
+                self._forget_lines()
+                index = self._lines_for(row[0] for row in rows)
+            else:
+                for key, item in to_create.items():
+                    self._remember_line(key, item)
+                index.update(to_create)
+            result = [index[row[0]] for row in rows]
+
+        self._mutated()
         return result
 
     def discount_amount(self) -> Decimal:
@@ -880,9 +2065,14 @@ class Cart:
         if not is_valid:
             raise InvalidDiscountError(message)
 
-        self.cart.discount = discount
-        self.cart.save(update_fields=["discount"])
-        self._invalidate_cache()
+        if self._stateless:
+            self.cart.discount = discount
+            self._store_lines()
+        else:
+            self._ensure_persisted()
+            self.cart.discount = discount
+            self._save_cart(["discount"])
+        self._mutated()
         return discount
 
     def remove_discount(self) -> None:
@@ -895,8 +2085,11 @@ class Cart:
         """
         if self.cart.discount is not None:
             self.cart.discount = None
-            self.cart.save(update_fields=["discount"])
-            self._invalidate_cache()
+            if self._stateless:
+                self._store_lines()
+            else:
+                self._save_cart(["discount"])
+            self._mutated()
 
     def tax(self) -> Decimal:
         """
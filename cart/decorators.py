@@ -0,0 +1,73 @@
+"""View decorators for cart endpoints.
+
+:func:`cart_condition` wraps Django's
+:func:`~django.views.decorators.http.condition` with
+:meth:`cart.cart.Cart.etag`, so a polled cart endpoint answers
+``304 Not Modified`` — with no body rendering — when the client's
+``If-None-Match`` still matches the cart.
+
+Usage:
+    from cart.decorators import cart_condition
+
+    @cart_condition
+    def cart_json(request):
+        cart = request.cart  # the facade built for the ETag, reused
+        return JsonResponse(cart.cart_serializable())
+"""
+
+from functools import wraps
+from typing import Any, Callable
+
+from django.views.decorators.http import condition
+
+from .cache import get_cart_cache, version_etag
+
+
+def _cart(request) -> Any:
+    """Return the request's :class:`cart.cart.Cart`, building it once."""
+    cart = getattr(request, "cart", None)
+    if cart is None:
+        from .cart import Cart
+
+        cart = Cart(request)
+        request.cart = cart
+    return cart
+
+
+def cart_etag(request, *args: Any, **kwargs: Any) -> str:
+    """``etag_func`` for :func:`~django.views.decorators.http.condition`.
+
+    With ``CART_CACHE`` configured the ETag is read from the session's
+    cart id and the cache version alone — a ``304`` costs no query.
+    Otherwise the cart is loaded (and left on ``request.cart`` for the
+    view) and :meth:`cart.cart.Cart.etag` hashes its lines; that is also
+    the path for carts an adapter keeps in a cookie, which the cache
+    never versions.
+    """
+    cache = get_cart_cache()
+    if cache is not None and getattr(request, "cart", None) is None:
+        from .cart import Cart
+
+        session = Cart._build_session_adapter(request)
+        cart_id = session.get_or_create_cart_id()
+        if cart_id:
+            return version_etag(cache, cart_id)
+        if not session.stores_lines:
+            return "empty"
+    return _cart(request).etag()
+
+
+def cart_condition(view_func: Callable) -> Callable:
+    """Answer with ``304 Not Modified`` when the cart has not changed.
+
+    Sets the ``ETag`` header from :func:`cart_etag` and short-circuits
+    ``GET`` / ``HEAD`` requests whose ``If-None-Match`` matches it. The
+    view receives the facade as ``request.cart``.
+    """
+
+    @wraps(view_func)
+    def _view(request, *args: Any, **kwargs: Any) -> Any:
+        _cart(request)
+        return view_func(request, *args, **kwargs)
+
+    return condition(etag_func=cart_etag)(_view)
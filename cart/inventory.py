@@ -88,6 +88,26 @@ class InventoryChecker(ABC):
         """
         raise NotImplementedError("Subclasses must implement reserve()")
 
+    def check_many(self, items: list[tuple[Any, int]]) -> list[Any]:
+        """Check availability for a whole batch in one call.
+
+        Used by :meth:`cart.cart.Cart.add_bulk` with
+        ``check_inventory=True``. The default implementation calls
+        :meth:`check` once per entry; override it when your backend can
+        answer for many products at once (one ``SELECT … WHERE id IN``,
+        one stock-service request).
+
+        Args:
+            items: ``(product, quantity)`` pairs to check.
+
+        Returns:
+            The products whose requested quantity is *not* available,
+            in input order. An empty list means the whole batch passes.
+        """
+        return [
+            product for product, quantity in items if not self.check(product, quantity)
+        ]
+
     def release(self, product: Any, quantity: int) -> bool:
         """Release previously reserved inventory.
 
@@ -140,10 +160,20 @@ class DefaultInventoryChecker(InventoryChecker):
 def get_inventory_checker() -> InventoryChecker:
     """Get the configured inventory checker instance.
 
+    The instance is built once per process and shared (see
+    :mod:`cart.registry`); it is rebuilt when ``CART_INVENTORY_CHECKER``
+    changes.
+
     Returns:
         An instance of the configured InventoryChecker subclass,
         or DefaultInventoryChecker if none is configured.
     """
+    from .registry import get_instance
+
+    return get_instance("CART_INVENTORY_CHECKER", _build_inventory_checker)
+
+
+def _build_inventory_checker() -> InventoryChecker:
     from django.conf import settings
 
     checker_path = getattr(settings, "CART_INVENTORY_CHECKER", None)
@@ -162,6 +192,6 @@ def get_inventory_checker() -> InventoryChecker:
             f"({exc.__class__.__name__}: {exc}). Falling back to "
             f"DefaultInventoryChecker (always allows).",
             RuntimeWarning,
-            stacklevel=2,
+            stacklevel=4,
         )
         return DefaultInventoryChecker()
@@ -0,0 +1,119 @@
+"""Batched product loading for cart items.
+
+``Item.product`` is a generic foreign key, so touching it on every line
+of a cart costs one ``SELECT`` per line. :func:`prefetch_products` loads
+the products of many items with one query per product model, and the
+``CART_PRODUCT_LOADERS`` registry narrows each of those queries to the
+columns and relations your templates actually read.
+
+Usage:
+    1. Describe how each product model should be loaded:
+       CART_PRODUCT_LOADERS = {
+           "shop.Product": {
+               "only": ["name", "price", "image"],
+               "select_related": ["brand"],
+           },
+       }
+
+    2. Optionally make plain iteration prefetch products too:
+       CART_PREFETCH_PRODUCTS = True
+
+    3. Iterate as usual:
+       for item in cart:  # or cart.items_with_products()
+           item.product.name  # no extra query
+
+Models without an entry are loaded in full through their default
+manager. Reading a field left out of ``only`` still works but costs a
+query per product, exactly like any deferred Django field.
+"""
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable
+
+from django.core.exceptions import ImproperlyConfigured
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+
+    from cart.models import Item
+
+_LOADER_OPTIONS = frozenset({"only", "select_related"})
+
+
+def get_loader_spec(model: "type[Model]") -> dict:
+    """Return the ``CART_PRODUCT_LOADERS`` entry for *model*.
+
+    Keys are ``"app_label.ModelName"`` labels, matched case-insensitively.
+
+    Args:
+        model: The product model class.
+
+    Returns:
+        The configured spec, or an empty dict when the model has none.
+
+    Raises:
+        ImproperlyConfigured: if the spec uses an option other than
+            ``only`` or ``select_related``.
+    """
+    from django.conf import settings
+
+    loaders = getattr(settings, "CART_PRODUCT_LOADERS", None) or {}
+    for label, spec in loaders.items():
+        if label.lower() == model._meta.label_lower:
+            unknown = set(spec) - _LOADER_OPTIONS
+            if unknown:
+                raise ImproperlyConfigured(
+                    f"CART_PRODUCT_LOADERS[{label!r}] has unknown option(s) "
+                    f"{sorted(unknown)}; expected 'only' and/or 'select_related'."
+                )
+            return spec
+    return {}
+
+
+def product_queryset(model: "type[Model]") -> "QuerySet":
+    """Return the queryset products of *model* are batch-loaded from.
+
+    Args:
+        model: The product model class.
+
+    Returns:
+        ``model._default_manager.all()`` narrowed by the model's
+        ``CART_PRODUCT_LOADERS`` spec.
+    """
+    spec = get_loader_spec(model)
+    qs = model._default_manager.all()
+    if spec.get("select_related"):
+        qs = qs.select_related(*spec["select_related"])
+    if spec.get("only"):
+        qs = qs.only(*spec["only"])
+    return qs
+
+
+def prefetch_products(items: Iterable["Item"]) -> None:
+    """Attach each item's product with one query per product model.
+
+    Items must have ``content_type`` loaded (``select_related``) to avoid
+    a content-type lookup per group. Items whose product is already
+    cached are skipped. Items whose product row was deleted — or whose
+    content type no longer resolves to a model — are left un-prefetched,
+    so ``Item.product`` keeps raising on first access.
+
+    Args:
+        items: The cart items to fill in.
+    """
+    items_by_ct: dict = defaultdict(list)
+    for item in items:
+        if not hasattr(item, "_product_cache"):
+            items_by_ct[item.content_type].append(item)
+
+    for content_type, grouped in items_by_ct.items():
+        model = content_type.model_class()
+        if model is None:
+            continue
+        products_by_id = product_queryset(model).in_bulk(
+            [item.object_id for item in grouped]
+        )
+        for item in grouped:
+            product = products_by_id.get(item.object_id)
+            if product is not None:
+                item._product_cache = product
@@ -2,8 +2,34 @@
 Management command: clean_carts
 ================================
 
-Deletes cart records (and their related items via CASCADE) that were created
-more than N days ago AND have not been checked out.
+Deletes cart records (and their related items) that were created
+more than N days ago AND have not been checked out. With
+``--inactive-days N`` carts are selected by ``last_activity`` instead
+(the last facade mutation, see ``CART_ACTIVITY_THROTTLE``), which the
+``(checked_out, last_activity)`` index answers with a range scan.
+
+Carts are deleted in primary-key-ordered batches (``last_activity``
+order with ``--inactive-days``), each in its own short transaction.
+Items are removed with a raw ``DELETE … WHERE cart_id IN (…)`` per
+batch rather than through Django's deletion collector, so memory stays
+bounded and no ``pre_delete`` / ``post_delete`` signals are sent for
+carts or items. Carts that other models point at (besides
+``Item``) still go through the collector, one batch at a time.
+
+With ``--workers N`` the eligible id range is split into N disjoint,
+contiguous partitions, each cleaned by its own process (and so its own
+database connection); the per-partition counts are summed at the end.
+SQLite allows a single writer, so there the command runs serially.
+
+With ``--archive PATH`` every batch is first appended to PATH as gzipped
+JSON Lines — one cart per line, its items in the
+:meth:`~cart.cart.Cart.cart_serializable` shape — and the batch is only
+deleted once that has been written and fsynced. Carts and items are
+streamed with ``.iterator()``, so memory stays flat however many carts
+are archived. Each batch is a complete gzip member; the file reads as
+one stream with ``gzip.open`` or ``zcat``. A crash between the fsync and
+the commit leaves that batch both archived and in the database, to be
+archived again by the next run.
 
 Usage
 -----
@@ -11,18 +37,210 @@ Usage
     python manage.py clean_carts --days 14
     python manage.py clean_carts --days 7 --include-checked-out
     python manage.py clean_carts --days 30 --dry-run
+    python manage.py clean_carts --inactive-days 30
+    python manage.py clean_carts --batch-size 5000 --sleep 0.5 --max-runtime 600
+    python manage.py clean_carts --workers 4 --dry-run
+    python manage.py clean_carts --include-checked-out --archive carts.jsonl.gz
 
 Cron job example (daily at 2 AM)
 ----------------------------------
     0 2 * * * /path/to/venv/bin/python /path/to/project/manage.py clean_carts --days 30
 """
 
+import gzip
+import json
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from datetime import timedelta
+from typing import IO, Any, Callable
 
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from django.db.models import Field, Max, Min, QuerySet
 from django.utils import timezone
 
-from cart.models import Cart
+from cart.cart import Cart as CartFacade
+from cart.models import Cart, Item
+
+# Rows fetched per round trip while streaming a batch to the archive.
+ARCHIVE_FETCH_SIZE = 500
+
+
+def _eligible(filters: dict[str, Any]) -> QuerySet[Cart]:
+    """Return the carts ``clean_carts`` deletes.
+
+    *filters* are plain ``filter()`` keyword arguments rather than a
+    queryset so they can be pickled to ``--workers`` processes.
+    """
+    return Cart.objects.filter(**filters)
+
+
+def _partitions(qs: QuerySet[Cart], workers: int) -> list[tuple[int, int]]:
+    """Split the primary-key span of *qs* into at most *workers* ranges.
+
+    The ranges are contiguous, inclusive and disjoint, so no cart is
+    visited by two workers. They are equal in id width, not in row
+    count.
+    """
+    bounds = qs.aggregate(low=Min("pk"), high=Max("pk"))
+    low, high = bounds["low"], bounds["high"]
+    if low is None:
+        return []
+    width = -(-(high - low + 1) // workers)  # ceiling division
+    return [
+        (start, min(start + width - 1, high)) for start in range(low, high + 1, width)
+    ]
+
+
+def _delete_where_in(field: Field, pks: list[int]) -> int:
+    """Run ``DELETE FROM <table> WHERE <field> IN (…)``; return the row count.
+
+    An explicit statement rather than ``QuerySet.delete()``: the deletion
+    collector would load every row of the batch (and send ``pre_delete``
+    / ``post_delete``) only to issue this same DELETE, which is what made
+    large purges slow and memory-hungry.
+    """
+    model = field.model
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    column = quote(field.column)  # type: ignore[arg-type]
+    placeholders = ", ".join(["%s"] * len(pks))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote(model._meta.db_table)} "
+            f"WHERE {column} IN ({placeholders})",
+            pks,
+        )
+        return cursor.rowcount
+
+
+def _delete_batch(pks: list[int]) -> tuple[int, int]:
+    """Delete the carts *pks* and their items; return both row counts."""
+    items_deleted = _delete_where_in(Item._meta.get_field("cart"), pks)
+    if any(rel.related_model is not Item for rel in Cart._meta.related_objects):
+        # Other models point at carts: let the collector apply their
+        # ``on_delete`` rules.
+        _, per_model = Cart.objects.filter(pk__in=pks).delete()
+        carts_deleted = per_model.get(Cart._meta.label, 0)
+    else:
+        carts_deleted = _delete_where_in(Cart._meta.pk, pks)
+    return carts_deleted, items_deleted
+
+
+def _archive_record(cart: Cart, items: list[Item]) -> dict[str, Any]:
+    """Return the archive line for *cart* and its *items*."""
+    payload = dict(CartFacade._serializable_entry(item) for item in items)
+    if cart.discount is not None:
+        payload["__discount__"] = {"code": cart.discount.code}
+    return {
+        "id": cart.pk,
+        "creation_date": cart.creation_date.isoformat(),
+        "last_activity": cart.last_activity.isoformat(),
+        "checked_out": cart.checked_out,
+        "user_id": cart.user_id,
+        "items": payload,
+    }
+
+
+def _archive_batch(fileobj: IO[bytes], pks: list[int]) -> None:
+    """Append the carts *pks* to *fileobj* as one gzip member and fsync it.
+
+    Carts and items are both streamed in primary-key order and merged,
+    so only one cart's items are held in memory at a time.
+    """
+    carts = (
+        Cart.objects.filter(pk__in=pks)
+        .select_related("discount")
+        .order_by("pk")
+        .iterator(chunk_size=ARCHIVE_FETCH_SIZE)
+    )
+    items = (
+        Item.objects.filter(cart_id__in=pks)
+        .order_by("cart_id", "pk")
+        .iterator(chunk_size=ARCHIVE_FETCH_SIZE)
+    )
+    item = next(items, None)
+    with gzip.GzipFile(fileobj=fileobj, mode="wb") as member:
+        for cart in carts:
+            lines = []
+            while item is not None and item.cart_id == cart.pk:
+                lines.append(item)
+                item = next(items, None)
+            record = _archive_record(cart, lines)
+            member.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+    fileobj.flush()
+    os.fsync(fileobj.fileno())
+
+
+def _delete_range(
+    filters: dict[str, Any],
+    id_range: tuple[int, int] | None,
+    batch_size: int,
+    pause: float,
+    max_runtime: float | None,
+    progress: Callable[[int], None] | None = None,
+    archive: IO[bytes] | None = None,
+) -> tuple[int, int, bool]:
+    """Delete eligible carts (within *id_range*, if given) batch by batch.
+
+    With *archive*, each batch is appended to that binary file (see
+    :func:`_archive_batch`) before it is deleted.
+
+    Returns:
+        ``(carts_deleted, items_deleted, finished)`` — ``finished`` is
+        ``False`` when *max_runtime* ran out first.
+    """
+    started = time.monotonic()
+    qs = _eligible(filters)
+    if id_range is not None:
+        qs = qs.filter(pk__range=id_range)
+    # Deleted rows drop out of *qs*, so each batch simply takes the next
+    # rows in index order. By activity that is the ``(checked_out,
+    # last_activity)`` index; otherwise primary-key order.
+    if "last_activity__lt" in filters:
+        qs = qs.order_by("last_activity", "pk")
+    else:
+        qs = qs.order_by("pk")
+    carts_deleted = items_deleted = 0
+    while True:
+        if max_runtime is not None and time.monotonic() - started >= max_runtime:
+            return carts_deleted, items_deleted, False
+        with transaction.atomic(using=router.db_for_write(Cart)):
+            pks = list(qs.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return carts_deleted, items_deleted, True
+            if archive is not None:
+                _archive_batch(archive, pks)
+            carts, items = _delete_batch(pks)
+        carts_deleted += carts
+        items_deleted += items
+        if progress is not None:
+            progress(carts_deleted)
+        if pause and len(pks) == batch_size:
+            time.sleep(pause)
+
+
+def _parallel_writes_supported() -> bool:
+    """Return ``False`` on SQLite, which allows one writer at a time."""
+    return connections[router.db_for_write(Cart)].vendor != "sqlite"
+
+
+def _init_worker() -> None:
+    """Process-pool initializer: make Django usable in a spawned worker."""
+    import django
+
+    django.setup()
+
+
+def _make_pool(workers: int) -> Executor:
+    """Return the process pool that runs ``--workers`` partitions.
+
+    The parent's connections are closed first so forked workers never
+    share a socket with it; each worker opens its own on first query.
+    """
+    connections.close_all()
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
 
 
 class Command(BaseCommand):
@@ -32,7 +250,8 @@ class Command(BaseCommand):
     )
 
     def add_arguments(self, parser):
-        parser.add_argument(
+        age = parser.add_mutually_exclusive_group()
+        age.add_argument(
             "--days",
             type=int,
             default=90,
@@ -40,6 +259,15 @@ class Command(BaseCommand):
                 "Remove carts created more than this many days ago. " "Defaults to 90."
             ),
         )
+        age.add_argument(
+            "--inactive-days",
+            type=int,
+            default=None,
+            help=(
+                "Remove carts whose last activity is more than this many days "
+                "ago, instead of filtering on creation date."
+            ),
+        )
         parser.add_argument(
             "--include-checked-out",
             action="store_true",
@@ -55,42 +283,204 @@ class Command(BaseCommand):
             default=False,
             help="Show how many carts would be deleted without actually deleting them.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of carts deleted per transaction. Defaults to 1000.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to pause between batches. Defaults to 0.",
+        )
+        parser.add_argument(
+            "--max-runtime",
+            type=float,
+            default=None,
+            help=(
+                "Stop starting new batches after this many seconds. "
+                "Remaining carts are left for the next run."
+            ),
+        )
+        parser.add_argument(
+            "--archive",
+            metavar="PATH",
+            default=None,
+            help=(
+                "Append each batch to PATH as gzipped JSON Lines, fsynced "
+                "before the batch is deleted."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Split the eligible id range into this many partitions and "
+                "clean them in parallel processes. Defaults to 1."
+            ),
+        )
 
     def handle(self, *args, **options):
         days = options["days"]
+        inactive_days = options["inactive_days"]
         include_checked_out = options["include_checked_out"]
         dry_run = options["dry_run"]
+        batch_size = options["batch_size"]
+        pause = options["sleep"]
+        max_runtime = options["max_runtime"]
+        workers = options["workers"]
+        archive = options["archive"]
 
         if days < 1:
             raise CommandError("--days must be a positive integer.")
+        if inactive_days is not None and inactive_days < 1:
+            raise CommandError("--inactive-days must be a positive integer.")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+        if pause < 0:
+            raise CommandError("--sleep must not be negative.")
+        if max_runtime is not None and max_runtime <= 0:
+            raise CommandError("--max-runtime must be a positive number of seconds.")
+        if workers < 1:
+            raise CommandError("--workers must be a positive integer.")
+        if archive is not None:
+            if workers > 1:
+                raise CommandError("--archive cannot be combined with --workers.")
+            directory = os.path.dirname(os.path.abspath(archive))
+            if not os.path.isdir(directory):
+                raise CommandError(f"--archive directory {directory} does not exist.")
 
-        cutoff = timezone.now() - timedelta(days=days)
-
-        qs = Cart.objects.filter(creation_date__lt=cutoff)
+        filters: dict[str, Any] = {}
         if not include_checked_out:
-            qs = qs.filter(checked_out=False)
+            filters["checked_out"] = False
+        if inactive_days is not None:
+            filters["last_activity__lt"] = timezone.now() - timedelta(
+                days=inactive_days
+            )
+            age = f"inactive for more than {inactive_days} day(s)"
+        else:
+            filters["creation_date__lt"] = timezone.now() - timedelta(days=days)
+            age = f"older than {days} day(s)"
+        qs = _eligible(filters)
 
         count = qs.count()
 
         if dry_run:
+            if workers > 1:
+                self._report_partitions(qs, workers)
             self.stdout.write(
-                self.style.WARNING(
-                    f"[DRY RUN] Would delete {count} cart(s) older than {days} day(s)."
-                )
+                self.style.WARNING(f"[DRY RUN] Would delete {count} cart(s) {age}.")
             )
             return
 
         if count == 0:
             self.stdout.write(
-                self.style.SUCCESS(
-                    f"No carts older than {days} day(s) found. Nothing to delete."
+                self.style.SUCCESS(f"No carts {age} found. Nothing to delete.")
+            )
+            return
+
+        if workers > 1 and not _parallel_writes_supported():
+            self.stdout.write(
+                self.style.WARNING(
+                    "SQLite allows a single writer; ignoring --workers and "
+                    "deleting in this process."
+                )
+            )
+            workers = 1
+
+        if workers > 1:
+            carts_deleted, items_deleted, finished = self._run_partitions(
+                qs, workers, filters, batch_size, pause, max_runtime
+            )
+        else:
+            carts_deleted, items_deleted, finished = self._run_serial(
+                filters, count, batch_size, pause, max_runtime, archive
+            )
+
+        if archive is not None:
+            self.stdout.write(f"Archived {carts_deleted} cart(s) to {archive}.")
+
+        if not finished:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Stopped after --max-runtime {max_runtime:g}s: deleted "
+                    f"{carts_deleted} of {count} cart(s); rerun to continue."
                 )
             )
             return
 
-        deleted, _ = qs.delete()
         self.stdout.write(
             self.style.SUCCESS(
-                f"Successfully deleted {count} cart(s) (and their items) older than {days} day(s)."
+                f"Successfully deleted {carts_deleted} cart(s) and {items_deleted} "
+                f"item(s) {age}."
             )
         )
+
+    def _run_serial(
+        self,
+        filters: dict[str, Any],
+        count: int,
+        batch_size: int,
+        pause: float,
+        max_runtime: float | None,
+        archive: str | None,
+    ) -> tuple[int, int, bool]:
+        def progress(done: int) -> None:
+            self.stdout.write(f"Deleted {done}/{count} cart(s)…")
+
+        if archive is None:
+            return _delete_range(
+                filters, None, batch_size, pause, max_runtime, progress
+            )
+        with open(archive, "ab") as fileobj:
+            return _delete_range(
+                filters, None, batch_size, pause, max_runtime, progress, fileobj
+            )
+
+    def _report_partitions(self, qs: QuerySet[Cart], workers: int) -> None:
+        partitions = _partitions(qs, workers)
+        for number, (low, high) in enumerate(partitions, start=1):
+            estimate = qs.filter(pk__range=(low, high)).count()
+            self.stdout.write(
+                f"[DRY RUN] Partition {number}/{len(partitions)} "
+                f"(ids {low}–{high}): ~{estimate} cart(s)."
+            )
+
+    def _run_partitions(
+        self,
+        qs: QuerySet[Cart],
+        workers: int,
+        filters: dict[str, Any],
+        batch_size: int,
+        pause: float,
+        max_runtime: float | None,
+    ) -> tuple[int, int, bool]:
+        partitions = _partitions(qs, workers)
+        carts_deleted = items_deleted = 0
+        finished = True
+        with _make_pool(len(partitions)) as pool:
+            futures = {
+                pool.submit(
+                    _delete_range,
+                    filters,
+                    id_range,
+                    batch_size,
+                    pause,
+                    max_runtime,
+                ): (number, id_range)
+                for number, id_range in enumerate(partitions, start=1)
+            }
+            for future in as_completed(futures):
+                number, (low, high) = futures[future]
+                carts, items, done = future.result()
+                carts_deleted += carts
+                items_deleted += items
+                finished = finished and done
+                self.stdout.write(
+                    f"Partition {number}/{len(partitions)} (ids {low}–{high}): "
+                    f"deleted {carts} cart(s) and {items} item(s)."
+                )
+        return carts_deleted, items_deleted, finished
@@ -0,0 +1,69 @@
+"""
+Management command: recompute_cart_totals
+==========================================
+
+Rewrites the denormalized ``line_count``, ``unit_count`` and ``subtotal``
+columns of cart records from their items. Run it once after turning on
+``CART_DENORMALIZED_TOTALS`` on an existing database (carts written
+while the setting was off are not maintained), or to repair drift after
+writes that bypassed the ``Cart`` facade.
+
+Usage
+-----
+    python manage.py recompute_cart_totals
+    python manage.py recompute_cart_totals --cart 17 --cart 42
+    python manage.py recompute_cart_totals --batch-size 500
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cart.models import Cart
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the denormalized line_count / unit_count / subtotal "
+        "columns of cart records from their items."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--cart",
+            type=int,
+            action="append",
+            dest="cart_ids",
+            default=None,
+            help="Only recompute this cart id. May be given more than once.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help=(
+                "Number of carts rewritten per UPDATE statement. " "Defaults to 1000."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        qs = Cart.objects.order_by("pk")
+        if options["cart_ids"]:
+            qs = qs.filter(pk__in=options["cart_ids"])
+
+        updated = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                qs.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            updated += Cart.objects.filter(pk__in=pks).recompute_totals()
+            last_pk = pks[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed totals for {updated} cart(s).")
+        )
@@ -0,0 +1,72 @@
+"""Denormalized cart totals: ``line_count``, ``unit_count``, ``subtotal``.
+
+Opt-in via ``CART_DENORMALIZED_TOTALS``: when enabled, every facade
+mutation rewrites the three columns inside its own transaction, and
+``Cart.totals()``, ``Cart.__str__``, the admin and the template tags
+read them instead of aggregating over ``Item``.
+
+The columns are added with zero defaults and then backfilled here with
+a single correlated ``UPDATE``. Carts written while the setting was off
+drift again; ``manage.py recompute_cart_totals`` repairs them.
+"""
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_totals(apps, schema_editor):
+    Cart = apps.get_model("cart", "Cart")
+    Item = apps.get_model("cart", "Item")
+    money = models.DecimalField(max_digits=18, decimal_places=2)
+    lines = Item.objects.filter(cart=OuterRef("pk")).order_by().values("cart")
+    Cart.objects.using(schema_editor.connection.alias).update(
+        line_count=Coalesce(
+            Subquery(lines.annotate(total=Count("pk")).values("total")), 0
+        ),
+        unit_count=Coalesce(
+            Subquery(lines.annotate(total=Sum("quantity")).values("total")), 0
+        ),
+        subtotal=Coalesce(
+            Subquery(
+                lines.annotate(
+                    total=Sum(F("quantity") * F("unit_price"), output_field=money)
+                ).values("total")
+            ),
+            Value(Decimal("0.00")),
+            output_field=money,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cart", "0006_indexes_and_quantity_validator"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cart",
+            name="line_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="line count"),
+        ),
+        migrations.AddField(
+            model_name="cart",
+            name="unit_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="unit count"),
+        ),
+        migrations.AddField(
+            model_name="cart",
+            name="subtotal",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=Decimal("0.00"),
+                max_digits=18,
+                verbose_name="subtotal",
+            ),
+        ),
+        migrations.RunPython(backfill_totals, migrations.RunPython.noop),
+    ]
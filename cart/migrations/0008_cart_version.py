@@ -0,0 +1,24 @@
+"""Row version for optimistic concurrency control.
+
+Opt-in via ``CART_OPTIMISTIC_LOCKING``: every facade mutation then
+claims the cart with ``UPDATE … SET version = version + 1 WHERE
+version = <expected>`` and raises ``ConcurrentModification`` when
+another writer got there first. Existing rows start at ``0``.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cart", "0007_cart_denormalized_totals"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cart",
+            name="version",
+            field=models.PositiveIntegerField(default=0, verbose_name="version"),
+        ),
+    ]
@@ -0,0 +1,48 @@
+"""Activity-based expiry: ``Cart.last_activity`` plus a purge index.
+
+Facade mutations bump ``last_activity`` (throttled by
+``CART_ACTIVITY_THROTTLE``) and ``clean_carts --inactive-days`` deletes
+on it. The composite ``(checked_out, last_activity)`` index turns that
+purge's ``checked_out = false AND last_activity < cutoff`` filter into
+an index range scan.
+
+Existing rows are backfilled from ``creation_date`` — the best guess
+available for carts written before the column existed.
+"""
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_last_activity(apps, schema_editor):
+    Cart = apps.get_model("cart", "Cart")
+    Cart.objects.using(schema_editor.connection.alias).update(
+        last_activity=F("creation_date")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cart", "0008_cart_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cart",
+            name="last_activity",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                verbose_name="last activity",
+            ),
+        ),
+        migrations.RunPython(backfill_last_activity, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="cart",
+            index=models.Index(
+                fields=["checked_out", "last_activity"],
+                name="cart_checked_out_activity_idx",
+            ),
+        ),
+    ]
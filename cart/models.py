@@ -5,8 +5,9 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
-from django.db.models import F
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -16,6 +17,68 @@ if TYPE_CHECKING:
     from cart.cart import Cart as CartFacade
 
 
+class CartQuerySet(models.QuerySet["Cart"]):
+    def recompute_totals(self) -> int:
+        """Rewrite the denormalized totals of every cart in this queryset.
+
+        A single ``UPDATE`` sets ``line_count``, ``unit_count`` and
+        ``subtotal`` from correlated aggregates over ``Item``, so carts
+        without items are reset to zero as well.
+
+        Returns:
+            The number of carts updated.
+        """
+        return self.update(**self._totals_expressions())
+
+    async def arecompute_totals(self) -> int:
+        """Async variant of :meth:`recompute_totals`."""
+        return await self.aupdate(**self._totals_expressions())
+
+    def with_totals(self) -> "CartQuerySet":
+        """Annotate ``annotated_line_count``, ``annotated_unit_count`` and
+        ``annotated_subtotal`` on every cart.
+
+        The values are the denormalized columns when
+        ``CART_DENORMALIZED_TOTALS`` is on, and correlated aggregates over
+        ``Item`` otherwise. Either way the whole page is still one query,
+        and ``count()`` drops the annotations again.
+        """
+        if getattr(settings, "CART_DENORMALIZED_TOTALS", False):
+            return self.annotate(
+                annotated_line_count=F("line_count"),
+                annotated_unit_count=F("unit_count"),
+                annotated_subtotal=F("subtotal"),
+            )
+        return self.annotate(
+            **{
+                f"annotated_{name}": expression
+                for name, expression in self._totals_expressions().items()
+            }
+        )
+
+    @staticmethod
+    def _totals_expressions() -> dict[str, Any]:
+        money = models.DecimalField(max_digits=18, decimal_places=2)
+        lines = Item.objects.filter(cart=OuterRef("pk")).order_by().values("cart")
+        return {
+            "line_count": Coalesce(
+                Subquery(lines.annotate(total=Count("pk")).values("total")), 0
+            ),
+            "unit_count": Coalesce(
+                Subquery(lines.annotate(total=Sum("quantity")).values("total")), 0
+            ),
+            "subtotal": Coalesce(
+                Subquery(
+                    lines.annotate(
+                        total=Sum(F("quantity") * F("unit_price"), output_field=money)
+                    ).values("total")
+                ),
+                Value(Decimal("0.00")),
+                output_field=money,
+            ),
+        }
+
+
 class Cart(models.Model):
     creation_date: models.DateTimeField = models.DateTimeField(
         verbose_name=_("creation date"),
@@ -27,6 +90,12 @@ class Cart(models.Model):
         verbose_name=_("checked out"),
         db_index=True,
     )
+    # Bumped by facade mutations at most once per ``CART_ACTIVITY_THROTTLE``
+    # seconds; ``clean_carts --inactive-days`` purges on it.
+    last_activity: models.DateTimeField = models.DateTimeField(
+        verbose_name=_("last activity"),
+        default=timezone.now,
+    )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         verbose_name=_("user"),
@@ -43,14 +112,52 @@ class Cart(models.Model):
         blank=True,
         related_name="applied_carts",
     )
+    # Denormalized totals, maintained by the facade when
+    # ``CART_DENORMALIZED_TOTALS`` is on. ``recompute_cart_totals``
+    # backfills and repairs them.
+    line_count: models.PositiveIntegerField = models.PositiveIntegerField(
+        verbose_name=_("line count"),
+        default=0,
+    )
+    unit_count: models.PositiveIntegerField = models.PositiveIntegerField(
+        verbose_name=_("unit count"),
+        default=0,
+    )
+    subtotal: models.DecimalField = models.DecimalField(
+        verbose_name=_("subtotal"),
+        max_digits=18,
+        decimal_places=2,
+        default=Decimal("0.00"),
+    )
+    # Row version for ``CART_OPTIMISTIC_LOCKING``: every facade mutation
+    # bumps it with a compare-and-swap ``UPDATE``.
+    version: models.PositiveIntegerField = models.PositiveIntegerField(
+        verbose_name=_("version"),
+        default=0,
+    )
+
+    objects = CartQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("cart")
         verbose_name_plural = _("carts")
         ordering = ("-creation_date",)
+        indexes = [
+            models.Index(
+                fields=["checked_out", "last_activity"],
+                name="cart_checked_out_activity_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
-        return f"Cart #{self.pk} ({self.items.count()} items)"
+        if getattr(settings, "CART_DENORMALIZED_TOTALS", False):
+            line_count = self.line_count
+        elif hasattr(self, "annotated_line_count"):
+            # Loaded through ``with_totals()`` — e.g. the admin changelist.
+            line_count = self.annotated_line_count
+        else:
+            line_count = self.items.count()
+        return f"Cart #{self.pk} ({line_count} items)"
 
 
 class ItemManager(models.Manager["Item"]):
@@ -73,6 +180,136 @@ class ItemManager(models.Manager["Item"]):
         kwargs = self._inject_content_type(kwargs)
         return super().filter(*args, **kwargs)
 
+    def increment_or_create(
+        self,
+        cart: "Cart",
+        content_type_id: int,
+        object_id: int,
+        quantity: int,
+        unit_price: Decimal,
+        max_quantity: int | None = None,
+    ) -> "Item | None":
+        """Insert a line or atomically add *quantity* to the existing one.
+
+        On backends with ``INSERT … ON CONFLICT … RETURNING`` (PostgreSQL,
+        SQLite ≥ 3.35) this is a single statement keyed on the
+        ``unique_together = ("cart", "content_type", "object_id")``
+        constraint: ``quantity = quantity + n`` is evaluated by the
+        database, so concurrent increments never overwrite each other.
+        Other backends fall back to an ``F()``-based ``UPDATE`` followed
+        by an ``INSERT`` when no row matched, retrying the increment if
+        a concurrent insert wins the race.
+
+        ``unit_price`` always overwrites the stored price, matching
+        :meth:`cart.cart.Cart.add`.
+
+        Returns:
+            The inserted or updated :class:`Item`, or ``None`` when the
+            increment would push the stored quantity above
+            *max_quantity* (nothing is written in that case).
+        """
+        connection = connections[router.db_for_write(self.model)]
+        features = connection.features
+        if (
+            connection.vendor in ("postgresql", "sqlite")
+            and features.supports_update_conflicts_with_target
+            and features.can_return_columns_from_insert
+        ):
+            return self._upsert(
+                connection,
+                cart,
+                content_type_id,
+                object_id,
+                quantity,
+                unit_price,
+                max_quantity,
+            )
+
+        lookup = self.filter(
+            cart=cart, content_type_id=content_type_id, object_id=object_id
+        )
+        capped = lookup
+        if max_quantity is not None:
+            capped = lookup.filter(quantity__lte=max_quantity - quantity)
+        changes = {"quantity": F("quantity") + quantity, "unit_price": unit_price}
+        with transaction.atomic(using=connection.alias):
+            if capped.update(**changes):
+                return lookup.get()
+            if lookup.exists():
+                return None
+            try:
+                with transaction.atomic(using=connection.alias):
+                    return self.create(
+                        cart=cart,
+                        content_type_id=content_type_id,
+                        object_id=object_id,
+                        quantity=quantity,
+                        unit_price=unit_price,
+                    )
+            except IntegrityError:
+                # A concurrent request inserted the line first.
+                if capped.update(**changes):
+                    return lookup.get()
+                return None
+
+    def _upsert(
+        self,
+        connection: Any,
+        cart: "Cart",
+        content_type_id: int,
+        object_id: int,
+        quantity: int,
+        unit_price: Decimal,
+        max_quantity: int | None,
+    ) -> "Item | None":
+        opts = self.model._meta
+        qn = connection.ops.quote_name
+        table = qn(opts.db_table)
+        column = {f.attname: qn(f.column) for f in opts.concrete_fields}
+        price_field = opts.get_field("unit_price")
+        params: list[Any] = [
+            cart.pk,
+            content_type_id,
+            object_id,
+            quantity,
+            price_field.get_db_prep_save(unit_price, connection),
+        ]
+        guard = ""
+        if max_quantity is not None:
+            guard = f" WHERE {table}.{column['quantity']} + EXCLUDED.{column['quantity']} <= %s"
+            params.append(max_quantity)
+        sql = (
+            f"INSERT INTO {table} ({column['cart_id']}, {column['content_type_id']}, "
+            f"{column['object_id']}, {column['quantity']}, {column['unit_price']}) "
+            "VALUES (%s, %s, %s, %s, %s) "
+            f"ON CONFLICT ({column['cart_id']}, {column['content_type_id']}, "
+            f"{column['object_id']}) DO UPDATE SET "
+            f"{column['quantity']} = {table}.{column['quantity']} + EXCLUDED.{column['quantity']}, "
+            f"{column['unit_price']} = EXCLUDED.{column['unit_price']}"
+            f"{guard} RETURNING {column['id']}, {column['quantity']}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        pk, stored_quantity = row
+        return self.model.from_db(
+            connection.alias,
+            [f.attname for f in opts.concrete_fields],
+            [
+                {
+                    "id": pk,
+                    "cart_id": cart.pk,
+                    "quantity": stored_quantity,
+                    "unit_price": unit_price,
+                    "content_type_id": content_type_id,
+                    "object_id": object_id,
+                }[f.attname]
+                for f in opts.concrete_fields
+            ],
+        )
+
 
 class Item(models.Model):
     cart = models.ForeignKey["Cart", "Item"](
@@ -311,3 +548,20 @@ class Discount(models.Model):
         call — call ``refresh_from_db()`` if you need the new value.
         """
         Discount.objects.filter(pk=self.pk).update(current_uses=F("current_uses") + 1)
+
+    def claim_usage(self) -> bool:
+        """Increment the usage counter unless the cap has been reached.
+
+        The cap is checked in the ``UPDATE``'s ``WHERE`` clause, so
+        concurrent callers can never push ``current_uses`` past
+        ``max_uses`` — no row lock needed.
+
+        Returns:
+            ``True`` if a use was claimed, ``False`` if none were left.
+        """
+        available = Q(max_uses__isnull=True) | Q(current_uses__lt=F("max_uses"))
+        return bool(
+            Discount.objects.filter(available, pk=self.pk).update(
+                current_uses=F("current_uses") + 1
+            )
+        )
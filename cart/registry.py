@@ -0,0 +1,70 @@
+"""Process-wide registry of configured plugin instances.
+
+``get_tax_calculator()``, ``get_shipping_calculator()`` and
+``get_inventory_checker()`` used to ``import_string`` and instantiate
+their class on every call — once per ``cart.tax()``, ``cart.shipping()``
+or ``add(check_inventory=True)``. They now resolve each ``CART_*``
+setting once per process and hand out the same instance, so a
+calculator can keep warm state (an HTTP session, a rate table) across
+requests.
+
+Instances are dropped when the setting changes (Django's
+``setting_changed`` signal, fired by ``override_settings`` and the
+pytest-django ``settings`` fixture) or when :func:`reset` is called.
+
+Because one instance serves every thread, plugin classes must be
+thread-safe — keep per-call state in locals, not on ``self``.
+"""
+
+import threading
+from typing import Any, Callable, TypeVar
+
+from django.core.signals import setting_changed
+
+T = TypeVar("T")
+
+_instances: dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def get_instance(setting: str, factory: Callable[[], T]) -> T:
+    """Return the cached instance for *setting*, building it on first use.
+
+    Args:
+        setting: Name of the ``CART_*`` setting the instance is built from.
+        factory: Zero-argument callable that resolves the setting and
+            returns the instance. Called at most once per process until
+            the next :func:`reset`.
+
+    Returns:
+        The shared instance.
+    """
+    try:
+        return _instances[setting]
+    except KeyError:
+        pass
+    with _lock:
+        if setting not in _instances:
+            _instances[setting] = factory()
+        return _instances[setting]
+
+
+def reset(setting: str | None = None) -> None:
+    """Forget the instance built for *setting*, or every instance.
+
+    Args:
+        setting: A ``CART_*`` setting name, or ``None`` to clear all.
+    """
+    with _lock:
+        if setting is None:
+            _instances.clear()
+        else:
+            _instances.pop(setting, None)
+
+
+def _on_setting_changed(*, setting: str, **kwargs: Any) -> None:
+    if setting in _instances:
+        reset(setting)
+
+
+setting_changed.connect(_on_setting_changed, dispatch_uid="cart.registry.reset")
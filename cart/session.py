@@ -7,14 +7,36 @@ Provides pluggable backends for different session storage mechanisms.
 from abc import ABC, abstractmethod
 from typing import Any
 
+from django.conf import settings
+from django.core import signing
+
 
 class CartSessionAdapter(ABC):
     """
     Abstract base class for cart session adapters.
 
     Subclass this to implement custom session storage backends.
+
+    Adapters that set :attr:`stores_lines` also keep the lines of a cart
+    that has no database row yet (see :class:`SignedCookieCartAdapter`);
+    the :class:`cart.cart.Cart` facade then reads and writes them through
+    :meth:`load_lines` / :meth:`save_lines` / :meth:`clear_lines`.
     """
 
+    stores_lines = False
+
+    def load_lines(self) -> dict | None:
+        """Return the stored cart payload, or ``None`` if there is none."""
+        return None
+
+    def save_lines(self, payload: dict) -> bool:
+        """Store *payload*; return ``False`` if it does not fit."""
+        return False
+
+    def clear_lines(self) -> None:
+        """Forget the stored cart payload."""
+        return None
+
     @abstractmethod
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a value from the session."""
@@ -40,6 +62,23 @@ class CartSessionAdapter(ABC):
         """Store the cart ID in the session."""
         raise NotImplementedError
 
+    async def aget_or_create_cart_id(self) -> int | None:
+        """Async variant of :meth:`get_or_create_cart_id`.
+
+        The default runs the sync method in a worker thread via
+        ``sync_to_async`` — safe for any backend. Adapters whose storage
+        is in memory or natively async override it.
+        """
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(self.get_or_create_cart_id)()
+
+    async def aset_cart_id(self, cart_id: int) -> None:
+        """Async variant of :meth:`set_cart_id`. See :meth:`aget_or_create_cart_id`."""
+        from asgiref.sync import sync_to_async
+
+        await sync_to_async(self.set_cart_id)(cart_id)
+
     def flush_to_response(self, request, response) -> None:
         """Persist any pending state to *response*.
 
@@ -79,6 +118,28 @@ class DjangoSessionAdapter(CartSessionAdapter):
 
         self._session[CART_ID] = cart_id
 
+    async def aget_or_create_cart_id(self) -> int | None:
+        """Read the cart id through ``SessionBase.aget`` (Django ≥ 5.0).
+
+        Older Djangos and plain-dict sessions fall back to the sync
+        lookup — a dict read does no I/O.
+        """
+        from .cart import CART_ID
+
+        aget = getattr(self._session, "aget", None)
+        if aget is None:
+            return self._session.get(CART_ID)
+        return await aget(CART_ID)
+
+    async def aset_cart_id(self, cart_id: int) -> None:
+        from .cart import CART_ID
+
+        aset = getattr(self._session, "aset", None)
+        if aset is None:
+            self._session[CART_ID] = cart_id
+        else:
+            await aset(CART_ID, cart_id)
+
 
 class CookieSessionAdapter(CartSessionAdapter):
     """
@@ -98,7 +159,7 @@ class CookieSessionAdapter(CartSessionAdapter):
     def set(self, key: str, value: Any) -> None:
         self._cookies[key] = value
         if self._response is not None:
-            self._response.set_cookie(key, value)
+            self._response.set_cookie(key, value, **self.cookie_kwargs(key))
 
     def delete(self, key: str) -> None:
         if key in self._cookies:
@@ -122,6 +183,13 @@ class CookieSessionAdapter(CartSessionAdapter):
 
         self.set(CART_ID, str(cart_id))
 
+    async def aget_or_create_cart_id(self) -> int | None:
+        # Cookies are already in memory — no thread hop needed.
+        return self.get_or_create_cart_id()
+
+    async def aset_cart_id(self, cart_id: int) -> None:
+        self.set_cart_id(cart_id)
+
     def flush_to_response(self, request, response) -> None:
         """Write pending cookie mutations to *response*.
 
@@ -137,7 +205,71 @@ class CookieSessionAdapter(CartSessionAdapter):
         after = self._cookies
         for key, value in after.items():
             if before.get(key) != value:
-                response.set_cookie(key, value)
+                response.set_cookie(key, value, **self.cookie_kwargs(key))
         for key in before:
             if key not in after:
                 response.delete_cookie(key)
+
+    def cookie_kwargs(self, key: str) -> dict[str, Any]:
+        """Extra ``set_cookie`` arguments for *key*; none by default."""
+        return {}
+
+
+class SignedCookieCartAdapter(CookieSessionAdapter):
+    """
+    Adapter that keeps small anonymous carts entirely in a cookie.
+
+    The cart's lines (content type, object id, quantity, unit price) and
+    its discount code are stored in the ``CART-DATA`` cookie, signed and
+    compressed with :mod:`django.core.signing`. A visitor whose cart
+    lives there needs no database access to read or change it. The
+    facade moves the cart to a database row — and from then on stores
+    only ``CART-ID`` — when the signed value would exceed
+    ``CART_COOKIE_MAX_SIZE`` bytes (default 3072), on checkout, on
+    ``bind_to_user`` and on the bulk writes (``add_bulk``, ``merge``,
+    ``from_serializable``).
+
+    Requires :class:`cart.middleware.CartCookieMiddleware`. Cookies
+    follow ``SESSION_COOKIE_AGE`` / ``_SECURE`` / ``_SAMESITE`` / ``_DOMAIN``
+    and are always ``HttpOnly``; an expired or tampered payload reads
+    as an empty cart.
+    """
+
+    stores_lines = True
+    salt = "cart.session.SignedCookieCartAdapter"
+
+    def load_lines(self) -> dict | None:
+        from .cart import CART_DATA
+
+        value = self._cookies.get(CART_DATA)
+        if not value:
+            return None
+        try:
+            return signing.loads(
+                value, salt=self.salt, max_age=settings.SESSION_COOKIE_AGE
+            )
+        except signing.BadSignature:
+            return None
+
+    def save_lines(self, payload: dict) -> bool:
+        from .cart import CART_DATA
+
+        value = signing.dumps(payload, salt=self.salt, compress=True)
+        if len(value) > getattr(settings, "CART_COOKIE_MAX_SIZE", 3072):
+            return False
+        self.set(CART_DATA, value)
+        return True
+
+    def clear_lines(self) -> None:
+        from .cart import CART_DATA
+
+        self.delete(CART_DATA)
+
+    def cookie_kwargs(self, key: str) -> dict[str, Any]:
+        return {
+            "max_age": settings.SESSION_COOKIE_AGE,
+            "domain": settings.SESSION_COOKIE_DOMAIN,
+            "secure": settings.SESSION_COOKIE_SECURE,
+            "httponly": True,
+            "samesite": settings.SESSION_COOKIE_SAMESITE,
+        }
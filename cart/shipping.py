@@ -126,10 +126,20 @@ class DefaultShippingCalculator(ShippingCalculator):
 def get_shipping_calculator() -> ShippingCalculator:
     """Get the configured shipping calculator instance.
 
+    The instance is built once per process and shared (see
+    :mod:`cart.registry`); it is rebuilt when ``CART_SHIPPING_CALCULATOR``
+    changes.
+
     Returns:
         An instance of the configured ShippingCalculator subclass,
         or DefaultShippingCalculator if none is configured.
     """
+    from .registry import get_instance
+
+    return get_instance("CART_SHIPPING_CALCULATOR", _build_shipping_calculator)
+
+
+def _build_shipping_calculator() -> ShippingCalculator:
     from django.conf import settings
 
     calculator_path = getattr(settings, "CART_SHIPPING_CALCULATOR", None)
@@ -148,6 +158,6 @@ def get_shipping_calculator() -> ShippingCalculator:
             f"imported ({exc.__class__.__name__}: {exc}). Falling back to "
             f"DefaultShippingCalculator (zero cost).",
             RuntimeWarning,
-            stacklevel=2,
+            stacklevel=4,
         )
         return DefaultShippingCalculator()
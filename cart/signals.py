@@ -9,3 +9,5 @@ cart_item_removed = Signal()
 cart_item_updated = Signal()
 cart_checked_out = Signal()
 cart_cleared = Signal()
+cart_items_removed = Signal()
+cart_items_updated = Signal()
@@ -79,10 +79,20 @@ class DefaultTaxCalculator(TaxCalculator):
 def get_tax_calculator() -> TaxCalculator:
     """Get the configured tax calculator instance.
 
+    The instance is built once per process and shared (see
+    :mod:`cart.registry`); it is rebuilt when ``CART_TAX_CALCULATOR``
+    changes.
+
     Returns:
         An instance of the configured TaxCalculator subclass,
         or DefaultTaxCalculator if none is configured.
     """
+    from .registry import get_instance
+
+    return get_instance("CART_TAX_CALCULATOR", _build_tax_calculator)
+
+
+def _build_tax_calculator() -> TaxCalculator:
     from django.conf import settings
 
     calculator_path = getattr(settings, "CART_TAX_CALCULATOR", None)
@@ -101,6 +111,6 @@ def get_tax_calculator() -> TaxCalculator:
             f"({exc.__class__.__name__}: {exc}). Falling back to "
             f"DefaultTaxCalculator (zero tax).",
             RuntimeWarning,
-            stacklevel=2,
+            stacklevel=4,
         )
         return DefaultTaxCalculator()
@@ -2,30 +2,134 @@ from decimal import Decimal
 
 from django import template
 from django.conf import settings
-from django.db.models import F, Sum
+from django.core.cache import BaseCache, InvalidCacheBackendError, caches
+from django.core.cache.utils import make_template_fragment_key
+from django.db.models import Count, F, Sum
+from django.template import TemplateSyntaxError, VariableDoesNotExist
 from django.urls import NoReverseMatch, reverse
 from django.utils.html import format_html
 
-from ..cart import CART_ID
-from ..models import Item
+from ..cache import get_cart_cache, get_value, get_version, set_value, version_etag
+from ..cart import Cart as CartFacade
+from ..cart import CartTotals
+from ..models import Cart, Item
+from ..session import CartSessionAdapter
 
 register = template.Library()
 
+_NO_TOTALS = CartTotals(count=0, unique_count=0, summary=Decimal("0.00"))
 
-def _session_cart_id(request) -> int | None:
-    """Read CART-ID from the request session without touching the ORM.
 
-    Read-only template tags share this helper so a render on a fresh
-    visitor (no CART-ID yet) is a zero-query zero-mutation path —
-    crucially, it does not call ``Cart(request)`` and therefore does
-    not materialise a :class:`cart.models.Cart` row (P1-C, v3.0.13).
+def _cart_session(request) -> CartSessionAdapter | None:
+    """Return the request's cart session adapter without touching the ORM.
+
+    Read-only template tags resolve the cart through this helper so a
+    render on a fresh visitor (no CART-ID yet) is a zero-query
+    zero-mutation path — crucially, it does not call ``Cart(request)``
+    and therefore does not materialise a :class:`cart.models.Cart` row
+    (P1-C, v3.0.13). The adapter is the one the facade and
+    :class:`cart.middleware.CartCookieMiddleware` use (same settings,
+    cached on the request), so cookie-held carts are found too.
+    Returns ``None`` without a request, or when the session adapter
+    needs a ``request.session`` that isn't there.
     """
     if request is None:
         return None
-    session = getattr(request, "session", None)
-    if session is None:
+    try:
+        return CartFacade._build_session_adapter(request)
+    except AttributeError:
+        # DjangoSessionAdapter on a request without SessionMiddleware.
         return None
-    return session.get(CART_ID)
+
+
+def _stored_totals(cart_id: int) -> tuple[int, int, Decimal] | None:
+    """Return ``(line_count, unit_count, subtotal)`` of an open cart.
+
+    Used when ``CART_DENORMALIZED_TOTALS`` is on: one primary-key lookup
+    on ``cart_cart`` instead of an aggregate over ``cart_item``. Returns
+    ``None`` for a missing or checked-out cart.
+    """
+    return (
+        Cart.objects.filter(pk=cart_id, checked_out=False)
+        .values_list("line_count", "unit_count", "subtotal")
+        .first()
+    )
+
+
+def _load_totals(cart_id: int) -> CartTotals:
+    """Return count, line count and subtotal of an open cart.
+
+    Mirrors :meth:`cart.cart.Cart.totals`: the denormalized columns when
+    ``CART_DENORMALIZED_TOTALS`` is on, else the ``"totals"`` value the
+    facade shares through ``CART_CACHE`` (no query on a hit), else one
+    aggregate.
+    """
+    if getattr(settings, "CART_DENORMALIZED_TOTALS", False):
+        stored = _stored_totals(cart_id)
+        if stored is None:
+            return _NO_TOTALS
+        return CartTotals(count=stored[1], unique_count=stored[0], summary=stored[2])
+    cache = get_cart_cache()
+    if cache is None:
+        return _aggregate_totals(cart_id)
+    version = get_version(cache, cart_id)
+    totals = get_value(cache, cart_id, version, "totals")
+    if totals is None:
+        totals = _aggregate_totals(cart_id)
+        set_value(cache, cart_id, version, "totals", totals)
+    return totals
+
+
+def _aggregate_totals(cart_id: int) -> CartTotals:
+    """Compute the totals of an open cart with one aggregate query."""
+    result = Item.objects.filter(cart_id=cart_id, cart__checked_out=False).aggregate(
+        count=Sum("quantity"),
+        unique_count=Count("id"),
+        summary=Sum(F("quantity") * F("unit_price")),
+    )
+    return CartTotals(
+        count=result["count"] or 0,
+        unique_count=result["unique_count"] or 0,
+        summary=result["summary"] or Decimal("0.00"),
+    )
+
+
+def _request_totals(request) -> CartTotals:
+    """Return the cart totals shared by every tag rendered for *request*.
+
+    A :class:`cart.cart.Cart` facade already on ``request.cart`` (see
+    :func:`cart.decorators.cart_condition`) answers from its own cached
+    :meth:`~cart.cart.Cart.totals`. Otherwise the totals are loaded once
+    by :func:`_load_totals` and memoized on the request, so a page that
+    renders ``cart_item_count``, ``cart_summary`` and ``cart_is_empty``
+    in several partials still costs a single query (none on a warm
+    ``CART_CACHE``). The memo is not invalidated by later writes in the
+    same request; views that mutate the cart after rendering should go
+    through ``request.cart``.
+    """
+    facade = getattr(request, "cart", None)
+    if isinstance(facade, CartFacade):
+        return _NO_TOTALS if facade.cart.checked_out else facade.totals()
+    session = _cart_session(request)
+    if session is None:
+        return _NO_TOTALS
+    cart_id = session.get_or_create_cart_id()
+    if not cart_id and not session.stores_lines:
+        return _NO_TOTALS
+    memo = getattr(request, "_cart_totals", None)
+    if memo is not None and memo[0] == cart_id:
+        return memo[1]
+    if cart_id:
+        totals = _load_totals(cart_id)
+    else:
+        # A cart kept by the session adapter itself (signed cookie).
+        totals = CartFacade(request).totals()
+    try:
+        request._cart_totals = (cart_id, totals)
+    except AttributeError:
+        # Request doubles that refuse attributes simply skip the memo.
+        pass
+    return totals
 
 
 @register.simple_tag(takes_context=True)
@@ -38,16 +142,7 @@ def cart_item_count(context) -> int:
         {% load cart_tags %}
         {% cart_item_count %}
     """
-    cart_id = _session_cart_id(context.get("request"))
-    if not cart_id:
-        return 0
-    total = Item.objects.filter(
-        cart_id=cart_id,
-        cart__checked_out=False,
-    ).aggregate(
-        total=Sum("quantity")
-    )["total"]
-    return total or 0
+    return _request_totals(context.get("request")).count
 
 
 @register.simple_tag(takes_context=True)
@@ -60,16 +155,7 @@ def cart_summary(context) -> str:
         {% load cart_tags %}
         {% cart_summary %}
     """
-    cart_id = _session_cart_id(context.get("request"))
-    if not cart_id:
-        return "$0.00"
-    total = Item.objects.filter(
-        cart_id=cart_id,
-        cart__checked_out=False,
-    ).aggregate(
-        total=Sum(F("quantity") * F("unit_price"))
-    )["total"]
-    return f"${total or Decimal('0.00'):.2f}"
+    return f"${_request_totals(context.get('request')).summary:.2f}"
 
 
 @register.simple_tag(takes_context=True)
@@ -82,13 +168,7 @@ def cart_is_empty(context) -> bool:
         {% load cart_tags %}
         {% cart_is_empty %}
     """
-    cart_id = _session_cart_id(context.get("request"))
-    if not cart_id:
-        return True
-    return not Item.objects.filter(
-        cart_id=cart_id,
-        cart__checked_out=False,
-    ).exists()
+    return _request_totals(context.get("request")).unique_count == 0
 
 
 @register.simple_tag(takes_context=True)
@@ -122,3 +202,128 @@ def cart_link(context, text: str = "View Cart", css_class: str = "") -> str:
     if css_class:
         return format_html('<a href="{}" class="{}">{}</a>', cart_url, css_class, text)
     return format_html('<a href="{}">{}</a>', cart_url, text)
+
+
+def _cart_fragment_version(request) -> str:
+    """Return the cart component of a ``{% cartcache %}`` key.
+
+    Visitors without a ``CART-ID`` all get ``"empty"`` and share one
+    entry. The id is read through ``CART_SESSION_ADAPTER`` — not the
+    session directly — so cookie-held carts never fall into that shared
+    entry. A facade on ``request.cart`` supplies its
+    :meth:`~cart.cart.Cart.etag`; otherwise the ``CART_CACHE`` version
+    is read without touching the DB, and as a last resort a lazy facade
+    computes the etag (never creating a cart row).
+    """
+    facade = getattr(request, "cart", None)
+    if isinstance(facade, CartFacade):
+        return facade.etag()
+    session = _cart_session(request)
+    if session is None:
+        return "empty"
+    cart_id = session.get_or_create_cart_id()
+    if not cart_id:
+        if session.stores_lines:
+            return CartFacade(request).etag()
+        return "empty"
+    cache = get_cart_cache()
+    if cache is not None:
+        return version_etag(cache, cart_id)
+    return CartFacade(request, lazy=True).etag()
+
+
+class CartCacheNode(template.Node):
+    """Node behind :func:`do_cartcache`; see there for the syntax."""
+
+    def __init__(self, nodelist, expire_time_var, fragment_name, vary_on, cache_name):
+        self.nodelist = nodelist
+        self.expire_time_var = expire_time_var
+        self.fragment_name = fragment_name
+        self.vary_on = vary_on
+        self.cache_name = cache_name
+
+    def _fragment_cache(self, context) -> BaseCache:
+        if self.cache_name is None:
+            cache = get_cart_cache()
+            if cache is not None:
+                return cache
+            try:
+                return caches["template_fragments"]
+            except InvalidCacheBackendError:
+                return caches["default"]
+        try:
+            cache_name = self.cache_name.resolve(context)
+        except VariableDoesNotExist:
+            raise TemplateSyntaxError(
+                f'"cartcache" tag got an unknown variable: {self.cache_name.var!r}'
+            )
+        try:
+            return caches[cache_name]
+        except InvalidCacheBackendError:
+            raise TemplateSyntaxError(
+                f"Invalid cache name specified for cartcache tag: {cache_name!r}"
+            )
+
+    def render(self, context) -> str:
+        try:
+            expire_time = self.expire_time_var.resolve(context)
+        except VariableDoesNotExist:
+            raise TemplateSyntaxError(
+                f'"cartcache" tag got an unknown variable: '
+                f"{self.expire_time_var.var!r}"
+            )
+        if expire_time is not None:
+            try:
+                expire_time = int(expire_time)
+            except (ValueError, TypeError):
+                raise TemplateSyntaxError(
+                    f'"cartcache" tag got a non-integer timeout value: {expire_time!r}'
+                )
+        fragment_cache = self._fragment_cache(context)
+        vary_on = [var.resolve(context) for var in self.vary_on]
+        vary_on.append(_cart_fragment_version(context.get("request")))
+        cache_key = make_template_fragment_key(f"cart.{self.fragment_name}", vary_on)
+        value = fragment_cache.get(cache_key)
+        if value is None:
+            value = self.nodelist.render(context)
+            fragment_cache.set(cache_key, value, expire_time)
+        return value
+
+
+@register.tag("cartcache")
+def do_cartcache(parser, token) -> CartCacheNode:
+    """
+    Cache a template fragment per cart, like Django's ``{% cache %}``.
+
+    The key combines the fragment name, any extra ``vary_on`` values and
+    the cart's version (see :func:`_cart_fragment_version`), so every
+    facade mutation invalidates the fragment — no manual deletes.
+    Visitors without a cart share one ``"empty"`` entry. The fragment is
+    stored in ``using=`` when given, else the ``CART_CACHE`` cache, else
+    Django's ``template_fragments`` / ``default`` cache.
+
+    Usage::
+
+        {% load cart_tags %}
+        {% cartcache 600 minicart %}
+            ... line items, product names and images ...
+        {% endcartcache %}
+
+        {% cartcache 600 minicart request.LANGUAGE_CODE using="fragments" %}
+    """
+    nodelist = parser.parse(("endcartcache",))
+    parser.delete_first_token()
+    tokens = token.split_contents()
+    if len(tokens) < 3:
+        raise TemplateSyntaxError(f"{tokens[0]!r} tag requires at least 2 arguments.")
+    cache_name = None
+    if len(tokens) > 3 and tokens[-1].startswith("using="):
+        cache_name = parser.compile_filter(tokens[-1][len("using=") :])
+        tokens = tokens[:-1]
+    return CartCacheNode(
+        nodelist,
+        parser.compile_filter(tokens[1]),
+        tokens[2],  # fragment_name can't be a variable.
+        [parser.compile_filter(t) for t in tokens[3:]],
+        cache_name,
+    )
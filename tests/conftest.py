@@ -15,6 +15,7 @@ import os
 from decimal import Decimal
 
 import pytest
+from django.core.cache import caches
 from django.test import RequestFactory
 
 from cart.cart import Cart
@@ -197,3 +198,23 @@ def discount_fixed(db):
         discount_type=DiscountType.FIXED,
         value=Decimal("10.00"),
     )
+
+
+# --------------------------------------------------------------------------- #
+# Caches
+# --------------------------------------------------------------------------- #
+
+
+@pytest.fixture
+def totals_cache(settings):
+    """Route cart totals through an emptied locmem ``default`` cache.
+
+    Sets ``CART_CACHE = "default"`` and clears the cache on both sides of
+    the test — cart ids are reused across rolled-back tests, so a value
+    cached by one test must not answer for another's cart.
+    """
+    settings.CART_CACHE = "default"
+    cache = caches["default"]
+    cache.clear()
+    yield cache
+    cache.clear()
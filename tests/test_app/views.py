@@ -16,6 +16,7 @@ from django.shortcuts import get_object_or_404
 from django.views.decorators.http import require_GET, require_POST
 
 from cart.cart import Cart, InvalidQuantity, ItemDoesNotExist
+from cart.decorators import cart_condition
 from tests.test_app.models import FakeProduct
 
 
@@ -36,6 +37,12 @@ def cart_detail(request):
     return JsonResponse(_payload(cart))
 
 
+@require_GET
+@cart_condition
+def cart_state(request):
+    return JsonResponse(_payload(request.cart))
+
+
 @require_POST
 def cart_add(request, product_id: int):
     product = get_object_or_404(FakeProduct, pk=product_id)
@@ -0,0 +1,275 @@
+"""Async facade: :class:`cart.async_cart.AsyncCart`.
+
+pytest-asyncio is not a dependency, so coroutines are driven with
+``asgiref.sync.async_to_sync``. Called from the test thread, the async
+ORM's thread-sensitive hops land back on that thread and share the
+test's database connection and transaction.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from cart.async_cart import AsyncCart
+from cart.cart import (
+    CART_ID,
+    Cart,
+    CartException,
+    InsufficientStock,
+    InvalidQuantity,
+    ItemDoesNotExist,
+    PriceMismatchError,
+)
+from cart.models import Cart as CartModel
+from cart.session import CookieSessionAdapter, DjangoSessionAdapter
+from cart.signals import cart_item_added
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def run_async():
+    """Drive ``coro_fn(*args, **kwargs)`` to completion from sync code."""
+
+    def _run(coro_fn, *args, **kwargs):
+        return async_to_sync(coro_fn)(*args, **kwargs)
+
+    return _run
+
+
+def test_load_creates_a_cart_and_stores_its_id(run_async, rf_request):
+    cart = run_async(AsyncCart.load, rf_request)
+
+    assert cart.cart.pk is not None
+    assert rf_request.session[CART_ID] == cart.cart.pk
+
+
+def test_load_reuses_the_sync_facades_cart(run_async, rf_request, cart):
+    loaded = run_async(AsyncCart.load, rf_request)
+
+    assert loaded.cart.pk == cart.cart.pk
+
+
+def test_lazy_load_defers_the_row(run_async, rf_request):
+    cart = run_async(AsyncCart.load, rf_request, lazy=True)
+
+    assert cart.cart.pk is None
+    assert run_async(cart.acount) == 0
+    assert CartModel.objects.count() == 0
+
+
+def test_aadd_creates_then_increments(run_async, rf_request, product):
+    cart = run_async(AsyncCart.load, rf_request, lazy=True)
+
+    run_async(cart.aadd, product, Decimal("10.00"), quantity=2)
+    item = run_async(cart.aadd, product, Decimal("12.00"), quantity=1)
+
+    assert item.quantity == 3
+    assert item.unit_price == Decimal("12.00")
+    assert run_async(cart.acount) == 3
+    assert run_async(cart.aunique_count) == 1
+    assert run_async(cart.asummary) == Decimal("36.00")
+    assert Cart(rf_request).count() == 3
+
+
+def test_aadd_validates_like_add(run_async, settings, rf_request, product):
+    settings.CART_MAX_QUANTITY_PER_ITEM = 3
+    cart = run_async(AsyncCart.load, rf_request)
+
+    with pytest.raises(InvalidQuantity):
+        run_async(cart.aadd, product, Decimal("10.00"), quantity=0)
+    with pytest.raises(PriceMismatchError):
+        run_async(cart.aadd, product, Decimal("1.00"), validate_price=True)
+    run_async(cart.aadd, product, Decimal("10.00"), quantity=2)
+    with pytest.raises(InvalidQuantity):
+        run_async(cart.aadd, product, Decimal("10.00"), quantity=2)
+
+    assert run_async(cart.acount) == 2
+
+
+def test_aadd_checks_inventory_before_writing(run_async, settings, rf_request, product):
+    settings.CART_INVENTORY_CHECKER = "tests.test_inventory.FailingInventoryChecker"
+    cart = run_async(AsyncCart.load, rf_request)
+
+    with pytest.raises(InsufficientStock):
+        run_async(cart.aadd, product, Decimal("10.00"), check_inventory=True)
+
+    assert run_async(cart.ais_empty) is True
+
+
+def test_aupdate_and_aremove(run_async, rf_request, product, product_factory):
+    other = product_factory(name="AsyncOther")
+    cart = run_async(AsyncCart.load, rf_request)
+    run_async(cart.aadd, product, Decimal("10.00"))
+    run_async(cart.aadd, other, Decimal("5.00"))
+
+    item = run_async(cart.aupdate, product, 4, unit_price=Decimal("9.00"))
+    assert (item.quantity, item.unit_price) == (4, Decimal("9.00"))
+
+    run_async(cart.aupdate, other, 0)
+    assert run_async(cart.aunique_count) == 1
+
+    run_async(cart.aremove, product)
+    assert run_async(cart.ais_empty) is True
+
+    with pytest.raises(ItemDoesNotExist):
+        run_async(cart.aremove, product)
+    with pytest.raises(ItemDoesNotExist):
+        run_async(cart.aupdate, product, 1)
+
+
+def test_async_iteration_yields_items(run_async, rf_request, product_factory):
+    cart = run_async(AsyncCart.load, rf_request)
+    for i in range(3):
+        run_async(cart.aadd, product_factory(name=f"AsyncIter{i}"), Decimal("1.00"))
+
+    async def collect():
+        return [item async for item in cart]
+
+    assert len(run_async(collect)) == 3
+
+
+def test_async_iteration_honours_product_prefetch(
+    run_async, settings, rf_request, product_factory, django_assert_num_queries
+):
+    settings.CART_PREFETCH_PRODUCTS = True
+    cart = run_async(AsyncCart.load, rf_request)
+    for i in range(5):
+        run_async(cart.aadd, product_factory(name=f"AsyncPrefetch{i}"), Decimal("1.00"))
+
+    async def names():
+        return [item.product.name async for item in cart]
+
+    with django_assert_num_queries(2):
+        assert len(run_async(names)) == 5
+
+
+def test_atotal_and_acheckout_delegate_to_the_sync_facade(
+    run_async, rf_request, product
+):
+    cart = run_async(AsyncCart.load, rf_request)
+    run_async(cart.aadd, product, Decimal("10.00"), quantity=2)
+
+    assert run_async(cart.atotal) == Decimal("20.00")
+
+    run_async(cart.acheckout)
+    assert cart.cart.checked_out is True
+    assert CartModel.objects.get(pk=cart.cart.pk).checked_out is True
+
+
+def test_acheckout_on_an_empty_cart_raises(run_async, rf_request):
+    cart = run_async(AsyncCart.load, rf_request)
+
+    with pytest.raises(CartException, match="empty"):
+        run_async(cart.acheckout)
+
+
+def test_amerge_accepts_async_and_sync_carts(
+    run_async, rf_request, other_cart, product
+):
+    other_cart.add(product, Decimal("10.00"), quantity=2)
+    cart = run_async(AsyncCart.load, rf_request, lazy=True)
+
+    run_async(cart.amerge, other_cart)
+
+    assert cart.cart.pk is not None
+    assert run_async(cart.acount) == 2
+    assert other_cart.count() == 0
+
+
+def test_mutations_fire_signals_with_async_sender(run_async, rf_request, product):
+    seen = []
+
+    def receiver(sender, **kwargs):
+        seen.append(sender)
+
+    cart_item_added.connect(receiver)
+    try:
+        cart = run_async(AsyncCart.load, rf_request)
+        run_async(cart.aadd, product, Decimal("10.00"))
+    finally:
+        cart_item_added.disconnect(receiver)
+
+    assert seen == [AsyncCart]
+
+
+def test_mutations_bump_the_totals_cache(run_async, settings, rf_request, product):
+    from django.core.cache import caches
+
+    settings.CART_CACHE = "default"
+    caches["default"].clear()
+    cart = run_async(AsyncCart.load, rf_request)
+    run_async(cart.aadd, product, Decimal("10.00"))
+    assert run_async(cart.acount) == 1
+
+    run_async(cart.aadd, product, Decimal("10.00"))
+
+    fresh = run_async(AsyncCart.load, rf_request)
+    assert run_async(fresh.acount) == 2
+    assert Cart(rf_request).count() == 2
+    caches["default"].clear()
+
+
+def test_mutations_maintain_denormalized_totals(
+    run_async, settings, rf_request, product
+):
+    settings.CART_DENORMALIZED_TOTALS = True
+    cart = run_async(AsyncCart.load, rf_request)
+
+    run_async(cart.aadd, product, Decimal("10.00"), quantity=3)
+
+    assert run_async(cart.asummary) == Decimal("30.00")
+    assert CartModel.objects.get(pk=cart.cart.pk).unit_count == 3
+
+
+def test_failed_totals_recompute_rolls_back_the_line_write(
+    run_async, settings, monkeypatch, rf_request, product
+):
+    from cart.models import CartQuerySet, Item
+
+    settings.CART_DENORMALIZED_TOTALS = True
+    cart = run_async(AsyncCart.load, rf_request)
+    run_async(cart.aadd, product, Decimal("10.00"), quantity=3)
+
+    def broken(self):
+        raise RuntimeError("recompute failed")
+
+    monkeypatch.setattr(CartQuerySet, "recompute_totals", broken)
+    with pytest.raises(RuntimeError):
+        run_async(cart.aadd, product, Decimal("10.00"))
+    with pytest.raises(RuntimeError):
+        run_async(cart.aupdate, product, quantity=1)
+
+    assert Item.objects.get().quantity == 3
+    assert CartModel.objects.get(pk=cart.cart.pk).unit_count == 3
+
+
+def test_django_session_adapter_async_methods(run_async, rf_request):
+    adapter = DjangoSessionAdapter(rf_request)
+
+    run_async(adapter.aset_cart_id, 42)
+
+    assert run_async(adapter.aget_or_create_cart_id) == 42
+
+
+def test_django_session_adapter_uses_the_async_session_api(run_async, rf_request):
+    from django.contrib.sessions.backends.signed_cookies import SessionStore
+
+    rf_request.session = SessionStore()
+    adapter = DjangoSessionAdapter(rf_request)
+
+    run_async(adapter.aset_cart_id, 42)
+
+    assert rf_request.session[CART_ID] == 42
+    assert run_async(adapter.aget_or_create_cart_id) == 42
+
+
+def test_cookie_session_adapter_async_methods(run_async, rf_request):
+    adapter = CookieSessionAdapter(rf_request)
+
+    run_async(adapter.aset_cart_id, 7)
+
+    assert run_async(adapter.aget_or_create_cart_id) == 7
@@ -0,0 +1,58 @@
+"""``Cart.last_activity`` — throttled bumps on facade mutations."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone
+
+from cart.cart import Cart
+from cart.models import Cart as CartModel
+
+pytestmark = pytest.mark.django_db
+
+
+def age_cart(cart: Cart, **delta) -> None:
+    then = timezone.now() - timedelta(**delta)
+    CartModel.objects.filter(pk=cart.cart.pk).update(last_activity=then)
+    cart.cart.last_activity = then
+
+
+def stored_activity(cart: Cart):
+    return CartModel.objects.values_list("last_activity", flat=True).get(
+        pk=cart.cart.pk
+    )
+
+
+def test_stale_cart_is_bumped_on_mutation(rf_request, product):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    age_cart(cart, days=3)
+
+    cart.update(product, quantity=2)
+
+    assert stored_activity(cart) > timezone.now() - timedelta(minutes=1)
+
+
+def test_recent_activity_costs_no_extra_update(
+    rf_request, product, django_assert_num_queries
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    age_cart(cart, seconds=10)
+
+    with django_assert_num_queries(0):
+        cart._touch()
+
+
+def test_throttle_none_disables_tracking(settings, rf_request, product):
+    settings.CART_ACTIVITY_THROTTLE = None
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    age_cart(cart, days=3)
+
+    cart.update(product, quantity=2)
+
+    assert stored_activity(cart) < timezone.now() - timedelta(days=2)
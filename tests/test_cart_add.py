@@ -6,7 +6,7 @@ from decimal import Decimal
 
 import pytest
 
-from cart.cart import InvalidQuantity
+from cart.cart import Cart, InvalidQuantity
 
 pytestmark = pytest.mark.django_db
 
@@ -41,3 +41,26 @@ def test_add_defaults_to_quantity_of_one(cart, product):
 def test_add_with_non_positive_quantity_raises(cart, product, invalid_quantity):
     with pytest.raises(InvalidQuantity):
         cart.add(product, Decimal("5.00"), quantity=invalid_quantity)
+
+
+def test_add_sees_a_line_another_facade_added_after_a_lookup(cart, rf_request, product):
+    other = Cart(rf_request)
+    assert product not in other
+    cart.add(product, Decimal("5.00"))
+
+    other.add(product, Decimal("5.00"))
+
+    assert Cart(rf_request).count() == 2
+
+
+def test_add_builds_on_the_stored_quantity_not_a_remembered_one(
+    cart, rf_request, product
+):
+    cart.add(product, Decimal("5.00"))
+    other = Cart(rf_request)
+    assert product in other
+    cart.add(product, Decimal("5.00"), quantity=2)
+
+    other.add(product, Decimal("5.00"))
+
+    assert Cart(rf_request).count() == 4
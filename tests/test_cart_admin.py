@@ -73,3 +73,124 @@ def test_cart_admin_changelist_filters_by_checked_out(superuser_client):
 
     assert response.status_code == 200
     assert str(checked.pk).encode() in response.content
+
+
+# --------------------------------------------------------------------------- #
+# Annotated totals, estimated counts and product prefetch
+# --------------------------------------------------------------------------- #
+
+
+def _changelist_queries(client, **params):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get("/admin/cart/cart/", params)
+    assert response.status_code == 200
+    return response, len(ctx.captured_queries)
+
+
+def test_changelist_query_count_does_not_grow_with_rows(
+    superuser_client, product, product_factory
+):
+    from django.contrib.contenttypes.models import ContentType
+
+    from cart.models import Item
+
+    def make_cart():
+        cart = CartModel.objects.create()
+        for p in (product, product_factory()):
+            Item.objects.create(
+                cart=cart,
+                content_type=ContentType.objects.get_for_model(p),
+                object_id=p.pk,
+                unit_price=Decimal("2.50"),
+                quantity=2,
+            )
+
+    make_cart()
+    _, few = _changelist_queries(superuser_client)
+    for _ in range(5):
+        make_cart()
+    _, many = _changelist_queries(superuser_client)
+
+    assert many == few
+
+
+def test_changelist_shows_annotated_totals_and_sorts_by_subtotal(
+    superuser_client, product, product_factory
+):
+    from cart.cart import Cart
+
+    CartModel.objects.all().delete()
+    admin_site = superuser_client.get("/admin/cart/cart/").wsgi_request
+    small = Cart(admin_site)
+    small.add(product, Decimal("1.00"))
+    big = Cart(_other_request())
+    big.add(product, Decimal("10.00"), quantity=3)
+    big.add(product_factory(), Decimal("5.00"))
+
+    from django.contrib.admin.sites import site
+
+    changelist_admin = site._registry[CartModel]
+    row = changelist_admin.get_queryset(admin_site).get(pk=big.cart.pk)
+    assert changelist_admin.item_count(row) == 2
+    assert changelist_admin.unit_count(row) == 4
+    assert changelist_admin.subtotal(row) == Decimal("35.00")
+
+    # Column 6 is ``subtotal``; ``o=-6`` sorts it descending.
+    response, _ = _changelist_queries(superuser_client, o="-6")
+    body = response.content.decode()
+    assert body.index(f"/cart/cart/{big.cart.pk}/") < body.index(
+        f"/cart/cart/{small.cart.pk}/"
+    )
+
+
+def _other_request():
+    from django.test import RequestFactory
+
+    request = RequestFactory().get("/")
+    request.session = {}
+    return request
+
+
+def test_change_page_loads_products_in_bulk(
+    superuser_client, cart, product, product_factory
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    cart.add(product, Decimal("10.00"))
+    url = f"/admin/cart/cart/{cart.cart.pk}/change/"
+    superuser_client.get(url)  # warm the content-type cache
+    with CaptureQueriesContext(connection) as few:
+        superuser_client.get(url)
+    for _ in range(4):
+        cart.add(product_factory(), Decimal("1.00"))
+    with CaptureQueriesContext(connection) as many:
+        response = superuser_client.get(url)
+
+    assert response.status_code == 200
+    assert len(many.captured_queries) == len(few.captured_queries)
+    assert product.name in response.content.decode()
+
+
+def test_estimated_count_is_used_only_above_the_threshold(monkeypatch):
+    from cart.admin import EstimatedCountPaginator
+
+    CartModel.objects.create()
+    paginator = EstimatedCountPaginator(CartModel.objects.order_by("pk"), 100)
+    monkeypatch.setattr(paginator, "_estimate", lambda: 30_000_000)
+    assert paginator.count == 30_000_000
+
+    small = EstimatedCountPaginator(CartModel.objects.order_by("pk"), 100)
+    monkeypatch.setattr(small, "_estimate", lambda: 50)
+    assert small.count == 1
+
+
+def test_estimate_is_skipped_for_filtered_querysets():
+    from cart.admin import EstimatedCountPaginator
+
+    qs = CartModel.objects.filter(checked_out=True).order_by("pk")
+
+    assert EstimatedCountPaginator(qs, 100)._estimate() is None
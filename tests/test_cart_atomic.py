@@ -76,3 +76,37 @@ def test_update_on_unknown_product_leaves_cart_unchanged(
         cart.update(ghost, quantity=5)
 
     assert cart.cart.items.first().quantity == 1
+
+
+def test_add_over_max_quantity_keeps_facade_state_consistent(
+    settings, rf_request, product
+):
+    """A rejected increment rolls back in the DB *and* in the facade's
+    line index — the next read must not see the aborted quantity."""
+    settings.CART_MAX_QUANTITY_PER_ITEM = 5
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("5.00"), quantity=4)
+
+    with pytest.raises(InvalidQuantity):
+        cart.add(product, Decimal("5.00"), quantity=3)
+
+    cart.add(product, Decimal("5.00"), quantity=1)
+    assert cart.cart.items.first().quantity == 5
+
+
+def test_add_bulk_failure_does_not_leave_phantom_lines_in_the_facade(
+    rf_request, product_factory
+):
+    good = product_factory(name="IndexGood")
+    bad = product_factory(name="IndexBad")
+    cart = Cart(rf_request)
+
+    with pytest.raises(InvalidQuantity):
+        cart.add_bulk(
+            [
+                {"product": good, "unit_price": Decimal("1.00"), "quantity": 1},
+                {"product": bad, "unit_price": Decimal("1.00"), "quantity": 0},
+            ]
+        )
+
+    assert (good in cart) is False
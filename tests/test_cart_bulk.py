@@ -1,4 +1,4 @@
-"""Cart.add_bulk: multi-item add in a single transaction."""
+"""Bulk mutations: Cart.add_bulk, Cart.remove_many, Cart.update_many."""
 
 from __future__ import annotations
 
@@ -6,6 +6,8 @@ from decimal import Decimal
 
 import pytest
 
+from cart.cart import Cart
+
 pytestmark = pytest.mark.django_db
 
 
@@ -90,3 +92,161 @@ def test_add_bulk_raises_on_invalid_quantity_and_rolls_back_earlier_items(
 
     # Atomic rollback: neither item should have been saved.
     assert cart.is_empty() is True
+
+
+def test_add_bulk_mixes_inserts_and_updates(cart, product_factory):
+    existing = product_factory(name="BulkExisting")
+    new = product_factory(name="BulkNew")
+    cart.add(existing, Decimal("10.00"), quantity=1)
+
+    result = cart.add_bulk(
+        [
+            {"product": existing, "unit_price": Decimal("12.00"), "quantity": 4},
+            {"product": new, "unit_price": Decimal("3.00"), "quantity": 2},
+        ]
+    )
+
+    assert [item.quantity for item in result] == [4, 2]
+    assert all(item.pk is not None for item in result)
+    assert cart.unique_count() == 2
+    assert cart.summary() == Decimal("54.00")
+
+
+def test_add_bulk_last_duplicate_entry_wins(cart, product):
+    result = cart.add_bulk(
+        [
+            {"product": product, "unit_price": Decimal("1.00"), "quantity": 1},
+            {"product": product, "unit_price": Decimal("2.00"), "quantity": 3},
+        ]
+    )
+
+    assert result[0] is result[1]
+    assert cart.cart.items.get().quantity == 3
+    assert cart.cart.items.get().unit_price == Decimal("2.00")
+
+
+def test_add_bulk_query_count_is_independent_of_batch_size(
+    rf_request, cart, product_factory, django_assert_max_num_queries
+):
+    """One SELECT of existing lines, one INSERT, one UPDATE plus the
+    savepoint pair — 200 lines no longer cost ~400 queries."""
+    products = [product_factory(name=f"Quick{i}") for i in range(200)]
+    for p in products[:50]:
+        cart.add(p, Decimal("1.00"))
+    fresh = Cart(rf_request)
+
+    with django_assert_max_num_queries(5):
+        fresh.add_bulk(
+            [
+                {"product": p, "unit_price": Decimal("2.00"), "quantity": 2}
+                for p in products
+            ]
+        )
+
+    assert fresh.count() == 400
+
+
+# --------------------------------------------------------------------------- #
+# remove_many
+# --------------------------------------------------------------------------- #
+
+
+def test_remove_many_deletes_every_listed_product(cart, product_factory):
+    products = [product_factory(name=f"Rm{i}") for i in range(4)]
+    for p in products:
+        cart.add(p, Decimal("1.00"))
+
+    cart.remove_many(products[:3])
+
+    assert cart.unique_count() == 1
+    assert products[3] in cart
+
+
+def test_remove_many_is_a_single_delete(
+    cart, product_factory, django_assert_num_queries
+):
+    products = [product_factory(name=f"RmQ{i}") for i in range(30)]
+    for p in products:
+        cart.add(p, Decimal("1.00"))
+
+    with django_assert_num_queries(1):
+        cart.remove_many(products)
+
+    assert cart.is_empty() is True
+
+
+def test_remove_many_with_unknown_product_removes_nothing(cart, product_factory):
+    from cart.cart import ItemDoesNotExist
+
+    present = product_factory(name="RmPresent")
+    ghost = product_factory(name="RmGhost")
+    cart.add(present, Decimal("1.00"))
+
+    with pytest.raises(ItemDoesNotExist):
+        cart.remove_many([present, ghost])
+
+    assert present in cart
+
+
+# --------------------------------------------------------------------------- #
+# update_many
+# --------------------------------------------------------------------------- #
+
+
+def test_update_many_sets_quantities_and_drops_zeroes(cart, product_factory):
+    a = product_factory(name="UpA")
+    b = product_factory(name="UpB")
+    c = product_factory(name="UpC")
+    for p in (a, b, c):
+        cart.add(p, Decimal("2.00"))
+
+    updated = cart.update_many({a: 3, b: 0, c: 5})
+
+    assert [item.quantity for item in updated] == [3, 5]
+    assert b not in cart
+    assert cart.count() == 8
+    assert cart.summary() == Decimal("16.00")
+
+
+def test_update_many_is_one_update_and_one_delete(
+    cart, product_factory, django_assert_num_queries
+):
+    """30 lines: SAVEPOINT, DELETE, CASE/WHEN UPDATE, RELEASE."""
+    products = [product_factory(name=f"UpQ{i}") for i in range(30)]
+    for p in products:
+        cart.add(p, Decimal("1.00"))
+
+    with django_assert_num_queries(4) as captured:
+        cart.update_many({p: (0 if i < 5 else 2) for i, p in enumerate(products)})
+
+    assert any("CASE" in q["sql"] for q in captured.captured_queries)
+    assert cart.count() == 50
+
+
+@pytest.mark.parametrize("quantity", [-1, 11], ids=["negative", "over-max"])
+def test_update_many_rejects_invalid_quantity_before_writing(
+    settings, cart, product_factory, quantity
+):
+    from cart.cart import InvalidQuantity
+
+    settings.CART_MAX_QUANTITY_PER_ITEM = 10
+    ok = product_factory(name="UpOk")
+    bad = product_factory(name="UpBad")
+    cart.add(ok, Decimal("1.00"))
+    cart.add(bad, Decimal("1.00"))
+
+    with pytest.raises(InvalidQuantity):
+        cart.update_many({ok: 4, bad: quantity})
+
+    assert cart.count() == 2
+
+
+def test_update_many_with_unknown_product_raises(cart, product, product_factory):
+    from cart.cart import ItemDoesNotExist
+
+    cart.add(product, Decimal("1.00"))
+
+    with pytest.raises(ItemDoesNotExist):
+        cart.update_many({product: 2, product_factory(name="UpGhost"): 1})
+
+    assert cart.count() == 1
@@ -0,0 +1,108 @@
+"""Cross-request totals cache: ``CART_CACHE`` / :mod:`cart.cache`."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from cart.cache import bump_version, get_version
+from cart.cart import Cart
+
+pytestmark = pytest.mark.django_db
+
+
+def test_second_request_reads_totals_without_aggregates(
+    totals_cache, rf_request, product, django_assert_num_queries
+):
+    first = Cart(rf_request)
+    first.add(product, Decimal("10.00"), quantity=3)
+    assert first.count() == 3
+    assert first.summary() == Decimal("30.00")
+
+    again = Cart(rf_request)
+    with django_assert_num_queries(0):
+        assert again.count() == 3
+        assert again.summary() == Decimal("30.00")
+
+
+def test_mutation_from_another_facade_invalidates_cached_totals(
+    totals_cache, rf_request, product, product_factory
+):
+    Cart(rf_request).add(product, Decimal("10.00"), quantity=1)
+    reader = Cart(rf_request)
+    assert reader.count() == 1
+
+    Cart(rf_request).add(product_factory(name="Second"), Decimal("5.00"), quantity=2)
+
+    fresh = Cart(rf_request)
+    assert fresh.count() == 3
+    assert fresh.summary() == Decimal("20.00")
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda cart, product: cart.update(product, quantity=7),
+        lambda cart, product: cart.remove(product),
+        lambda cart, product: cart.remove_many([product]),
+        lambda cart, product: cart.update_many({product: 4}),
+        lambda cart, product: cart.clear(),
+        lambda cart, product: cart.add_bulk(
+            [{"product": product, "unit_price": Decimal("2.00"), "quantity": 9}]
+        ),
+    ],
+    ids=["update", "remove", "remove_many", "update_many", "clear", "add_bulk"],
+)
+def test_every_mutation_bumps_the_version(totals_cache, rf_request, product, mutate):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"), quantity=2)
+    cart.summary()
+
+    mutate(Cart(rf_request), product)
+
+    expected = Cart(rf_request, snapshot=True).summary()
+    assert Cart(rf_request).summary() == expected
+
+
+def test_merge_bumps_both_carts(totals_cache, cart, other_cart, product):
+    other_cart.add(product, Decimal("10.00"), quantity=2)
+    assert other_cart.count() == 2
+    assert cart.count() == 0
+
+    cart.merge(other_cart)
+
+    assert cart.count() == 2
+    assert other_cart.count() == 0
+
+
+def test_writes_behind_the_facade_need_an_explicit_bump(
+    totals_cache, rf_request, product
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"), quantity=2)
+    assert cart.count() == 2
+    cart.cart.items.update(quantity=5)
+
+    assert Cart(rf_request).count() == 2
+
+    bump_version(totals_cache, cart.cart.pk)
+    assert Cart(rf_request).count() == 5
+
+
+def test_evicted_version_restarts_above_any_previous_value(totals_cache, cart):
+    before = get_version(totals_cache, cart.cart.pk)
+    totals_cache.clear()
+
+    assert get_version(totals_cache, cart.cart.pk) > before
+
+
+def test_cache_is_not_consulted_when_unset(
+    settings, rf_request, product, django_assert_num_queries
+):
+    settings.CART_CACHE = None
+    Cart(rf_request).add(product, Decimal("10.00"), quantity=1)
+
+    again = Cart(rf_request)
+    with django_assert_num_queries(1):
+        assert again.count() == 1
@@ -0,0 +1,108 @@
+"""Chunked iteration: ``iter_items``, ``iter_serializable``, ``items_page``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from cart.cart import Cart
+from tests.test_app.models import FakeProductNoPrice
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def big_cart(cart, product_factory, discount_percent):
+    cart.add_bulk(
+        [
+            {
+                "product": product_factory(name=f"Chunk{i}"),
+                "unit_price": Decimal("1.00"),
+                "quantity": i + 1,
+            }
+            for i in range(25)
+        ]
+    )
+    cart.apply_discount("PERCENT20")
+    return cart
+
+
+def test_iter_items_yields_every_line_in_pk_order(big_cart):
+    items = list(big_cart.iter_items(chunk_size=10))
+
+    assert len(items) == 25
+    assert [i.pk for i in items] == sorted(i.pk for i in items)
+
+
+def test_iter_items_costs_two_queries_per_chunk(big_cart, django_assert_num_queries):
+    # 3 chunks × (items + one product model); the last page is short.
+    with django_assert_num_queries(6):
+        names = [item.product.name for item in big_cart.iter_items(chunk_size=10)]
+
+    assert len(names) == 25
+
+
+def test_iter_items_without_products_is_one_query_per_chunk(
+    big_cart, django_assert_num_queries
+):
+    # A full last page needs one more (empty) query to know it is the last.
+    with django_assert_num_queries(6):
+        assert len(list(big_cart.iter_items(chunk_size=5, with_products=False))) == 25
+
+
+def test_iter_items_prefetches_each_product_model(
+    cart, product, django_assert_num_queries
+):
+    cart.add(product, Decimal("10.00"))
+    cart.add(FakeProductNoPrice.objects.create(name="Other"), Decimal("2.00"))
+
+    with django_assert_num_queries(3):
+        assert len([i.product for i in cart.iter_items()]) == 2
+
+
+def test_iter_serializable_matches_cart_serializable(big_cart):
+    pairs = list(big_cart.iter_serializable(chunk_size=7))
+
+    assert pairs[-1] == ("__discount__", {"code": "PERCENT20"})
+    assert dict(pairs) == big_cart.cart_serializable()
+
+
+def test_items_page_walks_forward_with_after(big_cart):
+    first = big_cart.items_page(limit=10)
+    second = big_cart.items_page(after=first[-1].pk, limit=10)
+    last = big_cart.items_page(after=second[-1].pk, limit=10)
+
+    assert [len(first), len(second), len(last)] == [10, 10, 5]
+    assert first[-1].pk < second[0].pk
+
+
+def test_items_page_accepts_a_string_cursor(big_cart):
+    first = big_cart.items_page(limit=3)
+
+    assert big_cart.items_page(after=str(first[-1].pk), limit=3)[0].pk > first[-1].pk
+
+
+def test_items_page_rejects_non_positive_limit(cart):
+    with pytest.raises(ValueError, match="limit"):
+        cart.items_page(limit=0)
+
+
+def test_items_page_is_served_from_the_snapshot(
+    rf_request, big_cart, django_assert_num_queries
+):
+    snap = Cart(rf_request, snapshot=True)
+    expected = [i.pk for i in big_cart.items_page(limit=10)][5:]
+
+    with django_assert_num_queries(0):
+        page = snap.items_page(after=expected[0] - 1, limit=5, with_products=False)
+
+    assert [i.pk for i in page] == expected
+
+
+def test_lazy_cart_iterates_without_queries(rf_request, django_assert_num_queries):
+    cart = Cart(rf_request, lazy=True)
+
+    with django_assert_num_queries(0):
+        assert list(cart.iter_items()) == []
+        assert list(cart.iter_serializable()) == []
@@ -0,0 +1,150 @@
+"""Denormalized cart totals: ``CART_DENORMALIZED_TOTALS``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from django.template import Context
+
+from cart.cart import Cart
+from cart.models import Cart as CartModel
+from cart.templatetags.cart_tags import cart_is_empty, cart_item_count, cart_summary
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def denormalized(settings):
+    settings.CART_DENORMALIZED_TOTALS = True
+
+
+def _stored(cart):
+    return CartModel.objects.values_list("line_count", "unit_count", "subtotal").get(
+        pk=cart.cart.pk
+    )
+
+
+@pytest.mark.parametrize(
+    "mutate, expected",
+    [
+        (lambda cart, a, b: None, (2, 5, Decimal("35.00"))),
+        (lambda cart, a, b: cart.add(a, Decimal("10.00")), (2, 6, Decimal("45.00"))),
+        (lambda cart, a, b: cart.update(a, quantity=1), (2, 4, Decimal("25.00"))),
+        (lambda cart, a, b: cart.update(a, quantity=0), (1, 3, Decimal("15.00"))),
+        (lambda cart, a, b: cart.remove(b), (1, 2, Decimal("20.00"))),
+        (lambda cart, a, b: cart.remove_many([a, b]), (0, 0, Decimal("0.00"))),
+        (lambda cart, a, b: cart.update_many({a: 3, b: 0}), (1, 3, Decimal("30.00"))),
+        (lambda cart, a, b: cart.clear(), (0, 0, Decimal("0.00"))),
+        (
+            lambda cart, a, b: cart.add_bulk(
+                [{"product": b, "unit_price": Decimal("1.00"), "quantity": 1}]
+            ),
+            (2, 3, Decimal("21.00")),
+        ),
+    ],
+    ids=[
+        "add",
+        "add-existing",
+        "update",
+        "update-zero",
+        "remove",
+        "remove_many",
+        "update_many",
+        "clear",
+        "add_bulk",
+    ],
+)
+def test_every_mutation_keeps_the_columns_in_step(
+    denormalized, cart, product_factory, mutate, expected
+):
+    a = product_factory(name="DenormA")
+    b = product_factory(name="DenormB")
+    cart.add(a, Decimal("10.00"), quantity=2)
+    cart.add(b, Decimal("5.00"), quantity=3)
+
+    mutate(cart, a, b)
+
+    assert _stored(cart) == expected
+    assert (cart.unique_count(), cart.count(), cart.summary()) == expected
+
+
+def test_upsert_add_keeps_the_columns_in_step(settings, denormalized, cart, product):
+    settings.CART_UPSERT_ADD = True
+
+    cart.add(product, Decimal("10.00"), quantity=2)
+    cart.add(product, Decimal("10.00"), quantity=1)
+
+    assert _stored(cart) == (1, 3, Decimal("30.00"))
+
+
+def test_merge_updates_both_carts(denormalized, cart, other_cart, product):
+    other_cart.add(product, Decimal("10.00"), quantity=2)
+
+    cart.merge(other_cart)
+
+    assert _stored(cart) == (1, 2, Decimal("20.00"))
+    assert _stored(other_cart) == (0, 0, Decimal("0.00"))
+
+
+def test_from_serializable_fills_the_columns(denormalized, rf_request, cart, product):
+    cart.add(product, Decimal("10.00"), quantity=2)
+    payload = cart.cart_serializable()
+    cart.clear()
+
+    restored = Cart.from_serializable(rf_request, payload)
+
+    assert _stored(restored) == (1, 2, Decimal("20.00"))
+
+
+def test_reading_totals_is_a_primary_key_lookup(
+    denormalized, rf_request, product, django_assert_num_queries
+):
+    Cart(rf_request).add(product, Decimal("10.00"), quantity=4)
+
+    with django_assert_num_queries(1):
+        cart = Cart(rf_request)
+        assert cart.count() == 4
+        assert cart.unique_count() == 1
+        assert cart.summary() == Decimal("40.00")
+
+
+def test_failed_mutation_rolls_the_columns_back(settings, denormalized, cart, product):
+    from cart.cart import InvalidQuantity
+
+    settings.CART_MAX_QUANTITY_PER_ITEM = 5
+    cart.add(product, Decimal("10.00"), quantity=4)
+
+    with pytest.raises(InvalidQuantity):
+        cart.add(product, Decimal("10.00"), quantity=3)
+
+    assert _stored(cart) == (1, 4, Decimal("40.00"))
+
+
+def test_str_uses_the_line_count_column(
+    denormalized, cart, product, django_assert_num_queries
+):
+    cart.add(product, Decimal("10.00"), quantity=3)
+    row = CartModel.objects.get(pk=cart.cart.pk)
+
+    with django_assert_num_queries(0):
+        assert str(row) == f"Cart #{row.pk} (1 items)"
+
+
+def test_template_tags_read_the_columns(
+    denormalized, rf_request, product, django_assert_num_queries
+):
+    Cart(rf_request).add(product, Decimal("2.50"), quantity=4)
+    context = Context({"request": rf_request})
+
+    with django_assert_num_queries(1):
+        assert cart_item_count(context) == 4
+        assert cart_summary(context) == "$10.00"
+        assert cart_is_empty(context) is False
+
+
+def test_columns_are_left_alone_when_the_setting_is_off(cart, product):
+    cart.add(product, Decimal("10.00"), quantity=2)
+
+    assert _stored(cart) == (0, 0, Decimal("0.00"))
+    assert cart.count() == 2
@@ -0,0 +1,98 @@
+"""Cart fingerprint (``Cart.etag``) and ``cart.decorators.cart_condition``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from cart.cart import Cart
+
+pytestmark = pytest.mark.django_db
+
+
+def test_etag_is_stable_until_the_content_changes(
+    rf_request, product, discount_percent
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    first = cart.etag()
+
+    assert Cart(rf_request).etag() == first
+    assert Cart(rf_request, snapshot=True).etag() == first
+
+    cart.update(product, quantity=2)
+    second = cart.etag()
+    assert second != first
+
+    cart.update(product, quantity=2, unit_price=Decimal("9.00"))
+    third = cart.etag()
+    assert third != second
+
+    cart.apply_discount("PERCENT20")
+    assert cart.etag() != third
+
+
+def test_etag_of_an_unsaved_cart_costs_no_query(rf_request, django_assert_num_queries):
+    cart = Cart(rf_request, lazy=True)
+
+    with django_assert_num_queries(0):
+        assert cart.etag() == "empty"
+
+
+def test_etag_hash_is_one_query(cart, product, django_assert_num_queries):
+    cart.add(product, Decimal("10.00"))
+
+    with django_assert_num_queries(1):
+        cart.etag()
+
+
+def test_etag_uses_the_cache_version_when_configured(
+    totals_cache, cart, product, django_assert_num_queries
+):
+    cart.add(product, Decimal("10.00"))
+
+    with django_assert_num_queries(0):
+        first = cart.etag()
+
+    cart.add(product, Decimal("10.00"))
+    assert cart.etag() != first
+
+
+def test_checkout_changes_the_cached_etag(totals_cache, cart, product):
+    cart.add(product, Decimal("10.00"))
+    before = cart.etag()
+
+    cart.checkout()
+
+    assert cart.etag() != before
+
+
+def test_endpoint_answers_304_when_if_none_match_matches(client, product):
+    client.post(f"/cart/add/{product.pk}/", {"quantity": 1})
+
+    first = client.get("/cart/state/")
+    etag = first["ETag"]
+    assert first.status_code == 200
+
+    again = client.get("/cart/state/", HTTP_IF_NONE_MATCH=etag)
+    assert again.status_code == 304
+    assert again.content == b""
+
+    client.post(f"/cart/add/{product.pk}/", {"quantity": 1})
+    changed = client.get("/cart/state/", HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
+
+
+def test_cached_304_skips_the_database(
+    totals_cache, client, product, django_assert_num_queries
+):
+    client.post(f"/cart/add/{product.pk}/", {"quantity": 1})
+    etag = client.get("/cart/state/")["ETag"]
+
+    # Only the session load remains.
+    with django_assert_num_queries(1):
+        response = client.get("/cart/state/", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
@@ -0,0 +1,171 @@
+"""Lazy cart-row materialisation: ``Cart(request, lazy=True)`` /
+``CART_LAZY_CREATE``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from cart.cart import CART_ID, Cart, CartException, ItemDoesNotExist
+from cart.models import Cart as CartModel
+
+pytestmark = pytest.mark.django_db
+
+
+def test_lazy_cart_does_not_insert_a_row_on_construction(rf_request):
+    Cart(rf_request, lazy=True)
+
+    assert CartModel.objects.count() == 0
+    assert CART_ID not in rf_request.session
+
+
+def test_setting_enables_lazy_mode_by_default(settings, rf_request):
+    settings.CART_LAZY_CREATE = True
+
+    Cart(rf_request)
+
+    assert CartModel.objects.count() == 0
+
+
+def test_explicit_lazy_false_overrides_the_setting(settings, rf_request):
+    settings.CART_LAZY_CREATE = True
+
+    cart = Cart(rf_request, lazy=False)
+
+    assert cart.cart.pk is not None
+    assert rf_request.session[CART_ID] == cart.cart.pk
+
+
+def test_read_methods_on_a_lazy_cart_issue_no_queries(
+    rf_request, django_assert_num_queries
+):
+    cart = Cart(rf_request, lazy=True)
+
+    with django_assert_num_queries(0):
+        assert cart.count() == 0
+        assert cart.unique_count() == 0
+        assert cart.summary() == Decimal("0.00")
+        assert cart.is_empty() is True
+        assert cart.total() == Decimal("0.00")
+        assert list(cart) == []
+        assert cart.cart_serializable() == {}
+
+
+def test_membership_check_on_a_lazy_cart_issues_no_queries(
+    rf_request, product, django_assert_num_queries
+):
+    cart = Cart(rf_request, lazy=True)
+
+    with django_assert_num_queries(0):
+        assert (product in cart) is False
+
+
+def test_first_add_materialises_the_row_and_session_id(rf_request, product):
+    cart = Cart(rf_request, lazy=True)
+
+    cart.add(product, Decimal("10.00"), quantity=2)
+
+    assert CartModel.objects.filter(pk=cart.cart.pk).exists()
+    assert rf_request.session[CART_ID] == cart.cart.pk
+    assert cart.count() == 2
+
+
+def test_materialised_lazy_cart_is_reused_by_the_next_request(rf_request, product):
+    Cart(rf_request, lazy=True).add(product, Decimal("10.00"))
+
+    again = Cart(rf_request, lazy=True)
+
+    assert again.count() == 1
+    assert CartModel.objects.count() == 1
+
+
+def test_add_bulk_materialises_a_lazy_cart(rf_request, product):
+    cart = Cart(rf_request, lazy=True)
+
+    cart.add_bulk([{"product": product, "unit_price": Decimal("5.00"), "quantity": 3}])
+
+    assert CartModel.objects.count() == 1
+    assert cart.count() == 3
+
+
+def test_apply_discount_materialises_a_lazy_cart(rf_request, discount_percent):
+    cart = Cart(rf_request, lazy=True)
+
+    cart.apply_discount("PERCENT20")
+
+    assert CartModel.objects.get().discount == discount_percent
+
+
+def test_bind_to_user_materialises_a_lazy_cart(rf_request, django_user_model):
+    user = django_user_model.objects.create_user(username="lazy", password="x")
+    cart = Cart(rf_request, lazy=True)
+
+    cart.bind_to_user(user)
+
+    assert CartModel.objects.get().user == user
+
+
+def test_from_serializable_materialises_a_lazy_cart(settings, rf_request, product):
+    settings.CART_LAZY_CREATE = True
+    source = Cart(rf_request, lazy=False)
+    source.add(product, Decimal("10.00"), quantity=2)
+    payload = source.cart_serializable()
+
+    from django.test import RequestFactory
+
+    fresh = RequestFactory().get("/")
+    fresh.session = {}
+    restored = Cart.from_serializable(fresh, payload)
+
+    assert restored.cart.pk is not None
+    assert fresh.session[CART_ID] == restored.cart.pk
+    assert restored.count() == 2
+
+
+def test_merge_into_a_lazy_cart_materialises_it(rf_request, other_cart, product):
+    other_cart.add(product, Decimal("10.00"), quantity=2)
+    cart = Cart(rf_request, lazy=True)
+
+    cart.merge(other_cart)
+
+    assert cart.cart.pk is not None
+    assert cart.count() == 2
+
+
+def test_merging_a_lazy_empty_cart_does_not_materialise_either(rf_request, cart):
+    from django.test import RequestFactory
+
+    guest_request = RequestFactory().get("/")
+    guest_request.session = {}
+    guest = Cart(guest_request, lazy=True)
+
+    cart.merge(guest)
+
+    assert guest.cart.pk is None
+
+
+def test_remove_on_a_lazy_cart_raises_without_materialising(rf_request, product):
+    cart = Cart(rf_request, lazy=True)
+
+    with pytest.raises(ItemDoesNotExist):
+        cart.remove(product)
+
+    assert CartModel.objects.count() == 0
+
+
+def test_clear_on_a_lazy_cart_is_a_noop(rf_request):
+    cart = Cart(rf_request, lazy=True)
+
+    cart.clear()
+
+    assert CartModel.objects.count() == 0
+
+
+def test_checkout_on_a_lazy_cart_raises_empty(rf_request):
+    cart = Cart(rf_request, lazy=True)
+
+    with pytest.raises(CartException, match="empty"):
+        cart.checkout()
+
+    assert CartModel.objects.count() == 0
@@ -154,3 +154,63 @@ def test_merge_preserves_user_binding_on_target(
 
     cart.cart.refresh_from_db()
     assert cart.cart.user == user
+
+
+# --------------------------------------------------------------------------- #
+# Set-based execution
+# --------------------------------------------------------------------------- #
+
+
+def test_merge_of_large_guest_cart_is_query_bounded(
+    rf_request, cart, other_cart, product_factory, django_assert_max_num_queries
+):
+    """Two line reads, one INSERT, one UPDATE, one DELETE plus the
+    savepoints — independent of the number of lines, and no product
+    table is ever read."""
+    from cart.cart import Cart
+
+    products = [product_factory(name=f"Guest{i}") for i in range(40)]
+    for p in products[:10]:
+        cart.add(p, Decimal("10.00"), quantity=1)
+    for p in products:
+        other_cart.add(p, Decimal("10.00"), quantity=2)
+    target = Cart(rf_request)
+
+    with django_assert_max_num_queries(7) as captured:
+        target.merge(other_cart)
+
+    assert not any(
+        "test_app_fakeproduct" in q["sql"] for q in captured.captured_queries
+    )
+    assert target.count() == 10 * 3 + 30 * 2
+    assert target.unique_count() == 40
+    assert other_cart.is_empty() is True
+
+
+def test_merge_caps_new_and_existing_lines_at_max_quantity(
+    settings, cart, other_cart, product_factory
+):
+    settings.CART_MAX_QUANTITY_PER_ITEM = 5
+    shared = product_factory(name="CapShared")
+    only_other = product_factory(name="CapOther")
+    cart.add(shared, Decimal("1.00"), quantity=4)
+    other_cart.add(shared, Decimal("1.00"), quantity=4)
+    other_cart.add(only_other, Decimal("1.00"), quantity=5)
+
+    cart.merge(other_cart)
+
+    assert cart.cart.items.get(product=shared).quantity == 5
+    assert cart.cart.items.get(product=only_other).quantity == 5
+
+
+def test_merge_keeps_the_target_line_index_in_sync(cart, other_cart, product_factory):
+    a = product_factory(name="SyncA")
+    b = product_factory(name="SyncB")
+    cart.add(a, Decimal("1.00"))
+    other_cart.add(b, Decimal("1.00"), quantity=2)
+
+    cart.merge(other_cart)
+    cart.update(b, quantity=7)
+
+    assert b in cart
+    assert cart.count() == 8
@@ -0,0 +1,180 @@
+"""Optimistic concurrency: ``CART_OPTIMISTIC_LOCKING`` / ``Cart.version``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from cart.async_cart import AsyncCart
+from cart.cart import Cart, ConcurrentModification, ItemDoesNotExist, retry_on_conflict
+from cart.models import Cart as CartModel
+from cart.models import Discount
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def optimistic(settings):
+    settings.CART_OPTIMISTIC_LOCKING = True
+
+
+@pytest.fixture
+def stored_version():
+    """Read a cart's ``version`` straight from the database."""
+
+    def _read(cart: Cart) -> int:
+        return CartModel.objects.values_list("version", flat=True).get(pk=cart.cart.pk)
+
+    return _read
+
+
+def test_version_is_left_alone_when_disabled(rf_request, product, stored_version):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+
+    assert stored_version(cart) == 0
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda cart, product: cart.add(product, Decimal("1.00")),
+        lambda cart, product: cart.update(product, quantity=4),
+        lambda cart, product: cart.remove(product),
+        lambda cart, product: cart.clear(),
+        lambda cart, product: cart.apply_discount("PERCENT20"),
+    ],
+    ids=["add", "update", "remove", "clear", "apply_discount"],
+)
+def test_every_mutation_bumps_the_version(
+    optimistic, rf_request, product, discount_percent, mutate, stored_version
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    before = stored_version(cart)
+
+    mutate(cart, product)
+
+    assert stored_version(cart) == cart.cart.version == before + 1
+
+
+def test_stale_facade_raises_and_writes_nothing(
+    optimistic, rf_request, product, product_factory, stored_version
+):
+    winner = Cart(rf_request)
+    loser = Cart(rf_request)
+    winner.add(product, Decimal("10.00"))
+
+    with pytest.raises(ConcurrentModification):
+        loser.add(product_factory(name="Late"), Decimal("5.00"))
+
+    assert Cart(rf_request).unique_count() == 1
+    assert loser.cart.version == stored_version(winner)
+
+
+def test_loser_can_retry_on_the_same_facade(optimistic, rf_request, product):
+    winner = Cart(rf_request)
+    loser = Cart(rf_request)
+    winner.add(product, Decimal("10.00"), quantity=2)
+
+    item = retry_on_conflict(loser.add)(product, Decimal("10.00"), quantity=3)
+
+    assert item.quantity == 5
+    assert Cart(rf_request).count() == 5
+
+
+def test_failed_mutation_keeps_the_version(
+    optimistic, rf_request, product, stored_version
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    cart.remove(product)
+    version = cart.cart.version
+
+    with pytest.raises(ItemDoesNotExist):
+        cart.update(product, quantity=2)
+
+    assert cart.cart.version == stored_version(cart) == version
+
+
+def test_retry_gives_up_after_the_last_attempt():
+    calls = []
+
+    @retry_on_conflict(attempts=3)
+    def always_conflicts():
+        calls.append(1)
+        raise ConcurrentModification("busy")
+
+    with pytest.raises(ConcurrentModification):
+        always_conflicts()
+    assert len(calls) == 3
+
+
+def test_retry_rejects_zero_attempts():
+    with pytest.raises(ValueError):
+        retry_on_conflict(attempts=0)
+
+
+def test_checkout_of_a_stale_facade_raises(optimistic, rf_request, product):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    stale = Cart(rf_request)
+    cart.update(product, quantity=2)
+
+    with pytest.raises(ConcurrentModification):
+        stale.checkout()
+
+    assert not stale.cart.checked_out
+    assert not CartModel.objects.get(pk=cart.cart.pk).checked_out
+
+
+def test_checkout_is_idempotent_across_facades(
+    optimistic, rf_request, product, discount_percent
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+    cart.apply_discount("PERCENT20")
+    second = Cart(rf_request)
+
+    cart.checkout()
+    second.checkout()
+
+    assert second.cart.checked_out
+    discount_percent.refresh_from_db()
+    assert discount_percent.current_uses == 1
+
+
+def test_claim_usage_stops_at_the_cap():
+    discount = Discount.objects.create(code="ONCE", value=Decimal("1.00"), max_uses=1)
+
+    assert discount.claim_usage()
+    assert not discount.claim_usage()
+    discount.refresh_from_db()
+    assert discount.current_uses == 1
+
+
+def test_etag_is_the_row_version(
+    optimistic, rf_request, product, django_assert_num_queries
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+
+    with django_assert_num_queries(0):
+        etag = cart.etag()
+
+    cart.update(product, quantity=2)
+    assert cart.etag() != etag
+
+
+def test_async_writes_claim_the_version(optimistic, rf_request, product):
+    sync_cart = Cart(rf_request)
+    async_cart = async_to_sync(AsyncCart.load)(rf_request)
+    sync_cart.add(product, Decimal("10.00"))
+
+    with pytest.raises(ConcurrentModification):
+        async_to_sync(async_cart.aadd)(product, Decimal("10.00"))
+
+    async_to_sync(async_cart.aadd)(product, Decimal("10.00"))
+    assert Cart(rf_request).count() == 2
@@ -6,7 +6,7 @@ from decimal import Decimal
 
 import pytest
 
-from cart.cart import ItemDoesNotExist
+from cart.cart import Cart, ItemDoesNotExist
 
 pytestmark = pytest.mark.django_db
 
@@ -36,3 +36,13 @@ def test_remove_one_product_preserves_others(cart, product_factory):
 
     assert cart.unique_count() == 1
     assert cart.count() == 4
+
+
+def test_remove_of_a_line_another_facade_removed_raises(cart, rf_request, product):
+    cart.add(product, Decimal("5.00"))
+    other = Cart(rf_request)
+    assert product in other
+    cart.remove(product)
+
+    with pytest.raises(ItemDoesNotExist):
+        other.remove(product)
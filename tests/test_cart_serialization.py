@@ -377,3 +377,39 @@ def test_round_trip_skips_silently_if_referenced_discount_deleted(cart, product)
 
     assert restored.discount_code() is None
     assert restored.count() == 1  # items are still restored
+
+
+# --------------------------------------------------------------------------- #
+# Batched restore
+# --------------------------------------------------------------------------- #
+
+
+def test_from_serializable_restore_is_query_bounded(
+    rf_request, cart, product_factory, django_assert_max_num_queries
+):
+    """Cart lookup, one SELECT of existing lines, one INSERT, one UPDATE
+    plus the savepoint pair — independent of payload size."""
+    products = [product_factory(name=f"Restore{i}") for i in range(50)]
+    for p in products[:20]:
+        cart.add(p, Decimal("1.00"))
+    payload = {
+        _composite_key(p): {"quantity": 3, "unit_price": "2.00"} for p in products
+    }
+
+    with django_assert_max_num_queries(6):
+        restored = Cart.from_serializable(rf_request, payload)
+
+    assert restored.count() == 150
+    assert restored.summary() == Decimal("300.00")
+
+
+def test_from_serializable_malformed_key_writes_nothing(rf_request, cart, product):
+    payload = {
+        _composite_key(product): {"quantity": 2, "unit_price": "5.00"},
+        "not-a-key": {"quantity": 1, "unit_price": "1.00"},
+    }
+
+    with pytest.raises(ValueError, match="not-a-key"):
+        Cart.from_serializable(rf_request, payload)
+
+    assert cart.is_empty() is True
@@ -0,0 +1,94 @@
+"""Snapshot load: ``Cart(request, snapshot=True)`` / ``CART_SNAPSHOT_LOAD``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from cart.cart import Cart, InvalidQuantity
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def filled_cart(rf_request, product_factory, discount_percent):
+    """A persisted cart with three lines and ``PERCENT20`` applied."""
+    cart = Cart(rf_request)
+    for i in range(3):
+        cart.add(product_factory(name=f"Snap{i}"), Decimal("10.00"), quantity=i + 1)
+    cart.apply_discount("PERCENT20")
+    return cart
+
+
+def test_snapshot_page_render_costs_two_queries(
+    rf_request, filled_cart, product_factory, django_assert_num_queries
+):
+    outsider = product_factory(name="NotInCart")
+
+    with django_assert_num_queries(2):
+        cart = Cart(rf_request, snapshot=True)
+        assert cart.count() == 6
+        assert cart.unique_count() == 3
+        assert len(cart) == 6
+        assert cart.summary() == Decimal("60.00")
+        assert cart.discount_amount() == Decimal("12.00")
+        assert len(list(cart)) == 3
+        assert (outsider in cart) is False
+
+
+def test_snapshot_membership_matches_content(rf_request, filled_cart, product_factory):
+    first = filled_cart.cart.items.first().product
+
+    cart = Cart(rf_request, snapshot=True)
+
+    assert first in cart
+
+
+def test_setting_enables_snapshot_load(settings, rf_request, filled_cart):
+    settings.CART_SNAPSHOT_LOAD = True
+
+    cart = Cart(rf_request)
+
+    assert cart.unique_count() == 3
+
+
+def test_snapshot_serialisation_matches_a_plain_load(rf_request, filled_cart):
+    plain = Cart(rf_request).cart_serializable()
+
+    assert Cart(rf_request, snapshot=True).cart_serializable() == plain
+
+
+def test_mutation_drops_the_snapshot(rf_request, filled_cart, product_factory):
+    cart = Cart(rf_request, snapshot=True)
+    assert cart.unique_count() == 3
+
+    cart.add(product_factory(name="Late"), Decimal("1.00"))
+
+    assert cart.unique_count() == 4
+    assert cart.count() == 7
+
+
+def test_rejected_add_leaves_the_snapshot_untouched(settings, rf_request, product):
+    settings.CART_MAX_QUANTITY_PER_ITEM = 5
+    Cart(rf_request).add(product, Decimal("10.00"), quantity=3)
+    cart = Cart(rf_request, snapshot=True)
+
+    with pytest.raises(InvalidQuantity):
+        cart.add(product, Decimal("12.00"), quantity=4)
+
+    fresh = Cart(rf_request)
+    assert cart.cart_serializable() == fresh.cart_serializable()
+    assert [(i.quantity, i.unit_price) for i in cart] == [(3, Decimal("10.00"))]
+    assert cart.count() == 3
+    assert cart.etag() == fresh.etag()
+
+
+def test_snapshot_on_a_fresh_session_is_empty_without_item_queries(
+    rf_request, django_assert_num_queries
+):
+    cart = Cart(rf_request, snapshot=True, lazy=True)
+
+    with django_assert_num_queries(0):
+        assert cart.is_empty() is True
+        assert cart.unique_count() == 0
@@ -6,7 +6,7 @@ from decimal import Decimal
 
 import pytest
 
-from cart.cart import InvalidQuantity, ItemDoesNotExist
+from cart.cart import Cart, InvalidQuantity, ItemDoesNotExist
 
 pytestmark = pytest.mark.django_db
 
@@ -45,3 +45,27 @@ def test_update_on_unknown_product_raises(cart_with_product, product_factory):
 def test_update_with_negative_quantity_raises(cart_with_product, product):
     with pytest.raises(InvalidQuantity):
         cart_with_product.update(product, quantity=-1)
+
+
+def test_update_of_a_line_another_facade_removed_raises(
+    cart_with_product, rf_request, product
+):
+    other = Cart(rf_request)
+    assert product in other
+    cart_with_product.remove(product)
+
+    with pytest.raises(ItemDoesNotExist):
+        other.update(product, quantity=3)
+
+
+def test_update_follows_a_line_another_facade_re_added(
+    cart_with_product, rf_request, product
+):
+    other = Cart(rf_request)
+    assert product in other
+    cart_with_product.remove(product)
+    cart_with_product.add(product, Decimal("5.00"))
+
+    other.update(product, quantity=4)
+
+    assert Cart(rf_request).count() == 4
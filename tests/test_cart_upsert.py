@@ -0,0 +1,108 @@
+"""``CART_UPSERT_ADD``: single-statement ``Cart.add`` via
+``ItemManager.increment_or_create``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+
+from cart.cart import Cart, InsufficientStock, InvalidQuantity
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def upsert(settings):
+    settings.CART_UPSERT_ADD = True
+
+
+@pytest.fixture
+def no_conflict_support(monkeypatch):
+    """Force ``increment_or_create`` onto its ``F()`` fallback path."""
+    monkeypatch.setattr(
+        connection.features, "supports_update_conflicts_with_target", False
+    )
+
+
+def test_upsert_add_is_a_single_statement(
+    upsert, cart, product, django_assert_num_queries
+):
+    cart.add(product, Decimal("10.00"))
+
+    with django_assert_num_queries(1):
+        cart.add(product, Decimal("10.00"), quantity=2)
+
+    assert cart.count() == 3
+
+
+def test_upsert_add_creates_the_line_and_returns_it(upsert, cart, product):
+    item = cart.add(product, Decimal("9.99"), quantity=2)
+
+    stored = cart.cart.items.get()
+    assert item.pk == stored.pk
+    assert item.quantity == stored.quantity == 2
+    assert stored.unit_price == Decimal("9.99")
+
+
+def test_upsert_add_overwrites_unit_price(upsert, cart, product):
+    cart.add(product, Decimal("10.00"))
+    cart.add(product, Decimal("12.50"))
+
+    assert cart.cart.items.get().unit_price == Decimal("12.50")
+
+
+def test_upsert_add_does_not_lose_increments_across_stale_facades(
+    upsert, rf_request, product
+):
+    """Two facades on the same cart (double-click) both read quantity 1;
+    the database-side ``quantity + n`` keeps both increments."""
+    first = Cart(rf_request)
+    first.add(product, Decimal("10.00"))
+    second = Cart(rf_request)
+    assert product in second
+
+    first.add(product, Decimal("10.00"))
+    second.add(product, Decimal("10.00"))
+
+    assert first.cart.items.get().quantity == 3
+
+
+@pytest.mark.parametrize("fallback", [False, True], ids=["on-conflict", "f-expr"])
+def test_upsert_add_enforces_max_quantity(
+    request, settings, upsert, cart, product, fallback
+):
+    if fallback:
+        request.getfixturevalue("no_conflict_support")
+    settings.CART_MAX_QUANTITY_PER_ITEM = 5
+    cart.add(product, Decimal("10.00"), quantity=4)
+
+    with pytest.raises(InvalidQuantity):
+        cart.add(product, Decimal("10.00"), quantity=2)
+
+    assert cart.cart.items.get().quantity == 4
+
+
+def test_fallback_path_increments_and_creates(
+    upsert, no_conflict_support, cart, product_factory
+):
+    a = product_factory(name="FallbackA")
+    b = product_factory(name="FallbackB")
+
+    cart.add(a, Decimal("1.00"))
+    cart.add(a, Decimal("1.00"), quantity=2)
+    cart.add(b, Decimal("2.00"))
+
+    assert cart.count() == 4
+    assert cart.unique_count() == 2
+
+
+def test_upsert_add_rolls_back_on_insufficient_stock(upsert, settings, cart, product):
+    settings.CART_INVENTORY_CHECKER = "tests.test_inventory.FailingInventoryChecker"
+    cart.add(product, Decimal("10.00"), quantity=3)
+
+    with pytest.raises(InsufficientStock):
+        cart.add(product, Decimal("10.00"), quantity=5, check_inventory=True)
+
+    assert cart.cart.items.get().quantity == 3
@@ -0,0 +1,125 @@
+"""``{% cartcache %}`` — per-cart template fragment caching."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from django.core.cache import caches
+from django.template import Context, Template, TemplateSyntaxError
+
+from cart.cart import Cart
+
+pytestmark = pytest.mark.django_db
+
+FRAGMENT = Template(
+    "{% load cart_tags %}{% cartcache 300 minicart %}{{ n }}{% endcartcache %}"
+)
+
+
+@pytest.fixture(autouse=True)
+def fragment_cache():
+    cache = caches["default"]
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def visitor(rf):
+    """A second, independent session."""
+
+    def _make():
+        request = rf.get("/")
+        request.session = {}
+        return request
+
+    return _make
+
+
+def render(request, n, template=FRAGMENT) -> str:
+    return template.render(Context({"request": request, "n": n}))
+
+
+def test_visitors_without_a_cart_share_one_entry(visitor):
+    assert render(visitor(), 1) == "1"
+    assert render(visitor(), 2) == "1"
+
+
+def test_fragment_is_reused_until_the_cart_changes(rf_request, product):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+
+    assert render(rf_request, 1) == "1"
+    assert render(rf_request, 2) == "1"
+
+    Cart(rf_request).update(product, quantity=3)
+
+    assert render(rf_request, 3) == "3"
+
+
+def test_carts_do_not_share_entries(rf_request, visitor, product):
+    Cart(rf_request).add(product, Decimal("10.00"))
+    other = visitor()
+    Cart(other).add(product, Decimal("10.00"), quantity=2)
+
+    assert render(rf_request, 1) == "1"
+    assert render(other, 2) == "2"
+
+
+def test_cookie_adapter_carts_do_not_leak_into_the_empty_entry(
+    settings, visitor, product
+):
+    settings.CART_SESSION_ADAPTER = "cart.session.CookieSessionAdapter"
+    alice = visitor()
+    Cart(alice).add(product, Decimal("10.00"))
+    assert render(alice, "Alice-secret-item") == "Alice-secret-item"
+
+    assert render(visitor(), "Bob-empty-cart") == "Bob-empty-cart"
+
+
+def test_hit_with_cart_cache_costs_no_query(
+    settings, rf_request, product, django_assert_num_queries
+):
+    settings.CART_CACHE = "default"
+    Cart(rf_request).add(product, Decimal("10.00"))
+    assert render(rf_request, 1) == "1"
+
+    with django_assert_num_queries(0):
+        assert render(rf_request, 2) == "1"
+
+
+def test_tag_never_creates_a_cart_row(rf_request):
+    from cart.models import Cart as CartModel
+
+    render(rf_request, 1)
+
+    assert CartModel.objects.count() == 0
+
+
+def test_vary_on_values_split_entries(rf_request):
+    template = Template(
+        "{% load cart_tags %}"
+        "{% cartcache 300 minicart lang %}{{ n }}{% endcartcache %}"
+    )
+
+    def render_lang(lang, n):
+        return template.render(Context({"request": rf_request, "lang": lang, "n": n}))
+
+    assert render_lang("en", 1) == "1"
+    assert render_lang("de", 2) == "2"
+    assert render_lang("en", 3) == "1"
+
+
+def test_tag_requires_timeout_and_fragment_name():
+    with pytest.raises(TemplateSyntaxError):
+        Template("{% load cart_tags %}{% cartcache 300 %}x{% endcartcache %}")
+
+
+def test_non_integer_timeout_is_rejected(rf_request):
+    template = Template(
+        "{% load cart_tags %}{% cartcache 'soon' minicart %}x{% endcartcache %}"
+    )
+
+    with pytest.raises(TemplateSyntaxError):
+        template.render(Context({"request": rf_request}))
@@ -157,3 +157,289 @@ def test_deleting_a_cart_cascades_to_its_items(product):
     _call(days=90)
 
     assert Item.objects.filter(pk=item.pk).exists() is False
+
+
+# --------------------------------------------------------------------------- #
+# Batching, throttling and runtime limits
+# --------------------------------------------------------------------------- #
+
+
+def _cart_with_item(product):
+    old = _old_cart(days=100)
+    Item.objects.create(
+        cart=old,
+        content_type=ContentType.objects.get_for_model(FakeProduct),
+        object_id=product.pk,
+        unit_price=Decimal("1.00"),
+        quantity=1,
+    )
+    return old
+
+
+def test_deletes_in_batches_and_reports_progress(product):
+    for _ in range(5):
+        _cart_with_item(product)
+
+    output = _call(days=90, batch_size=2)
+
+    assert CartModel.objects.count() == 0
+    assert Item.objects.count() == 0
+    assert "Deleted 2/5" in output
+    assert "Deleted 4/5" in output
+    assert "Deleted 5/5" in output
+    assert "5 cart(s) and 5 item(s)" in output
+
+
+def test_items_are_deleted_without_the_collector(product):
+    from django.db.models.signals import post_delete
+
+    _cart_with_item(product)
+    deleted = []
+
+    def receiver(sender, **kwargs):
+        deleted.append(sender)
+
+    post_delete.connect(receiver, sender=Item)
+    try:
+        _call(days=90)
+    finally:
+        post_delete.disconnect(receiver, sender=Item)
+
+    assert Item.objects.count() == 0
+    assert deleted == []
+
+
+def test_sleeps_between_full_batches_only(monkeypatch):
+    from cart.management.commands import clean_carts
+
+    for _ in range(3):
+        _old_cart(days=100)
+    pauses = []
+    monkeypatch.setattr(clean_carts.time, "sleep", pauses.append)
+
+    _call(days=90, batch_size=2, sleep=0.25)
+
+    assert pauses == [0.25]
+
+
+def test_max_runtime_stops_before_the_next_batch(monkeypatch):
+    from cart.management.commands import clean_carts
+
+    for _ in range(3):
+        _old_cart(days=100)
+    clock = iter([0.0, 0.0, 5.0])
+    monkeypatch.setattr(clean_carts.time, "monotonic", lambda: next(clock))
+
+    output = _call(days=90, batch_size=2, max_runtime=5)
+
+    assert CartModel.objects.count() == 1
+    assert "--max-runtime" in output
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"batch_size": 0}, {"sleep": -1.0}, {"max_runtime": 0}],
+    ids=["batch_size", "sleep", "max_runtime"],
+)
+def test_invalid_throttle_options_raise_command_error(options):
+    with pytest.raises(CommandError):
+        _call(**options)
+
+
+# --------------------------------------------------------------------------- #
+# --workers: id-range partitions
+#
+# The test database is in-memory SQLite, which a second process cannot
+# see, so the process pool is replaced by an inline executor that runs
+# each partition in the test's own connection.
+# --------------------------------------------------------------------------- #
+
+
+class InlineExecutor:
+    """``concurrent.futures`` executor that runs submissions immediately."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        from concurrent.futures import Future
+
+        self.calls.append(args)
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.fixture
+def inline_pool(monkeypatch):
+    from cart.management.commands import clean_carts
+
+    executor = InlineExecutor()
+    sizes = []
+
+    def make_pool(workers):
+        sizes.append(workers)
+        return executor
+
+    monkeypatch.setattr(clean_carts, "_make_pool", make_pool)
+    monkeypatch.setattr(clean_carts, "_parallel_writes_supported", lambda: True)
+    executor.sizes = sizes
+    return executor
+
+
+def test_workers_split_the_id_range_into_disjoint_partitions(inline_pool, product):
+    carts = [_cart_with_item(product) for _ in range(7)]
+    keep = _fresh_cart()
+
+    output = _call(days=90, workers=3)
+
+    assert list(CartModel.objects.values_list("pk", flat=True)) == [keep.pk]
+    assert inline_pool.sizes == [3]
+    ranges = [args[1] for args in inline_pool.calls]
+    assert ranges[0][0] == carts[0].pk
+    assert ranges[-1][1] == carts[-1].pk
+    for (_, high), (low, _) in zip(ranges, ranges[1:]):
+        assert low == high + 1
+    assert "Partition 3/3" in output
+    assert "Successfully deleted 7 cart(s) and 7 item(s)" in output
+
+
+def test_workers_dry_run_reports_per_partition_estimates():
+    for _ in range(4):
+        _old_cart(days=100)
+
+    output = _call(days=90, workers=2, dry_run=True)
+
+    assert output.count("[DRY RUN] Partition") == 2
+    assert "~2 cart(s)" in output
+    assert CartModel.objects.count() == 4
+
+
+def test_workers_fall_back_to_one_process_on_sqlite():
+    _old_cart(days=100)
+
+    output = _call(days=90, workers=4)
+
+    assert "ignoring --workers" in output
+    assert CartModel.objects.count() == 0
+
+
+def test_non_positive_workers_raises_command_error():
+    with pytest.raises(CommandError):
+        _call(workers=0)
+
+
+# --------------------------------------------------------------------------- #
+# --inactive-days: purge on last_activity
+# --------------------------------------------------------------------------- #
+
+
+def test_inactive_days_filters_on_last_activity_not_creation_date():
+    now = timezone.now()
+    old_but_active = _old_cart(days=200)
+    CartModel.objects.filter(pk=old_but_active.pk).update(
+        last_activity=now - timedelta(days=1)
+    )
+    young_but_idle = _fresh_cart()
+    CartModel.objects.filter(pk=young_but_idle.pk).update(
+        last_activity=now - timedelta(days=45)
+    )
+
+    output = _call(inactive_days=30)
+
+    assert CartModel.objects.filter(pk=old_but_active.pk).exists() is True
+    assert CartModel.objects.filter(pk=young_but_idle.pk).exists() is False
+    assert "inactive for more than 30 day(s)" in output
+
+
+def test_inactive_days_and_days_are_mutually_exclusive():
+    with pytest.raises(CommandError):
+        call_command("clean_carts", "--days", "10", "--inactive-days", "10")
+
+
+def test_non_positive_inactive_days_raises_command_error():
+    with pytest.raises(CommandError):
+        _call(inactive_days=0)
+
+
+# --------------------------------------------------------------------------- #
+# --archive: gzipped JSON Lines written before each batch is deleted
+# --------------------------------------------------------------------------- #
+
+
+def _read_archive(path):
+    import gzip
+    import json
+
+    with gzip.open(path, "rt") as lines:
+        return [json.loads(line) for line in lines]
+
+
+def test_archive_writes_every_deleted_cart_with_its_items(
+    tmp_path, product, discount_percent
+):
+    carts = [_cart_with_item(product) for _ in range(3)]
+    CartModel.objects.filter(pk=carts[0].pk).update(discount=discount_percent)
+    path = tmp_path / "carts.jsonl.gz"
+
+    output = _call(days=90, batch_size=2, archive=str(path))
+
+    records = _read_archive(path)
+    assert [r["id"] for r in records] == [c.pk for c in carts]
+    key = f"{ContentType.objects.get_for_model(FakeProduct).pk}:{product.pk}"
+    assert records[0]["items"][key]["unit_price"] == "1.00"
+    assert records[0]["items"]["__discount__"] == {"code": "PERCENT20"}
+    assert "__discount__" not in records[1]["items"]
+    assert CartModel.objects.count() == 0
+    assert f"Archived 3 cart(s) to {path}" in output
+
+
+def test_archive_appends_across_runs(tmp_path, product):
+    path = tmp_path / "carts.jsonl.gz"
+    _cart_with_item(product)
+    _call(days=90, archive=str(path))
+    _cart_with_item(product)
+    _call(days=90, archive=str(path))
+
+    assert len(_read_archive(path)) == 2
+
+
+def test_failed_archive_write_deletes_nothing(tmp_path, monkeypatch, product):
+    from cart.management.commands import clean_carts
+
+    _cart_with_item(product)
+
+    def fail(fileobj):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(clean_carts.os, "fsync", fail)
+    with pytest.raises(OSError):
+        _call(days=90, archive=str(tmp_path / "carts.jsonl.gz"))
+
+    assert CartModel.objects.count() == 1
+    assert Item.objects.count() == 1
+
+
+def test_dry_run_does_not_write_the_archive(tmp_path):
+    _old_cart(days=100)
+    path = tmp_path / "carts.jsonl.gz"
+
+    _call(days=90, dry_run=True, archive=str(path))
+
+    assert not path.exists()
+
+
+def test_archive_cannot_be_combined_with_workers(tmp_path):
+    with pytest.raises(CommandError, match="--workers"):
+        _call(archive=str(tmp_path / "carts.jsonl.gz"), workers=2)
+
+
+def test_archive_directory_must_exist(tmp_path):
+    with pytest.raises(CommandError, match="does not exist"):
+        _call(archive=str(tmp_path / "missing" / "carts.jsonl.gz"))
@@ -35,6 +35,23 @@ class FailingInventoryChecker(InventoryChecker):
         return False
 
 
+class BatchRecordingInventoryChecker(InventoryChecker):
+    """Module-level test double — records ``check_many`` batches and
+    rejects any quantity above 5."""
+
+    batches: list = []
+
+    def check(self, product, quantity):
+        raise AssertionError("add_bulk must go through check_many")
+
+    def check_many(self, items):
+        self.batches.append(list(items))
+        return [product for product, quantity in items if quantity > 5]
+
+    def reserve(self, product, quantity):
+        return True
+
+
 # --------------------------------------------------------------------------- #
 # InventoryChecker interface
 # --------------------------------------------------------------------------- #
@@ -44,6 +61,13 @@ def test_default_inventory_checker_always_reports_available():
     assert DefaultInventoryChecker().check(MagicMock(), 1) is True
 
 
+def test_default_check_many_delegates_to_check_per_entry():
+    a, b = MagicMock(), MagicMock()
+
+    assert PassingInventoryChecker().check_many([(a, 1), (b, 2)]) == []
+    assert FailingInventoryChecker().check_many([(a, 1), (b, 2)]) == [a, b]
+
+
 def test_default_inventory_checker_release_returns_true():
     assert DefaultInventoryChecker().release(MagicMock(), 1) is True
 
@@ -127,3 +151,49 @@ def test_add_with_check_inventory_succeeds_when_checker_passes(cart, product, se
     )
 
     assert item is not None
+
+
+# --------------------------------------------------------------------------- #
+# Cart.add_bulk integration (check_inventory parameter)
+# --------------------------------------------------------------------------- #
+
+
+def test_add_bulk_checks_the_whole_batch_in_one_call(cart, product_factory, settings):
+    settings.CART_INVENTORY_CHECKER = (
+        "tests.test_inventory.BatchRecordingInventoryChecker"
+    )
+    BatchRecordingInventoryChecker.batches.clear()
+    a = product_factory(name="BatchA")
+    b = product_factory(name="BatchB")
+
+    cart.add_bulk(
+        [
+            {"product": a, "unit_price": Decimal("1.00"), "quantity": 2},
+            {"product": b, "unit_price": Decimal("1.00"), "quantity": 3},
+        ],
+        check_inventory=True,
+    )
+
+    assert BatchRecordingInventoryChecker.batches == [[(a, 2), (b, 3)]]
+    assert cart.count() == 5
+
+
+def test_add_bulk_with_check_inventory_writes_nothing_on_failure(
+    cart, product_factory, settings
+):
+    settings.CART_INVENTORY_CHECKER = (
+        "tests.test_inventory.BatchRecordingInventoryChecker"
+    )
+    ok = product_factory(name="BatchOk")
+    short = product_factory(name="BatchShort")
+
+    with pytest.raises(InsufficientStock, match="BatchShort"):
+        cart.add_bulk(
+            [
+                {"product": ok, "unit_price": Decimal("1.00"), "quantity": 1},
+                {"product": short, "unit_price": Decimal("1.00"), "quantity": 9},
+            ],
+            check_inventory=True,
+        )
+
+    assert cart.is_empty() is True
@@ -59,6 +59,43 @@ def test_summary_is_a_single_aggregate_query(
     assert summary == Decimal("1000.00")
 
 
+def test_header_totals_share_a_single_aggregate_query(
+    cart, product_factory, django_assert_num_queries
+):
+    """``count()``, ``unique_count()`` and ``summary()`` come from one
+    ``totals()`` aggregate, and repeated calls hit the facade cache."""
+    for i in range(3):
+        cart.add(product_factory(name=f"PerfTotals{i}"), Decimal("10.00"), quantity=2)
+
+    cart._invalidate_cache()
+
+    with django_assert_num_queries(1):
+        assert cart.count() == 6
+        assert cart.unique_count() == 3
+        assert cart.summary() == Decimal("60.00")
+        assert cart.unique_count() == 3
+        assert cart.is_empty() is False
+
+
+def test_can_checkout_reuses_the_totals_aggregate(
+    settings, cart, product, django_assert_num_queries
+):
+    settings.CART_MIN_ORDER_AMOUNT = Decimal("5.00")
+    cart.add(product, Decimal("10.00"))
+
+    cart._invalidate_cache()
+
+    with django_assert_num_queries(1):
+        assert cart.can_checkout() == (True, "")
+        assert cart.summary() == Decimal("10.00")
+
+
+def test_totals_on_an_empty_cart(cart):
+    from cart.cart import CartTotals
+
+    assert cart.totals() == CartTotals(0, 0, Decimal("0.00"))
+
+
 def test_iteration_is_query_bounded_independent_of_item_count(
     cart, product_factory, django_assert_max_num_queries
 ):
@@ -138,3 +175,106 @@ def test_items_with_products_batches_per_content_type(
             _ = item.product
 
     assert len(items) == 10
+
+
+def test_membership_checks_share_one_line_index_query(
+    rf_request, cart, product_factory, django_assert_num_queries
+):
+    """A listing page rendering "in cart" badges asks ``product in cart``
+    once per product. The first check loads the lines of a cart of up
+    to ``_LINE_LOOKUP_BATCH`` lines — 60 checks, 1 query."""
+    products = [product_factory(name=f"Badge{i}") for i in range(60)]
+    for p in products[:5]:
+        cart.add(p, Decimal("10.00"))
+    from cart.cart import Cart
+
+    fresh = Cart(rf_request)
+
+    with django_assert_num_queries(1):
+        flags = [p in fresh for p in products]
+
+    assert sum(flags) == 5
+
+
+def test_membership_checks_on_a_large_cart_read_a_bounded_page(
+    monkeypatch, rf_request, cart, product_factory
+):
+    """Above the threshold the first check reads at most one page of
+    lines, then falls back to per-product lookups."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    import cart.cart as cart_module
+
+    monkeypatch.setattr(cart_module, "_LINE_LOOKUP_BATCH", 3)
+    products = [product_factory(name=f"Big{i}") for i in range(5)]
+    for p in products:
+        cart.add(p, Decimal("10.00"))
+    fresh = cart_module.Cart(rf_request)
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert products[0] in fresh
+        assert products[4] in fresh
+
+    assert len(ctx.captured_queries) == 2
+    assert "LIMIT 4" in ctx.captured_queries[0]["sql"]
+
+
+def test_membership_checks_on_a_snapshot_cost_no_query(
+    rf_request, cart, product_factory, django_assert_num_queries
+):
+    """With the lines already loaded by ``snapshot=True`` every badge is
+    answered from memory."""
+    products = [product_factory(name=f"Badge{i}") for i in range(60)]
+    for p in products[:5]:
+        cart.add(p, Decimal("10.00"))
+    from cart.cart import Cart
+
+    fresh = Cart(rf_request, snapshot=True)
+
+    with django_assert_num_queries(0):
+        flags = [p in fresh for p in products]
+
+    assert sum(flags) == 5
+
+
+def test_add_to_a_large_cart_reads_only_its_own_line(rf_request, cart, product_factory):
+    """The first ``add`` on a fresh facade looks up one line by key
+    rather than loading every line of a big B2B cart."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    products = [product_factory(name=f"Bulk{i}") for i in range(30)]
+    cart.add_bulk(
+        [{"product": p, "unit_price": Decimal("1.00"), "quantity": 1} for p in products]
+    )
+    from cart.cart import Cart
+
+    fresh = Cart(rf_request)
+
+    with CaptureQueriesContext(connection) as ctx:
+        fresh.add(products[7], Decimal("1.00"))
+
+    item_selects = [
+        q["sql"]
+        for q in ctx.captured_queries
+        if q["sql"].startswith("SELECT") and '"cart_item"' in q["sql"]
+    ]
+    assert len(item_selects) == 1
+    assert '"object_id" = ' in item_selects[0]
+    assert fresh.count() == 31
+
+
+def test_repeated_mutations_reuse_the_line_index(
+    cart, product, django_assert_max_num_queries
+):
+    """After the first lookup, ``update`` on the same product is a
+    single ``UPDATE`` (plus savepoints) — no per-call ``SELECT``."""
+    cart.add(product, Decimal("10.00"))
+
+    # Per update: SAVEPOINT, UPDATE, RELEASE SAVEPOINT.
+    with django_assert_max_num_queries(3 * 5):
+        for qty in range(2, 7):
+            cart.update(product, quantity=qty)
+
+    assert cart.count() == 6
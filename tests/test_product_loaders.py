@@ -0,0 +1,87 @@
+"""Product loader registry: ``CART_PRODUCT_LOADERS`` / ``CART_PREFETCH_PRODUCTS``."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from cart.cart import Cart
+from cart.loaders import product_queryset
+from tests.test_app.models import FakeProduct, FakeProductNoPrice
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def mixed_cart(cart, product_factory):
+    for i in range(20):
+        cart.add(product_factory(name=f"Loader{i}"), Decimal("1.00"))
+    for i in range(5):
+        cart.add(FakeProductNoPrice.objects.create(name=f"NoPrice{i}"), Decimal("2.00"))
+    cart._invalidate_cache()
+    return cart
+
+
+def test_prefetch_setting_makes_plain_iteration_n_plus_one_free(
+    settings, mixed_cart, django_assert_num_queries
+):
+    settings.CART_PREFETCH_PRODUCTS = True
+
+    # 1 SELECT Item (with content_type) + 1 per product model.
+    with django_assert_num_queries(3):
+        names = [item.product.name for item in mixed_cart]
+
+    assert len(names) == 25
+
+
+def test_only_spec_narrows_the_product_query(
+    settings, mixed_cart, django_assert_num_queries
+):
+    settings.CART_PRODUCT_LOADERS = {"test_app.FakeProduct": {"only": ["name"]}}
+
+    with django_assert_num_queries(3):
+        items = mixed_cart.items_with_products()
+        names = [item.product.name for item in items]
+
+    assert len(names) == 25
+    narrowed = [i.product for i in items if isinstance(i.product, FakeProduct)]
+    assert all(p.get_deferred_fields() == {"price"} for p in narrowed)
+
+
+def test_labels_match_case_insensitively(settings):
+    settings.CART_PRODUCT_LOADERS = {"TEST_APP.fakeproduct": {"only": ["name"]}}
+
+    assert "price" not in str(product_queryset(FakeProduct).query)
+
+
+def test_unknown_loader_option_is_rejected(settings):
+    settings.CART_PRODUCT_LOADERS = {"test_app.FakeProduct": {"defer": ["price"]}}
+
+    with pytest.raises(ImproperlyConfigured, match="defer"):
+        product_queryset(FakeProduct)
+
+
+def test_deleted_product_still_raises_on_access(settings, cart, product):
+    settings.CART_PREFETCH_PRODUCTS = True
+    cart.add(product, Decimal("10.00"))
+    FakeProduct.objects.filter(pk=product.pk).delete()
+
+    (item,) = list(cart)
+
+    with pytest.raises(FakeProduct.DoesNotExist):
+        item.product
+
+
+def test_snapshot_iteration_prefetches_once(
+    settings, rf_request, product, django_assert_num_queries
+):
+    settings.CART_PREFETCH_PRODUCTS = True
+    Cart(rf_request).add(product, Decimal("10.00"))
+    cart = Cart(rf_request, snapshot=True)
+
+    with django_assert_num_queries(1):
+        assert [i.product for i in cart] == [product]
+    with django_assert_num_queries(0):
+        assert [i.product for i in cart] == [product]
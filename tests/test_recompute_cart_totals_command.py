@@ -0,0 +1,82 @@
+"""recompute_cart_totals management command — backfill denormalized totals."""
+
+from __future__ import annotations
+
+import io
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import RequestFactory
+
+from cart.cart import Cart
+from cart.models import Cart as CartModel
+
+pytestmark = pytest.mark.django_db
+
+
+def _call(**kwargs):
+    out = io.StringIO()
+    call_command("recompute_cart_totals", stdout=out, **kwargs)
+    return out.getvalue()
+
+
+def _totals(cart):
+    return CartModel.objects.values_list("line_count", "unit_count", "subtotal").get(
+        pk=cart.cart.pk
+    )
+
+
+def test_backfills_carts_written_with_the_setting_off(
+    cart, other_cart, product, product_factory
+):
+    cart.add(product, Decimal("10.00"), quantity=2)
+    cart.add(product_factory(name="Second"), Decimal("1.50"), quantity=2)
+
+    output = _call()
+
+    assert _totals(cart) == (2, 4, Decimal("23.00"))
+    assert _totals(other_cart) == (0, 0, Decimal("0.00"))
+    assert "Recomputed totals for 2 cart(s)." in output
+
+
+def test_repairs_drift_from_writes_behind_the_facade(settings, cart, product):
+    settings.CART_DENORMALIZED_TOTALS = True
+    cart.add(product, Decimal("10.00"), quantity=2)
+    cart.cart.items.update(quantity=7)
+
+    _call()
+
+    assert _totals(cart) == (1, 7, Decimal("70.00"))
+
+
+def test_cart_option_limits_the_rewrite(cart, other_cart, product):
+    cart.add(product, Decimal("10.00"))
+    other_cart.add(product, Decimal("10.00"))
+
+    output = _call(cart_ids=[cart.cart.pk])
+
+    assert _totals(cart) == (1, 1, Decimal("10.00"))
+    assert _totals(other_cart) == (0, 0, Decimal("0.00"))
+    assert "1 cart(s)" in output
+
+
+def test_batches_cover_every_cart(product_factory):
+    carts = []
+    for i in range(5):
+        request = RequestFactory().get("/")
+        request.session = {}
+        c = Cart(request)
+        c.add(product_factory(name=f"Batch{i}"), Decimal("1.00"), quantity=i + 1)
+        carts.append(c)
+
+    output = _call(batch_size=2)
+
+    assert [_totals(c)[1] for c in carts] == [1, 2, 3, 4, 5]
+    assert "5 cart(s)" in output
+
+
+def test_rejects_non_positive_batch_size():
+    with pytest.raises(CommandError, match="--batch-size"):
+        _call(batch_size=0)
@@ -0,0 +1,93 @@
+"""Process-wide plugin registry: :mod:`cart.registry`."""
+
+from __future__ import annotations
+
+import threading
+from decimal import Decimal
+
+import pytest
+from django.test import override_settings
+
+from cart import registry
+from cart.cart import Cart
+from cart.inventory import get_inventory_checker
+from cart.shipping import get_shipping_calculator
+from cart.tax import DefaultTaxCalculator, TaxCalculator, get_tax_calculator
+
+
+class CountingTaxCalculator(TaxCalculator):
+    """Module-level test double referenced by dotted path in settings."""
+
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+
+    def calculate(self, cart):
+        return Decimal("1.00")
+
+
+@pytest.fixture
+def counting_tax(settings):
+    CountingTaxCalculator.instances = 0
+    settings.CART_TAX_CALCULATOR = "tests.test_registry.CountingTaxCalculator"
+    return CountingTaxCalculator
+
+
+def test_factories_return_the_same_instance_every_call():
+    assert get_tax_calculator() is get_tax_calculator()
+    assert get_shipping_calculator() is get_shipping_calculator()
+    assert get_inventory_checker() is get_inventory_checker()
+
+
+@pytest.mark.django_db
+def test_calculator_is_built_once_across_carts_and_calls(
+    counting_tax, rf_request, product
+):
+    cart = Cart(rf_request)
+    cart.add(product, Decimal("10.00"))
+
+    for _ in range(3):
+        Cart(rf_request).tax()
+
+    assert counting_tax.instances == 1
+
+
+def test_setting_change_rebuilds_the_instance(counting_tax):
+    first = get_tax_calculator()
+
+    with override_settings(CART_TAX_CALCULATOR=None):
+        assert isinstance(get_tax_calculator(), DefaultTaxCalculator)
+
+    assert get_tax_calculator() is not first
+    assert isinstance(get_tax_calculator(), CountingTaxCalculator)
+
+
+def test_reset_forgets_one_or_all_instances(counting_tax):
+    tax = get_tax_calculator()
+    shipping = get_shipping_calculator()
+
+    registry.reset("CART_TAX_CALCULATOR")
+    assert get_tax_calculator() is not tax
+    assert get_shipping_calculator() is shipping
+
+    registry.reset()
+    assert get_shipping_calculator() is not shipping
+
+
+def test_concurrent_first_use_builds_a_single_instance(counting_tax):
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def resolve():
+        barrier.wait()
+        seen.append(get_tax_calculator())
+
+    threads = [threading.Thread(target=resolve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counting_tax.instances == 1
+    assert len({id(calculator) for calculator in seen}) == 1
@@ -1,8 +1,9 @@
 """Django signals emitted by cart operations.
 
-Covers the five signals declared in cart.signals:
+Covers the seven signals declared in cart.signals:
     cart_item_added, cart_item_removed, cart_item_updated,
-    cart_checked_out, cart_cleared.
+    cart_checked_out, cart_cleared, cart_items_removed,
+    cart_items_updated.
 """
 
 from __future__ import annotations
@@ -18,6 +19,8 @@ from cart.signals import (
     cart_item_added,
     cart_item_removed,
     cart_item_updated,
+    cart_items_removed,
+    cart_items_updated,
 )
 
 
@@ -26,7 +29,8 @@ def signal_sink():
     """Capture cart signal emissions for test inspection.
 
     Yields a dict with one list per signal name (``added``, ``removed``,
-    ``updated``, ``checked_out``, ``cleared``). Each handler appends a
+    ``updated``, ``checked_out``, ``cleared``, ``bulk_removed``,
+    ``bulk_updated``). Each handler appends a
     record of the kwargs it was invoked with. Handlers are connected on
     setup and disconnected on teardown automatically.
 
@@ -42,6 +46,8 @@ def signal_sink():
         "updated": [],
         "checked_out": [],
         "cleared": [],
+        "bulk_removed": [],
+        "bulk_updated": [],
     }
 
     def on_added(sender, cart, item, **kwargs):
@@ -65,11 +71,21 @@ def signal_sink():
     def on_cleared(sender, cart, **kwargs):
         captured["cleared"].append({"cart": cart})
 
+    def on_bulk_removed(sender, cart, products, **kwargs):
+        captured["bulk_removed"].append({"cart": cart, "products": products})
+
+    def on_bulk_updated(sender, cart, items, deleted, **kwargs):
+        captured["bulk_updated"].append(
+            {"cart": cart, "items": items, "deleted": deleted}
+        )
+
     cart_item_added.connect(on_added, sender=Cart)
     cart_item_removed.connect(on_removed, sender=Cart)
     cart_item_updated.connect(on_updated, sender=Cart)
     cart_checked_out.connect(on_checked_out, sender=Cart)
     cart_cleared.connect(on_cleared, sender=Cart)
+    cart_items_removed.connect(on_bulk_removed, sender=Cart)
+    cart_items_updated.connect(on_bulk_updated, sender=Cart)
 
     yield captured
 
@@ -78,6 +94,8 @@ def signal_sink():
     cart_item_updated.disconnect(on_updated, sender=Cart)
     cart_checked_out.disconnect(on_checked_out, sender=Cart)
     cart_cleared.disconnect(on_cleared, sender=Cart)
+    cart_items_removed.disconnect(on_bulk_removed, sender=Cart)
+    cart_items_updated.disconnect(on_bulk_updated, sender=Cart)
 
 
 # --------------------------------------------------------------------------- #
@@ -166,3 +184,35 @@ def test_cart_cleared_fires_on_clear(cart, product, signal_sink):
 
     assert len(signal_sink["cleared"]) == 1
     assert signal_sink["cleared"][0]["cart"] == cart.cart
+
+
+# --------------------------------------------------------------------------- #
+# cart_items_removed / cart_items_updated (bulk APIs)
+# --------------------------------------------------------------------------- #
+
+
+def test_remove_many_fires_one_aggregated_signal(cart, product_factory, signal_sink):
+    products = [product_factory(name=f"Sig{i}") for i in range(3)]
+    for p in products:
+        cart.add(p, unit_price=Decimal("1.00"))
+
+    cart.remove_many(products)
+
+    assert len(signal_sink["bulk_removed"]) == 1
+    assert signal_sink["bulk_removed"][0]["products"] == products
+    assert signal_sink["removed"] == []
+
+
+def test_update_many_fires_one_aggregated_signal(cart, product_factory, signal_sink):
+    keep = product_factory(name="SigKeep")
+    drop = product_factory(name="SigDrop")
+    cart.add(keep, unit_price=Decimal("1.00"))
+    cart.add(drop, unit_price=Decimal("1.00"))
+
+    cart.update_many({keep: 4, drop: 0})
+
+    assert len(signal_sink["bulk_updated"]) == 1
+    record = signal_sink["bulk_updated"][0]
+    assert [item.quantity for item in record["items"]] == [4]
+    assert len(record["deleted"]) == 1
+    assert signal_sink["updated"] == []
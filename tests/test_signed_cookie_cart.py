@@ -0,0 +1,212 @@
+"""Stateless carts kept in a signed cookie: ``SignedCookieCartAdapter``."""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.test import Client
+
+from cart.cart import CART_DATA, CART_ID, Cart, ItemDoesNotExist
+from cart.models import Cart as CartModel
+from cart.models import Item
+from tests.test_app.models import FakeProduct
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def signed_cookie(settings):
+    settings.CART_SESSION_ADAPTER = "cart.session.SignedCookieCartAdapter"
+    settings.MIDDLEWARE = list(settings.MIDDLEWARE) + [
+        "cart.middleware.CartCookieMiddleware",
+    ]
+    # Warm the content-type cache so query counts only see cart work.
+    ContentType.objects.get_for_model(FakeProduct)
+    return settings
+
+
+@pytest.fixture
+def visit(rf):
+    """Build a request carrying the cookies a previous request set."""
+
+    def _make(previous=None):
+        request = rf.get("/")
+        request.session = {}
+        if previous is not None:
+            request.COOKIES.update(previous._cart_session._cookies)
+        return request
+
+    return _make
+
+
+def test_anonymous_writes_and_reads_need_no_database(
+    signed_cookie, visit, product, product_factory, django_assert_num_queries
+):
+    other = product_factory(name="Other")
+    request = visit()
+
+    with django_assert_num_queries(0):
+        cart = Cart(request)
+        cart.add(product, Decimal("10.00"), quantity=2)
+        cart.add(other, Decimal("4.50"))
+        cart.update(other, quantity=3)
+
+    with django_assert_num_queries(0):
+        again = Cart(visit(request))
+        assert again.count() == 5
+        assert again.summary() == Decimal("33.50")
+        assert product in again
+        assert again.etag() != "empty"
+
+    assert CartModel.objects.count() == 0
+    assert Item.objects.count() == 0
+
+
+def test_remove_and_clear_rewrite_the_cookie(signed_cookie, visit, product):
+    request = visit()
+    cart = Cart(request)
+    cart.add(product, Decimal("10.00"))
+    cart.remove(product)
+
+    assert Cart(visit(request)).is_empty()
+    with pytest.raises(ItemDoesNotExist):
+        Cart(visit(request)).remove(product)
+
+    cart.add(product, Decimal("10.00"))
+    cart.clear()
+    assert CART_DATA not in request._cart_session._cookies
+
+
+def test_tampered_cookie_reads_as_an_empty_cart(signed_cookie, visit, product):
+    request = visit()
+    Cart(request).add(product, Decimal("10.00"))
+    forged = visit()
+    forged.COOKIES[CART_DATA] = request._cart_session._cookies[CART_DATA] + "x"
+
+    assert Cart(forged).is_empty()
+
+
+def test_discount_code_travels_in_the_cookie(
+    signed_cookie, visit, product, discount_percent, django_assert_num_queries
+):
+    request = visit()
+    cart = Cart(request)
+    cart.add(product, Decimal("10.00"))
+    cart.apply_discount("PERCENT20")
+
+    with django_assert_num_queries(1):
+        again = Cart(visit(request))
+        assert again.discount_code() == "PERCENT20"
+        assert again.discount_amount() == Decimal("2.00")
+
+
+def test_outgrowing_the_cookie_promotes_to_a_row(
+    signed_cookie, visit, product, product_factory
+):
+    signed_cookie.CART_COOKIE_MAX_SIZE = 100
+    request = visit()
+    cart = Cart(request)
+    cart.add(product, Decimal("10.00"))
+    for n in range(10):
+        cart.add(product_factory(name=f"P{n}"), Decimal("1.00"))
+
+    row = CartModel.objects.get()
+    assert row.items.count() == 11
+    cookies = request._cart_session._cookies
+    assert CART_DATA not in cookies
+    assert cookies[CART_ID] == str(row.pk)
+    assert Cart(visit(request)).count() == 11
+
+
+def test_checkout_promotes_and_checks_out(signed_cookie, visit, product):
+    request = visit()
+    cart = Cart(request)
+    cart.add(product, Decimal("10.00"), quantity=2)
+
+    cart.checkout()
+
+    row = CartModel.objects.get()
+    assert row.checked_out
+    assert row.items.get().quantity == 2
+
+
+def test_bind_to_user_promotes(signed_cookie, visit, product, django_user_model):
+    user = django_user_model.objects.create_user(username="u", password="p")
+    request = visit()
+    cart = Cart(request)
+    cart.add(product, Decimal("10.00"))
+
+    cart.bind_to_user(user)
+
+    assert Cart.get_user_carts(user).get().items.count() == 1
+
+
+def test_response_carries_an_httponly_cart_cookie(signed_cookie, product):
+    client = Client()
+
+    response = client.post(f"/cart/add/{product.pk}/", {"quantity": 3})
+
+    morsel = response.cookies[CART_DATA]
+    assert morsel["httponly"]
+    assert CART_ID not in response.cookies
+
+
+def test_cart_page_costs_no_query_end_to_end(
+    signed_cookie, product, django_assert_num_queries
+):
+    client = Client()
+    client.post(f"/cart/add/{product.pk}/", {"quantity": 3})
+
+    with django_assert_num_queries(0):
+        response = client.get("/cart/")
+
+    assert json.loads(response.content)["count"] == 3
+
+
+def test_cart_etag_follows_the_cookie_cart_with_a_cart_cache(
+    signed_cookie, visit, product
+):
+    from cart.decorators import cart_etag
+
+    signed_cookie.CART_CACHE = "default"
+    request = visit()
+    Cart(request).add(product, Decimal("10.00"))
+    first = cart_etag(visit(request))
+    Cart(request).add(product, Decimal("10.00"))
+    second = cart_etag(visit(request))
+
+    assert first != "empty"
+    assert second != first
+    assert second == Cart(visit(request)).etag()
+
+
+def test_template_tags_read_the_cookie_cart(
+    signed_cookie, visit, product, django_assert_num_queries
+):
+    from django.template import Context, Template
+
+    request = visit()
+    Cart(request).add(product, Decimal("10.00"), quantity=2)
+    template = Template("{% load cart_tags %}{% cart_item_count %} {% cart_summary %}")
+
+    with django_assert_num_queries(0):
+        rendered = template.render(Context({"request": visit(request)}))
+
+    assert rendered == "2 $20.00"
+
+
+def test_async_cart_promotes_a_cookie_cart(signed_cookie, visit, product):
+    from asgiref.sync import async_to_sync
+
+    from cart.async_cart import AsyncCart
+
+    request = visit()
+    Cart(request).add(product, Decimal("10.00"), quantity=2)
+
+    async_cart = async_to_sync(AsyncCart.load)(visit(request))
+
+    assert async_cart.cart.pk is not None
+    assert async_to_sync(async_cart.acount)() == 2
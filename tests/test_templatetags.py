@@ -281,3 +281,92 @@ def test_cart_link_falls_back_to_slash_cart_when_reverse_raises(
     result = cart_link(context_with_request)
 
     assert 'href="/cart/"' in result
+
+
+# --------------------------------------------------------------------------- #
+# Request-scoped totals: the three totals tags share one load per request.
+# --------------------------------------------------------------------------- #
+
+from cart.cart import Cart  # noqa: E402
+
+
+def test_totals_tags_share_one_query_per_request(
+    cart, product, rf_request, django_assert_num_queries
+):
+    cart.add(product, unit_price=Decimal("2.50"), quantity=4)
+    tpl = Template(
+        "{% load cart_tags %}"
+        "{% cart_item_count %}|{% cart_summary %}|{% cart_is_empty %}|"
+        "{% cart_item_count %}|{% cart_summary %}|{% cart_is_empty %}"
+    )
+
+    with django_assert_num_queries(1):
+        result = tpl.render(Context({"request": rf_request}))
+
+    assert result == "4|$10.00|False|4|$10.00|False"
+
+
+def test_totals_tags_reuse_the_request_facade(
+    product, rf_request, django_assert_num_queries
+):
+    facade = Cart(rf_request)
+    facade.add(product, unit_price=Decimal("3.00"), quantity=2)
+    rf_request.cart = facade
+    facade.totals()
+    context = Context({"request": rf_request})
+
+    with django_assert_num_queries(0):
+        assert cart_item_count(context) == 2
+        assert cart_summary(context) == "$6.00"
+        assert cart_is_empty(context) is False
+
+
+def test_totals_tags_report_a_checked_out_facade_as_empty(product, rf_request):
+    facade = Cart(rf_request)
+    facade.add(product, unit_price=Decimal("3.00"))
+    facade.checkout()
+    rf_request.cart = facade
+
+    assert cart_item_count(Context({"request": rf_request})) == 0
+
+
+def test_totals_tags_read_the_cart_cache(
+    totals_cache, cart, product, rf, rf_request, django_assert_num_queries
+):
+    cart.add(product, unit_price=Decimal("2.50"), quantity=4)
+    tpl = Template("{% load cart_tags %}{% cart_item_count %}|{% cart_summary %}")
+
+    # Each render is a new request, so the per-request memo never helps.
+    for expected_queries in (1, 0, 0):
+        request = rf.get("/")
+        request.session = rf_request.session
+        with django_assert_num_queries(expected_queries):
+            assert tpl.render(Context({"request": request})) == "4|$10.00"
+
+    cart.add(product, unit_price=Decimal("2.50"))
+    request = rf.get("/")
+    request.session = rf_request.session
+
+    assert tpl.render(Context({"request": request})) == "5|$12.50"
+
+
+def test_totals_tags_find_a_cookie_adapter_cart(settings, product, rf):
+    settings.CART_SESSION_ADAPTER = "cart.session.CookieSessionAdapter"
+    first = rf.get("/")
+    Cart(first).add(product, unit_price=Decimal("2.50"), quantity=4)
+    request = rf.get("/")
+    request.COOKIES.update(first._cart_session._cookies)
+
+    assert cart_item_count(Context({"request": request})) == 4
+
+
+def test_totals_tags_honour_the_legacy_adapter_setting(settings, product, rf):
+    settings.CARTS_SESSION_ADAPTER_CLASS = "cart.session.SignedCookieCartAdapter"
+    first = rf.get("/")
+    with pytest.warns(DeprecationWarning):
+        Cart(first).add(product, unit_price=Decimal("2.50"), quantity=2)
+    request = rf.get("/")
+    request.COOKIES.update(first._cart_session._cookies)
+
+    with pytest.warns(DeprecationWarning):
+        assert cart_summary(Context({"request": request})) == "$5.00"